@@ -1,11 +1,31 @@
 """
 어그로 분석기
 제목에 키워드가 포함된 경우 등급별 가중치로 점수 부여
+(AGGRO_SCORER=model이고 학습된 모델 파일이 있으면 학습형 모델 점수 사용, score_model.py 참고)
 """
 
-from typing import List, Tuple
+import math
+import os
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
 
 from aggro_keywords import AGGRO_DICTIONARY
+from article import Article
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name) or default)
+    except ValueError:
+        print(f"[경고] {name} 값이 숫자가 아니어서 {default}을(를) 사용합니다: {os.getenv(name)}")
+        return default
+
+
+# 시간당 조회수(velocity) 가산 가중치: 점수 += 가중치 × log10(1 + 시간당 조회수)
+# 0이면 미사용 (유튜브 조회수 스냅샷 로그가 쌓인 뒤 AGGRO_VELOCITY_WEIGHT=0.5 등으로 선택적으로 사용)
+VELOCITY_WEIGHT = _env_float("AGGRO_VELOCITY_WEIGHT", 0.0)
+
+# 점수 방식: "tier"(등급 가중치, 기본) / "model"(학습형 모델, 모델 파일이 없으면 등급 가중치)
+SCORER = os.getenv("AGGRO_SCORER", "tier").strip().lower() or "tier"
 
 
 def calculate_aggro_score(title: str) -> Tuple[float, List[str]]:
@@ -38,21 +58,70 @@ def calculate_aggro_score(title: str) -> Tuple[float, List[str]]:
     return round(score, 2), matched_keywords
 
 
-def analyze_articles(articles: List[dict], title_key: str = "title") -> List[dict]:
+def _velocity_bonus(velocity, velocity_weight: float) -> float:
+    if not velocity_weight:
+        return 0.0
+    try:
+        velocity = float(velocity or 0)
+    except (TypeError, ValueError):
+        return 0.0
+    return velocity_weight * math.log10(1 + velocity) if velocity > 0 else 0.0
+
+
+def score_titles(
+    titles: Sequence[str],
+    velocities: Optional[Iterable] = None,
+    velocity_weight: float = VELOCITY_WEIGHT,
+    scorer: Optional[str] = None,
+) -> List[Tuple[float, List[str]]]:
+    """
+    제목 묶음 점수 + 시간당 조회수 가산 (analyze_articles와 재계산 명령이 함께 사용).
+    scorer="model"이면 학습형 모델로 묶음 전체를 한 번에 계산하고, 모델 파일이 없으면 등급 가중치 점수.
+    기여 키워드는 어느 방식이든 등급 사전 기준입니다.
+    """
+    titles = [t if isinstance(t, str) else "" for t in titles]
+    velocities = list(velocities) if velocities is not None else [0] * len(titles)
+    results = [calculate_aggro_score(t) for t in titles]
+    model = None
+    if (scorer or SCORER) == "model":
+        from score_model import get_model
+
+        model = get_model()
+    if model is not None and titles:
+        scores = model.score(titles, [matched for _, matched in results])
+        results = [(score, matched) for score, (_, matched) in zip(scores, results)]
+    out = []
+    for (score, matched), velocity in zip(results, velocities):
+        bonus = _velocity_bonus(velocity, velocity_weight)
+        out.append((round(score + bonus, 2) if bonus else score, matched))
+    return out
+
+
+def analyze_articles(
+    articles: List[Union[Article, dict]],
+    title_key: str = "title",
+    velocity_weight: float = VELOCITY_WEIGHT,
+) -> List[Union[Article, dict]]:
     """
     기사 리스트에 어그로 점수 및 기여 키워드 부여.
+    Article 레코드는 복사 없이 제자리에서 점수를 채우고, dict는 기존처럼 복사본에 추가합니다.
 
     Args:
-        articles: [{"title": str, "url": str, ...}, ...]
+        articles: [Article, ...] 또는 [{"title": str, "url": str, ...}, ...]
         title_key: 제목 필드명
+        velocity_weight: 시간당 조회수 가산 가중치 (0이면 키워드 점수만 사용)
 
     Returns:
         각 항목에 "score", "score_keywords" 추가된 리스트 (점수 높은 순 정렬)
     """
+    rows = [item if isinstance(item, Article) else dict(item) for item in articles]
+    scored = score_titles(
+        [row.get(title_key, "") for row in rows],
+        [row.get("velocity") for row in rows],
+        velocity_weight,
+    )
     result = []
-    for item in list(articles):
-        row = dict(item)
-        score, matched = calculate_aggro_score(row.get(title_key, ""))
+    for row, (score, matched) in zip(rows, scored):
         row["score"] = score
         row["score_keywords"] = ", ".join(matched) if matched else ""
         result.append(row)
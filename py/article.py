@@ -0,0 +1,151 @@
+"""
+수집 항목 레코드
+스크래퍼 → 어그로 분석기 → 리포터가 공유하는 슬롯 기반 레코드 (dict 복사·키 재매핑 제거)
+"""
+
+from typing import Any, Dict, Tuple
+
+
+class Article:
+    """
+    수집 항목 1건 (유튜브 영상 또는 뉴스 기사).
+
+    __slots__ 사용으로 항목당 메모리를 줄이고, 기존 dict 기반 코드와의 호환을 위해
+    item["title"], item.get("url") 형태의 접근도 지원합니다.
+    """
+
+    __slots__ = (
+        "title",
+        "url",
+        "source",
+        "section",
+        "upload_date",
+        "views",
+        "velocity",
+        "category",
+        "score",
+        "score_keywords",
+        "news2_url",
+        "news2_date",
+        "news3_url",
+        "news3_date",
+        "queries",
+    )
+
+    def __init__(
+        self,
+        title: str = "",
+        url: str = "",
+        source: str = "",
+        section: str = "",
+        upload_date: str = "",
+        views: Any = "",
+        velocity: Any = "",
+        category: str = "",
+        score: float = 0.0,
+        score_keywords: str = "",
+        news2_url: str = "",
+        news2_date: str = "",
+        news3_url: str = "",
+        news3_date: str = "",
+        queries: Tuple[str, ...] = (),
+    ) -> None:
+        self.title = title
+        self.url = url
+        self.source = source
+        self.section = section
+        self.upload_date = upload_date
+        self.views = views
+        self.velocity = velocity
+        self.category = category
+        self.score = score
+        self.score_keywords = score_keywords
+        self.news2_url = news2_url
+        self.news2_date = news2_date
+        self.news3_url = news3_url
+        self.news3_date = news3_date
+        # 이 항목을 찾은 검색 키워드 (OR 묶음 검색 후 제목과 일치하는 키워드만, 출력 컬럼 아님)
+        self.queries = queries
+
+    # ========== 출처별 URL ==========
+
+    @property
+    def is_youtube(self) -> bool:
+        return self.source == "유튜브"
+
+    @property
+    def youtube_url(self) -> str:
+        return self.url if self.is_youtube else ""
+
+    @property
+    def news_url(self) -> str:
+        return "" if self.is_youtube else self.url
+
+    # ========== dict 호환 ==========
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __repr__(self) -> str:
+        return f"Article(title={self.title!r}, source={self.source!r}, score={self.score!r})"
+
+    # ========== 출력(한글 컬럼) 변환 ==========
+
+    def to_record(self) -> Dict[str, Any]:
+        """출력 컬럼(한글) 기준 dict로 변환. 리포터에서 1회만 호출."""
+        return {
+            "제목": self.title,
+            "추천점수": self.score,
+            "키워드": self.score_keywords,
+            "카테고리": self.category,
+            "출처": self.source,
+            "유튜브_URL": self.youtube_url,
+            "뉴스기사_URL": self.news_url,
+            "업로드일": self.upload_date,
+            "뉴스기사2_URL": self.news2_url,
+            "뉴스기사2_날짜": self.news2_date,
+            "뉴스기사3_URL": self.news3_url,
+            "뉴스기사3_날짜": self.news3_date,
+            "조회수": self.views,
+            "시간당조회수": self.velocity,
+        }
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "Article":
+        """출력 컬럼(한글) dict(기존 data.js 항목 등)에서 레코드 복원."""
+
+        def _s(key: str) -> str:
+            value = record.get(key, "")
+            return "" if value is None else value
+
+        url = _s("유튜브_URL") or _s("뉴스기사_URL")
+        try:
+            score = float(record.get("추천점수", 0) or 0)
+        except (TypeError, ValueError):
+            score = 0.0
+        return cls(
+            title=_s("제목"),
+            url=url,
+            source=_s("출처"),
+            upload_date=_s("업로드일"),
+            views=_s("조회수"),
+            velocity=_s("시간당조회수"),
+            category=_s("카테고리"),
+            score=score,
+            score_keywords=_s("키워드"),
+            news2_url=_s("뉴스기사2_URL"),
+            news2_date=_s("뉴스기사2_날짜"),
+            news3_url=_s("뉴스기사3_URL"),
+            news3_date=_s("뉴스기사3_날짜"),
+        )
@@ -0,0 +1,161 @@
+"""
+출처별 차단기 (circuit breaker)
+키 누락·인증 실패·할당량 초과처럼 다시 시도해도 소용없는 오류는 즉시,
+일시적 오류(타임아웃·5xx 등)는 연속 TRANSIENT_THRESHOLD회에서 차단하여
+같은 실행 안에서 남은 호출을 건너뜁니다.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional
+
+import requests
+
+FATAL = "fatal"
+TRANSIENT = "transient"
+
+# 연속 일시 오류가 이 횟수에 도달하면 차단
+TRANSIENT_THRESHOLD = 3
+
+# 재시도해도 소용없는 HTTP 상태 (인증 실패, 권한/할당량, 재시도 후에도 남은 429)
+FATAL_STATUS = {401, 403, 429}
+
+
+class FatalSourceError(RuntimeError):
+    """재시도해도 소용없는 오류 (API 키 누락 등)."""
+
+
+class SourceUnavailable(RuntimeError):
+    """차단된 출처 호출 시 발생."""
+
+    def __init__(self, source: str, reason: str) -> None:
+        super().__init__(f"{source} 차단됨: {reason}")
+        self.source = source
+        self.reason = reason
+
+
+def classify_error(exc: BaseException) -> str:
+    """오류를 FATAL / TRANSIENT로 분류."""
+    if isinstance(exc, FatalSourceError):
+        return FATAL
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        return FATAL if exc.response.status_code in FATAL_STATUS else TRANSIENT
+    return TRANSIENT
+
+
+def _describe(exc: BaseException) -> str:
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        status = exc.response.status_code
+        if status == 429:
+            return "요청 한도 초과 (HTTP 429)"
+        if status in (401, 403):
+            return f"인증/할당량 오류 (HTTP {status})"
+        return f"HTTP {status}"
+    if isinstance(exc, requests.Timeout):
+        return "시간 초과"
+    if isinstance(exc, requests.ConnectionError):
+        return "연결 실패"
+    return str(exc) or type(exc).__name__
+
+
+class CircuitBreaker:
+    """출처 1개의 차단기. 한 번 열리면 reset() 전까지 계속 차단."""
+
+    def __init__(self, source: str, threshold: int = TRANSIENT_THRESHOLD) -> None:
+        self.source = source
+        self.threshold = threshold
+        self.state = "closed"
+        self.kind = ""
+        self.reason = ""
+        self.failures = 0
+        self.skipped = 0
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == "open"
+
+    def allow(self) -> bool:
+        """호출 가능 여부 (차단 중이면 건너뜀 횟수 증가)."""
+        with self._lock:
+            if self.state == "open":
+                self.skipped += 1
+                return False
+            return True
+
+    def check(self) -> None:
+        """차단 중이면 SourceUnavailable 발생."""
+        if not self.allow():
+            raise SourceUnavailable(self.source, self.reason)
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state == "closed":
+                self.failures = 0
+
+    def record_failure(self, exc: BaseException) -> str:
+        """
+        오류 1건 반영.
+
+        Returns:
+            오류 분류 (FATAL / TRANSIENT)
+        """
+        kind = classify_error(exc)
+        with self._lock:
+            self.failures += 1
+            if self.state == "closed" and (kind == FATAL or self.failures >= self.threshold):
+                self.state = "open"
+                self.kind = kind
+                self.reason = _describe(exc)
+                print(f"    [차단] {self.source}: {self.reason} → 이번 실행에서 남은 호출 건너뜀")
+        return kind
+
+    def call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """차단 확인 → 호출 → 결과 반영. 오류는 그대로 다시 발생."""
+        self.check()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            self.record_failure(e)
+            raise
+        self.record_success()
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self.state,
+                "kind": self.kind,
+                "reason": self.reason,
+                "failures": self.failures,
+                "skipped": self.skipped,
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(source: str) -> CircuitBreaker:
+    """출처 이름별 차단기 (없으면 생성)."""
+    with _breakers_lock:
+        breaker = _breakers.get(source)
+        if breaker is None:
+            breaker = _breakers[source] = CircuitBreaker(source)
+        return breaker
+
+
+def reset_all() -> None:
+    """모든 차단기 초기화 (실행 시작 시)."""
+    with _breakers_lock:
+        _breakers.clear()
+
+
+def open_breakers(prefix: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """열린(차단된) 차단기 상태. prefix를 주면 해당 출처만 ("google" → google.rss, google.newsapi)."""
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {
+        name: b.snapshot()
+        for name, b in sorted(breakers.items())
+        if b.is_open and (prefix is None or name == prefix or name.startswith(prefix + "."))
+    }
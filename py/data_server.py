@@ -0,0 +1,400 @@
+"""
+수집 데이터 조회 API 서버 (표준 라이브러리 http.server)
+index.html이 data.js 전체를 받지 않고, 보는 카테고리·기간의 행만 JSON으로 받아 가도록 합니다.
+정적 배포용 data.js 내보내기는 그대로 유지됩니다.
+
+- GET /api/items       ?category=정치&source=유튜브&from=2026-02-01&to=2026-02-08&top=100&page=1&per_page=50
+                       (추천점수 내림차순, 업로드일 없는 행은 기간 조건과 관계없이 포함 — 웹 UI와 동일)
+- GET /api/categories  카테고리·출처별 행 수
+- GET /api/status      수집기 상태(scraperStatus)와 데이터 갱신 시각
+- GET /, /index.html, /style.css, /data.js  정적 파일 (index.html은 data.js 대신 API를 쓰도록 바꿔서 제공)
+
+- data.js가 바뀌면(수정 시각·크기) 다음 요청에서 다시 읽고 응답 캐시를 비움
+- 자주 요청되는 응답은 LRU 캐시에 본문·gzip 본문·ETag를 함께 보관
+- ETag / If-None-Match → 304, Accept-Encoding: gzip이면 gzip 전송
+
+사용법:
+    python py/data_server.py                  # http://127.0.0.1:8000
+    python py/data_server.py --host 0.0.0.0 --port 8080 --data data.js
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import math
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "py"))
+
+from web_data import default_data_path, parse_web_data
+
+DEFAULT_PER_PAGE = 50
+MAX_PER_PAGE = 500
+CACHE_ENTRIES = 256  # 응답 캐시 최대 개수
+GZIP_MIN_BYTES = 1024  # 이보다 작은 응답은 압축하지 않음
+RELOAD_CHECK_S = 2.0  # data.js 변경 확인 간격
+
+# 제공할 정적 파일 (프로젝트 루트 기준, 그 외 경로는 404)
+STATIC_FILES = {
+    "/": ("index.html", "text/html; charset=utf-8"),
+    "/index.html": ("index.html", "text/html; charset=utf-8"),
+    "/style.css": ("style.css", "text/css; charset=utf-8"),
+    "/data.js": ("data.js", "application/javascript; charset=utf-8"),
+}
+
+# 서버 모드 index.html: data.js 전체 로드 대신 API 주소만 알려 줌
+_DATA_SCRIPT_RE = re.compile(r'<script src="data\.js[^"]*"></script>')
+_API_SCRIPT = '<script>window.DATA_API = "api";</script>'
+
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+class BadRequest(ValueError):
+    """잘못된 조회 조건 (400 응답)."""
+
+
+# ========== 데이터 ==========
+
+
+def _clean(value: Any) -> Any:
+    """NaN은 JSON에 쓸 수 없으므로 None으로."""
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+def _score(row: Dict[str, Any]) -> float:
+    try:
+        return float(row.get("추천점수") or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class DataStore:
+    """data.js 행 보관 (파일이 바뀌면 다시 읽음)."""
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path or default_data_path()
+        self.rows: List[Dict[str, Any]] = []
+        self.status: Dict[str, Any] = {}
+        self.version = ""
+        self.updated = 0
+        self._checked = float("-inf")
+        self._failed = ""
+        self._lock = threading.Lock()
+
+
+    def refresh(self) -> bool:
+        """
+        data.js가 바뀌었으면 다시 읽음. 다시 읽었으면 True.
+        파일이 없거나 읽을 수 없으면(쓰는 도중 등) 경고만 출력하고 마지막으로 읽은 행을 계속 제공합니다.
+        """
+        now = time.monotonic()
+        if now - self._checked < RELOAD_CHECK_S:
+            return False
+        with self._lock:
+            self._checked = now
+            try:
+                st = os.stat(self.path)
+            except OSError:
+                return False
+            stamp = f"{st.st_mtime_ns:x}-{st.st_size:x}"
+            if stamp in (self.version, self._failed):
+                return False
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    rows, status = parse_web_data(f.read())
+            except (OSError, ValueError) as e:
+                # 같은 파일에 대해 경고를 반복하지 않도록 기록 (파일이 다시 바뀌면 재시도)
+                self._failed = stamp
+                print(f"[경고] 데이터 다시 읽기 실패, 이전 데이터 유지: {e}")
+                return False
+            rows = [{k: _clean(v) for k, v in row.items()} for row in rows]
+            # 추천점수 내림차순으로 한 번만 정렬 (같은 점수는 원래 순서 유지)
+            rows.sort(key=_score, reverse=True)
+            self.rows, self.status, self.version = rows, status, stamp
+            self.updated = int(st.st_mtime)
+            print(f"[서버] 데이터 로드: {len(rows)}행 ({self.path})")
+            return True
+
+    def query(self, params: Dict[str, str]) -> Dict[str, Any]:
+        """조회 조건에 맞는 행 (추천점수 내림차순, 페이지 단위)."""
+        category = params.get("category")
+        source = params.get("source")
+        start, end = params.get("from"), params.get("to")
+        for value in (start, end):
+            if value and not _DATE_RE.match(value):
+                raise BadRequest(f"날짜 형식은 YYYY-MM-DD: {value}")
+        top = _int_param(params, "top", 0, 0, None)
+        page = _int_param(params, "page", 1, 1, None)
+        per_page = _int_param(params, "per_page", DEFAULT_PER_PAGE, 1, MAX_PER_PAGE)
+
+        matched = []
+        for row in self.rows:
+            if category and row.get("카테고리") != category:
+                continue
+            if source and source not in (row.get("출처") or ""):
+                continue
+            day = str(row.get("업로드일") or "")[:10]
+            if day and ((start and day < start) or (end and day > end)):
+                continue
+            matched.append(row)
+            if top and len(matched) >= top:
+                break
+        offset = (page - 1) * per_page
+        return {
+            "total": len(matched),
+            "page": page,
+            "per_page": per_page,
+            "updated": self.updated,
+            "items": matched[offset:offset + per_page],
+        }
+
+    def categories(self) -> Dict[str, Any]:
+        return {
+            "updated": self.updated,
+            "categories": dict(Counter(row.get("카테고리") or "기타" for row in self.rows)),
+            "sources": dict(Counter(row.get("출처") or "기타" for row in self.rows)),
+        }
+
+    def status_info(self) -> Dict[str, Any]:
+        return {
+            "updated": self.updated,
+            "rows": len(self.rows),
+            "scraperStatus": self.status,
+        }
+
+
+def _int_param(params: Dict[str, str], name: str, default: int, low: int, high: Optional[int]) -> int:
+    value = params.get(name)
+    if value in (None, ""):
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise BadRequest(f"{name}은(는) 정수여야 합니다: {value}") from None
+    if number < low:
+        raise BadRequest(f"{name}은(는) {low} 이상이어야 합니다: {value}")
+    return min(number, high) if high else number
+
+
+# ========== 응답 캐시 ==========
+
+
+class CachedResponse:
+    """본문·ETag와 (필요할 때 만든) gzip 본문."""
+
+    __slots__ = ("body", "content_type", "etag", "_gzipped")
+
+    def __init__(self, body: bytes, content_type: str) -> None:
+        self.body = body
+        self.content_type = content_type
+        self.etag = '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+        self._gzipped: Optional[bytes] = None
+
+    def gzipped(self) -> bytes:
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.body, compresslevel=6, mtime=0)
+        return self._gzipped
+
+
+class ResponseCache:
+    """LRU 응답 캐시 (스레드 안전)."""
+
+    def __init__(self, max_entries: int = CACHE_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: Tuple, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# ========== HTTP ==========
+
+
+class DataRequestHandler(BaseHTTPRequestHandler):
+    server_version = "AggroData/1.0"
+    store: DataStore
+    cache: ResponseCache
+
+    def do_GET(self) -> None:
+        self._handle(send_body=True)
+
+    def do_HEAD(self) -> None:
+        self._handle(send_body=False)
+
+    def _handle(self, send_body: bool) -> None:
+        """요청 처리. 예상하지 못한 오류는 500 응답 (응답 없이 연결이 끊기지 않도록)."""
+        try:
+            self._respond(send_body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # 클라이언트가 먼저 연결을 끊음
+        except Exception as e:
+            self.log_error("요청 처리 오류 (%s): %r", self.path, e)
+            try:
+                self._send_json_error(HTTPStatus.INTERNAL_SERVER_ERROR, "서버 오류", send_body)
+            except OSError:
+                pass
+
+    def _respond(self, send_body: bool) -> None:
+        parts = urlsplit(self.path)
+        if self.store.refresh():
+            self.cache.clear()
+        try:
+            if parts.path.startswith("/api/"):
+                entry = self._api(parts.path, parts.query)
+            elif parts.path in STATIC_FILES:
+                entry = self._static(parts.path)
+            else:
+                entry = None
+        except BadRequest as e:
+            self._send_json_error(HTTPStatus.BAD_REQUEST, str(e), send_body)
+            return
+        if entry is None:
+            self._send_json_error(HTTPStatus.NOT_FOUND, f"없는 경로: {parts.path}", send_body)
+            return
+        self._send(entry, send_body)
+
+    def _api(self, path: str, query: str) -> Optional[CachedResponse]:
+        params = dict(parse_qsl(query))
+        key = (self.store.version, path, tuple(sorted(params.items())))
+        entry = self.cache.get(key)
+        if entry is not None:
+            return entry
+        if path == "/api/items":
+            payload = self.store.query(params)
+        elif path == "/api/categories":
+            payload = self.store.categories()
+        elif path == "/api/status":
+            payload = self.store.status_info()
+        else:
+            return None
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        entry = CachedResponse(body, "application/json; charset=utf-8")
+        self.cache.put(key, entry)
+        return entry
+
+    def _static(self, path: str) -> Optional[CachedResponse]:
+        name, content_type = STATIC_FILES[path]
+        file_path = os.path.join(ROOT_DIR, name)
+        try:
+            stamp = os.stat(file_path).st_mtime_ns
+        except OSError:
+            return None
+        key = ("static", name, stamp)
+        entry = self.cache.get(key)
+        if entry is not None:
+            return entry
+        with open(file_path, "rb") as f:
+            body = f.read()
+        if name == "index.html":
+            body = _DATA_SCRIPT_RE.sub(_API_SCRIPT, body.decode("utf-8"), count=1).encode("utf-8")
+        entry = CachedResponse(body, content_type)
+        self.cache.put(key, entry)
+        return entry
+
+    def _send(self, entry: CachedResponse, send_body: bool) -> None:
+        if entry.etag in _etags(self.headers.get("If-None-Match")):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", entry.etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return
+        body = entry.body
+        use_gzip = len(body) >= GZIP_MIN_BYTES and "gzip" in (self.headers.get("Accept-Encoding") or "")
+        if use_gzip:
+            body = entry.gzipped()
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", entry.content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", entry.etag)
+        # 매번 ETag로 재검증 (데이터가 그대로면 304)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def _send_json_error(self, status: HTTPStatus, message: str, send_body: bool) -> None:
+        body = json.dumps({"error": message}, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # 정상 응답은 조용히, 오류만 출력
+        if args and str(args[1]).startswith(("4", "5")):
+            super().log_message(format, *args)
+
+
+def _etags(header: Optional[str]) -> List[str]:
+    """If-None-Match 값 → ETag 목록 (약한 ETag 표시 W/는 무시)."""
+    if not header:
+        return []
+    return [tag.strip().removeprefix("W/") for tag in header.split(",")]
+
+
+def make_server(host: str = "127.0.0.1", port: int = 8000, data_path: Optional[str] = None) -> ThreadingHTTPServer:
+    """조회 서버 생성 (serve_forever()로 실행)."""
+    store = DataStore(data_path)
+    store.refresh()
+    handler = type("Handler", (DataRequestHandler,), {"store": store, "cache": ResponseCache()})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="수집 데이터 조회 API 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드 주소 (기본: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="포트 (기본: 8000)")
+    parser.add_argument("--data", default=None, help="데이터 파일 (기본: 프로젝트 루트 data.js)")
+    args = parser.parse_args()
+    server = make_server(args.host, args.port, args.data)
+    print(f"[서버] http://{args.host}:{args.port}/ (종료: Ctrl+C)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
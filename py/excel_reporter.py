@@ -3,15 +3,37 @@
 추천 점수 순 1~30위를 엑셀 파일로 출력합니다.
 """
 
+import glob
 import os
 import re
 import json
+import uuid
+import hashlib
+import tempfile
+import zipfile
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from email.utils import parsedate_to_datetime
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 import pandas as pd
 
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+from article import Article
+from ranking_index import RankingIndex
+
 
 def _normalize_date(value) -> str:
     """업로드일을 YYYY-MM-DD 형식으로 정규화."""
@@ -23,7 +45,8 @@ def _normalize_date(value) -> str:
     if re.match(r"^\d{4}-\d{2}-\d{2}$", s):
         return s
     try:
-        if "T" in s:
+        # "T" 포함 여부만 보면 Tue/Thu 요일이 들어간 RFC 2822 날짜가 ISO로 오인됨
+        if re.match(r"^\d{4}-\d{2}-\d{2}T", s):
             dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
         elif re.match(r"^\d{4}-\d{2}-\d{2}", s):
             dt = datetime.strptime(s[:10], "%Y-%m-%d")
@@ -34,6 +57,64 @@ def _normalize_date(value) -> str:
         return ""
 
 
+# 반복되는 원본 값은 한 번만 파싱 (폴백 경로용)
+_normalize_date_cached = lru_cache(maxsize=8192)(_normalize_date)
+
+# 수집 소스별 알려진 날짜 형식: (날짜 부분 추출 정규식, 고정 파싱 형식)
+DATE_PATTERNS = [
+    # 유튜브 publishedAt, NewsAPI publishedAt (ISO 8601)
+    (r"^(\d{4}-\d{2}-\d{2})T\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?(?:Z|[+-]\d{2}:\d{2})?$", "%Y-%m-%d"),
+    # 네이버 검색 API pubDate (RFC 2822)
+    (r"^[A-Za-z]{3}, (\d{1,2} [A-Za-z]{3} \d{4}) \d{2}:\d{2}(?::\d{2})? (?:[+-]\d{4}|GMT|UTC?)$", "%d %b %Y"),
+]
+
+
+def _detect_date_pattern(text: pd.Series):
+    """컬럼에서 가장 많이 맞는 날짜 형식 감지 (없으면 None)."""
+    best, best_count = None, 0
+    for pattern in DATE_PATTERNS:
+        count = int(text.str.match(pattern[0]).sum())
+        if count > best_count:
+            best, best_count = pattern, count
+    return best
+
+
+def _normalize_date_column(values: pd.Series) -> pd.Series:
+    """
+    컬럼 단위 날짜 정규화 (_normalize_date와 같은 결과).
+    중복 값은 한 번만 처리하고, 컬럼별로 감지한 형식을 고정 형식으로 일괄 파싱한 뒤
+    실패한 값만 기존 _normalize_date 로직(캐시)으로 처리합니다.
+    """
+    if values.empty:
+        return values.astype(object)
+
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    text = pd.Series(uniques, dtype=object).astype(str).str.strip()
+    normalized = pd.Series([None] * len(text), dtype=object)
+
+    # 1. 이미 YYYY-MM-DD인 값은 그대로
+    exact = text.str.fullmatch(r"\d{4}-\d{2}-\d{2}")
+    normalized[exact] = text[exact]
+
+    # 2. 감지된 형식으로 일괄 파싱
+    pattern = _detect_date_pattern(text[~exact])
+    if pattern is not None:
+        regex, fmt = pattern
+        pending = normalized.isna()
+        parsed = pd.to_datetime(text[pending].str.extract(regex, expand=False), format=fmt, errors="coerce")
+        ok = parsed.notna()
+        normalized[ok[ok].index] = parsed[ok].dt.strftime("%Y-%m-%d")
+
+    # 3. 나머지는 기존 로직으로
+    rest = normalized.isna()
+    if rest.any():
+        normalized[rest] = text[rest].map(_normalize_date_cached)
+
+    result = normalized.to_numpy()[codes]
+    result[codes == -1] = ""
+    return pd.Series(result, index=values.index, dtype=object)
+
+
 # 출력 컬럼 순서 (순위는 정렬 후 추가)
 OUTPUT_COLUMNS_BASE = [
     "제목",
@@ -49,6 +130,7 @@ OUTPUT_COLUMNS_BASE = [
     "뉴스기사3_URL",
     "뉴스기사3_날짜",
     "조회수",
+    "시간당조회수",
 ]
 OUTPUT_COLUMNS = ["순위"] + OUTPUT_COLUMNS_BASE
 
@@ -68,10 +150,21 @@ COLUMN_WIDTHS = {
     "뉴스기사3_URL": 50,
     "뉴스기사3_날짜": 14,
     "조회수": 14,
+    "시간당조회수": 14,
 }
 
 TOP_N = 30
 
+# 엑셀 시트 이름 / 하이퍼링크 적용 컬럼
+SHEET_NAME = "어그로추천주제"
+URL_COLUMNS = ["유튜브_URL", "뉴스기사_URL", "뉴스기사2_URL", "뉴스기사3_URL"]
+
+# 이 행 수 이상이면 스트리밍 모드로 저장 (전체 히스토리 리포트 등)
+STREAMING_MIN_ROWS = 1000
+
+# 엑셀 워크시트당 하이퍼링크 최대 개수 (초과분은 링크 없이 같은 스타일의 텍스트로 기록)
+EXCEL_MAX_HYPERLINKS = 65530
+
 
 def _ensure_columns(df: pd.DataFrame) -> pd.DataFrame:
     """필수 컬럼이 없으면 추가 (빈 값으로)."""
@@ -97,6 +190,11 @@ def _ensure_columns(df: pd.DataFrame) -> pd.DataFrame:
     return out[OUTPUT_COLUMNS_BASE]
 
 
+def articles_to_frame(articles: Iterable[Article]) -> pd.DataFrame:
+    """Article 레코드 목록을 출력 컬럼(한글) DataFrame으로 변환 (유일한 매핑 단계)."""
+    return pd.DataFrame([a.to_record() for a in articles], columns=OUTPUT_COLUMNS_BASE)
+
+
 def _set_column_widths(worksheet) -> None:
     """엑셀 컬럼 너비 설정."""
     try:
@@ -141,15 +239,24 @@ def _set_center_alignment_columns(worksheet, num_data_rows: int) -> None:
         print(f"[경고] 가운데 정렬 설정 중 오류: {e}")
 
 
-def _apply_hyperlink_style(cell, url: str) -> None:
+def _link_font():
+    """하이퍼링크용 파란색 밑줄 폰트 (셀마다 새로 만들지 않고 공유)."""
+    from openpyxl.styles import Font
+
+    return Font(color="0563C1", underline="single")
+
+
+def _is_link(url) -> bool:
+    return isinstance(url, str) and url.strip().startswith("http")
+
+
+def _apply_hyperlink_style(cell, url: str, font=None) -> None:
     """셀에 하이퍼링크 및 파란색 밑줄 스타일 적용."""
-    if not url or not isinstance(url, str) or not url.strip().startswith("http"):
+    if not url or not _is_link(url):
         return
     try:
-        from openpyxl.styles import Font
-
         cell.hyperlink = url.strip()
-        cell.font = Font(color="0563C1", underline="single")
+        cell.font = font if font is not None else _link_font()
     except Exception:
         pass
 
@@ -157,25 +264,411 @@ def _apply_hyperlink_style(cell, url: str) -> None:
 def _apply_hyperlinks(worksheet, df: pd.DataFrame) -> None:
     """유튜브_URL, 뉴스기사_URL(1~3) 컬럼에 하이퍼링크 적용."""
     try:
-        url_columns = ["유튜브_URL", "뉴스기사_URL", "뉴스기사2_URL", "뉴스기사3_URL"]
-        for row_idx, row in df.iterrows():
-            excel_row = row_idx + 2  # 헤더 1행 + 0-based
-            for col_name in url_columns:
-                if col_name not in OUTPUT_COLUMNS:
-                    continue
-                url = row.get(col_name, "") or ""
-                if url and str(url).strip().startswith("http"):
-                    col_idx = OUTPUT_COLUMNS.index(col_name) + 1
-                    _apply_hyperlink_style(worksheet.cell(row=excel_row, column=col_idx), str(url))
+        font = _link_font()
+        for col_name in URL_COLUMNS:
+            if col_name not in OUTPUT_COLUMNS or col_name not in df.columns:
+                continue
+            col_idx = OUTPUT_COLUMNS.index(col_name) + 1
+            for row_offset, url in enumerate(df[col_name].tolist()):
+                if url and _is_link(str(url)):
+                    excel_row = row_offset + 2  # 헤더 1행 + 0-based
+                    _apply_hyperlink_style(worksheet.cell(row=excel_row, column=col_idx), str(url), font)
     except Exception as e:
         print(f"[경고] 하이퍼링크 적용 중 오류: {e}")
 
 
+def _cell_value(value):
+    """엑셀 셀 값 정리 (빈 문자열·NaN → 빈 셀)."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, float) and pd.isna(value):
+        return None
+    return value
+
+
+def _iter_rows(out: pd.DataFrame):
+    """출력 컬럼 순서의 행 값(파이썬 기본 타입)을 순회."""
+    return iter(out[OUTPUT_COLUMNS].astype(object).values.tolist())
+
+
+# ========== 내용 해시·원자적 저장 ==========
+
+# 엑셀 파일에 저장하는 내용 해시 속성 이름 (사용자 지정 문서 속성)
+CONTENT_DIGEST_PROPERTY = "aggro_content_digest"
+
+
+def _text_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _file_digest(path: str) -> str:
+    """파일 내용 해시 (없으면 "")."""
+    try:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                h.update(chunk)
+        return h.hexdigest()
+    except OSError:
+        return ""
+
+
+def _frame_digest(out: pd.DataFrame) -> str:
+    """준비된 순위 DataFrame의 내용 해시 (같은 데이터면 항상 같은 값)."""
+    payload = out.to_json(orient="split", index=False, force_ascii=False, date_format="iso")
+    return _text_digest(payload.encode("utf-8"))
+
+
+def _xlsx_digest(path: str) -> str:
+    """엑셀 파일에 기록된 내용 해시 (없거나 읽을 수 없으면 "")."""
+    try:
+        with zipfile.ZipFile(path) as zf:
+            xml = zf.read("docProps/custom.xml").decode("utf-8")
+    except (OSError, KeyError, zipfile.BadZipFile):
+        return ""
+    match = re.search(
+        rf'name="{CONTENT_DIGEST_PROPERTY}"[^>]*>\s*<vt:lpwstr>([0-9a-f]+)</vt:lpwstr>', xml)
+    return match.group(1) if match else ""
+
+
+def _set_digest_property(wb, digest: str) -> None:
+    """openpyxl 통합 문서에 내용 해시 속성 기록."""
+    if not digest:
+        return
+    from openpyxl.packaging.custom import StringProperty
+
+    wb.custom_doc_props.append(StringProperty(name=CONTENT_DIGEST_PROPERTY, value=digest))
+
+
+@contextmanager
+def _atomic_output(output_path: str):
+    """
+    같은 폴더의 임시 파일 경로를 넘겨주고, 저장이 끝나면 원자적으로 교체.
+    저장 도중 실패하면 임시 파일만 삭제되고 기존 파일은 그대로 남습니다.
+    """
+    directory, name = os.path.split(output_path)
+    stem, ext = os.path.splitext(name)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{stem}.", suffix=f".tmp{ext}", dir=directory or ".")
+    os.close(fd)
+    # mkstemp는 0600으로 만들므로 기존 파일 권한(없으면 0644)을 따름
+    try:
+        os.chmod(tmp_path, os.stat(output_path).st_mode & 0o777 if os.path.exists(output_path) else 0o644)
+    except OSError:
+        pass
+    try:
+        yield tmp_path
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _write_text_if_changed(output_path: str, text: str) -> bool:
+    """
+    내용이 디스크의 파일과 다를 때만 원자적으로 저장.
+
+    Returns:
+        실제로 저장했으면 True, 같은 내용이라 건너뛰었으면 False
+    """
+    data = text.encode("utf-8")
+    if os.path.exists(output_path) and os.path.getsize(output_path) == len(data):
+        if _file_digest(output_path) == _text_digest(data):
+            return False
+    with _atomic_output(output_path) as tmp_path:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+    return True
+
+
+def _write_excel_streaming(out: pd.DataFrame, output_path: str, digest: str = "") -> None:
+    """
+    대용량 히스토리용 스트리밍 엑셀 저장 (메모리 일정).
+    행을 내보내는 즉시 공유 스타일(가운데 정렬·링크 폰트)과 하이퍼링크를 함께 기록하므로
+    일반 모드(_set_column_widths + 정렬 + _apply_hyperlinks)와 같은 모양으로 출력됩니다.
+    xlsxwriter가 설치되어 있으면 constant_memory 모드를, 없으면 openpyxl write-only 모드를 사용합니다.
+    """
+    if xlsxwriter is not None:
+        _write_excel_xlsxwriter(out, output_path, digest)
+    else:
+        _write_excel_write_only(out, output_path, digest)
+
+
+def _write_excel_xlsxwriter(out: pd.DataFrame, output_path: str, digest: str = "") -> None:
+    """xlsxwriter constant_memory 모드로 엑셀 저장."""
+    wb = xlsxwriter.Workbook(output_path, {"constant_memory": True})
+    try:
+        if digest:
+            wb.set_custom_property(CONTENT_DIGEST_PROPERTY, digest)
+        ws = wb.add_worksheet(SHEET_NAME)
+        center = wb.add_format({"align": "center", "valign": "vcenter"})
+        link = wb.add_format({"font_color": "#0563C1", "underline": 1})
+
+        for idx, col_name in enumerate(OUTPUT_COLUMNS):
+            ws.set_column(idx, idx, COLUMN_WIDTHS.get(col_name, 15))
+        ws.write_row(0, 0, OUTPUT_COLUMNS, center)
+
+        center_idx = {i for i, c in enumerate(OUTPUT_COLUMNS) if c in CENTER_ALIGN_COLUMNS}
+        url_idx = {i for i, c in enumerate(OUTPUT_COLUMNS) if c in URL_COLUMNS}
+        link_count = 0
+
+        for row_idx, values in enumerate(_iter_rows(out), start=1):
+            for i, value in enumerate(values):
+                value = _cell_value(value)
+                fmt = center if i in center_idx else None
+                if value is None:
+                    if fmt is not None:
+                        ws.write_blank(row_idx, i, None, fmt)
+                elif i in url_idx and _is_link(value):
+                    if link_count < EXCEL_MAX_HYPERLINKS:
+                        ws.write_url(row_idx, i, value.strip(), link, value)
+                        link_count += 1
+                    else:
+                        ws.write_string(row_idx, i, value, link)
+                elif isinstance(value, str):
+                    # write()의 타입 추론(수식·URL 검사)을 건너뛰고 바로 기록
+                    ws.write_string(row_idx, i, value, fmt)
+                elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                    ws.write_number(row_idx, i, value, fmt)
+                else:
+                    ws.write(row_idx, i, value, fmt)
+    finally:
+        wb.close()
+
+
+def _write_excel_write_only(out: pd.DataFrame, output_path: str, digest: str = "") -> None:
+    """openpyxl write-only 모드로 엑셀 저장 (xlsxwriter 미설치 시)."""
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment
+    from openpyxl.utils import get_column_letter
+
+    wb = Workbook(write_only=True)
+    _set_digest_property(wb, digest)
+    ws = wb.create_sheet(SHEET_NAME)
+
+    # 컬럼 너비는 행을 쓰기 전에 지정해야 함
+    for idx, col_name in enumerate(OUTPUT_COLUMNS, start=1):
+        ws.column_dimensions[get_column_letter(idx)].width = COLUMN_WIDTHS.get(col_name, 15)
+
+    center = Alignment(horizontal="center", vertical="center")
+    link_font = _link_font()
+
+    header = []
+    for col_name in OUTPUT_COLUMNS:
+        cell = WriteOnlyCell(ws, value=col_name)
+        cell.alignment = center
+        header.append(cell)
+    ws.append(header)
+
+    center_idx = {i for i, c in enumerate(OUTPUT_COLUMNS) if c in CENTER_ALIGN_COLUMNS}
+    url_idx = {i for i, c in enumerate(OUTPUT_COLUMNS) if c in URL_COLUMNS}
+    link_count = 0
+
+    for values in _iter_rows(out):
+        row = []
+        for i, value in enumerate(values):
+            value = _cell_value(value)
+            if i in center_idx:
+                cell = WriteOnlyCell(ws, value=value)
+                cell.alignment = center
+                row.append(cell)
+            elif i in url_idx and _is_link(value):
+                cell = WriteOnlyCell(ws, value=value)
+                if link_count < EXCEL_MAX_HYPERLINKS:
+                    cell.hyperlink = value.strip()
+                    link_count += 1
+                cell.font = link_font
+                row.append(cell)
+            else:
+                row.append(value)
+        ws.append(row)
+
+    wb.save(output_path)
+
+
+def _prepare_ranked(
+    df: pd.DataFrame,
+    score_column: str = "추천점수",
+    ascending: bool = False,
+    top_n: Optional[int] = TOP_N,
+    per_category: bool = False,
+) -> pd.DataFrame:
+    """
+    출력용 순위 DataFrame 준비 (모든 출력 형식 공통).
+    컬럼 정규화 → 추천점수 숫자 변환·정렬 → 상위 top_n → 순위 삽입 → 날짜 정규화.
+    per_category=True면 전체 상위 top_n 대신 카테고리별 상위 top_n을 남깁니다.
+    """
+    # 점수 컬럼 통일
+    if "추천점수" not in df.columns and score_column in df.columns:
+        df = df.copy()
+        df["추천점수"] = df[score_column]
+
+    # 컬럼 정규화
+    out = _ensure_columns(df)
+
+    # 추천점수 기준 정렬 (숫자 변환 시도)
+    try:
+        out["추천점수"] = pd.to_numeric(out["추천점수"], errors="coerce").fillna(0)
+    except Exception:
+        pass
+
+    # 카테고리별 상위 N만 남긴 뒤 정렬 (한 카테고리가 다른 카테고리를 밀어내지 않도록)
+    if per_category and top_n is not None and not ascending:
+        index = RankingIndex(top_n)
+        index.update(out.to_dict(orient="records"))
+        out = pd.DataFrame(index.export_items(), columns=OUTPUT_COLUMNS_BASE)
+        top_n = None
+
+    out = out.sort_values(by="추천점수", ascending=ascending, kind="stable")
+
+    # 1~30위만 선택 (top_n=None이면 전체)
+    if top_n is not None:
+        out = out.head(top_n)
+    out = out.reset_index(drop=True)
+    out.insert(0, "순위", list(range(1, len(out) + 1)))
+
+    # 업로드일·뉴스기사 날짜 YYYY-MM-DD 형식으로 정규화
+    for col in ("업로드일", "뉴스기사2_날짜", "뉴스기사3_날짜"):
+        if col in out.columns:
+            out[col] = _normalize_date_column(out[col])
+
+    return out
+
+
+def _latest_excel_path() -> str:
+    """오늘 만든 마지막 기본 리포트 경로 (없으면 "")."""
+    new_path = _default_excel_path()
+    match = re.search(r"\((\d+)\)\.xlsx$", new_path)
+    n = int(match.group(1)) if match else 1
+    if n <= 1:
+        return ""
+    return new_path[: match.start()] + f"({n - 1}).xlsx"
+
+
+def _default_excel_path() -> str:
+    """xlsx/ 폴더에 agro_report_MMDD(1).xlsx, (2).xlsx, ... 순서로 새 경로 결정."""
+    # 프로젝트 루트 기준 xlsx 폴더
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output_dir = os.path.join(base_dir, "xlsx")
+
+    os.makedirs(output_dir, exist_ok=True)
+    base = f"agro_report_{datetime.now().strftime('%m%d')}"
+    n = 1
+    output_path = os.path.join(output_dir, f"{base}({n}).xlsx")
+    while os.path.exists(output_path):
+        n += 1
+        output_path = os.path.join(output_dir, f"{base}({n}).xlsx")
+    return output_path
+
+
+def _default_json_path() -> str:
+    """웹용 JSON 기본 경로: web/data.json."""
+    output_dir = "web"
+    os.makedirs(output_dir, exist_ok=True)
+    return os.path.join(output_dir, "data.json")
+
+
+def _default_js_path() -> str:
+    """웹용 JS 기본 경로: 프로젝트 루트 data.js."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, "data.js")
+
+
+def _resolve_path(output_path: Optional[str], default_path) -> str:
+    """저장 경로 확정 (절대 경로 + 상위 폴더 생성)."""
+    if not output_path:
+        output_path = default_path()
+    output_path = os.path.abspath(output_path)
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    return output_path
+
+
+def _write_xlsx(out: pd.DataFrame, output_path: Optional[str] = None, streaming: Optional[bool] = None, **_) -> str:
+    """
+    준비된 순위 DataFrame을 엑셀로 저장.
+    내용 해시를 문서 속성에 기록해 두고, 같은 내용이면 저장을 건너뜁니다
+    (기본 경로는 오늘 마지막 리포트와 비교하여 같으면 그 경로를 반환).
+    """
+    digest = _frame_digest(out)
+    if not output_path:
+        latest = _latest_excel_path()
+        if latest and _xlsx_digest(latest) == digest:
+            return latest
+    output_path = _resolve_path(output_path, _default_excel_path)
+    if os.path.exists(output_path) and _xlsx_digest(output_path) == digest:
+        return output_path
+
+    if streaming is None:
+        streaming = len(out) >= STREAMING_MIN_ROWS
+
+    with _atomic_output(output_path) as tmp_path:
+        if streaming:
+            _write_excel_streaming(out, tmp_path, digest)
+        else:
+            # 엑셀 저장 (openpyxl 엔진으로 컬럼 너비·하이퍼링크 조정)
+            with pd.ExcelWriter(tmp_path, engine="openpyxl") as writer:
+                out.to_excel(writer, index=False, sheet_name=SHEET_NAME)
+                worksheet = writer.sheets[SHEET_NAME]
+                _set_column_widths(worksheet)
+                _set_header_center_alignment(worksheet, len(OUTPUT_COLUMNS))
+                _set_center_alignment_columns(worksheet, len(out))
+                _apply_hyperlinks(worksheet, out)
+                _set_digest_property(writer.book, digest)
+
+    return output_path
+
+
+def _write_json(out: pd.DataFrame, output_path: Optional[str] = None, **_) -> str:
+    """준비된 순위 DataFrame을 웹용 JSON으로 저장."""
+    output_path = _resolve_path(output_path, _default_json_path)
+
+    data = out.to_dict(orient="records")
+    _write_text_if_changed(output_path, json.dumps(data, ensure_ascii=False, indent=2))
+
+    return output_path
+
+
+def _write_js(out: pd.DataFrame, output_path: Optional[str] = None, scraper_status: dict = None, **_) -> str:
+    """준비된 순위 DataFrame을 웹용 JS(const keywordData = [...];)로 저장."""
+    output_path = _resolve_path(output_path, _default_js_path)
+
+    data = out.to_dict(orient="records")
+    json_str = json.dumps(data, ensure_ascii=False, indent=2)
+
+    status_str = json.dumps(scraper_status or {}, ensure_ascii=False, indent=2)
+
+    js_content = f"const keywordData = {json_str};\n"
+    js_content += f"const scraperStatus = {status_str};\n"
+
+    _write_text_if_changed(output_path, js_content)
+
+    return output_path
+
+
+# 출력 형식 → 저장 함수 (새 형식은 여기에 등록)
+# 저장 함수 시그니처: (준비된 순위 DataFrame, output_path=None, **옵션) -> 저장 경로
+EXPORT_SINKS = {
+    "xlsx": _write_xlsx,
+    "json": _write_json,
+    "js": _write_js,
+}
+
+# per_category=True가 적용되는 형식 (웹 UI 카테고리 탭용). 엑셀은 항상 전체 1~30위
+PER_CATEGORY_SINKS = {"json", "js"}
+
+
 def export_to_excel(
     df: pd.DataFrame,
     output_path: Optional[str] = None,
     score_column: str = "추천점수",
     ascending: bool = False,
+    top_n: Optional[int] = TOP_N,
+    streaming: Optional[bool] = None,
 ) -> str:
     """
     DataFrame을 엑셀 파일로 저장합니다.
@@ -185,6 +678,9 @@ def export_to_excel(
         output_path: 저장 경로. None이면 자동 생성 (agro_report_MMDD(1).xlsx, (2).xlsx, ...)
         score_column: 정렬에 사용할 점수 컬럼명
         ascending: False=높은순, True=낮은순
+        top_n: 출력할 상위 개수 (None이면 전체, 히스토리 리포트용)
+        streaming: True=write-only 스트리밍 저장, False=일반 저장,
+                   None이면 행 수가 STREAMING_MIN_ROWS 이상일 때 자동으로 스트리밍
 
     Returns:
         저장된 파일 경로
@@ -193,59 +689,8 @@ def export_to_excel(
         if df.empty:
             raise ValueError("데이터가 비어 있습니다.")
 
-        # 점수 컬럼 통일
-        if "추천점수" not in df.columns and score_column in df.columns:
-            df = df.copy()
-            df["추천점수"] = df[score_column]
-
-        # 컬럼 정규화
-        out = _ensure_columns(df)
-
-        # 추천점수 기준 정렬 (숫자 변환 시도)
-        try:
-            out["추천점수"] = pd.to_numeric(out["추천점수"], errors="coerce").fillna(0)
-        except Exception:
-            pass
-        out = out.sort_values(by="추천점수", ascending=ascending)
-
-        # 1~30위만 선택
-        out = out.head(TOP_N).reset_index(drop=True)
-        out.insert(0, "순위", list(range(1, len(out) + 1)))
-
-        # 업로드일·뉴스기사 날짜 YYYY-MM-DD 형식으로 정규화
-        for col in ("업로드일", "뉴스기사2_날짜", "뉴스기사3_날짜"):
-            if col in out.columns:
-                out[col] = out[col].apply(_normalize_date)
-
-        # 출력 경로 결정: xlsx/ 폴더에 agro_report_MMDD(1).xlsx, (2).xlsx, ... 순서
-        if not output_path:
-            # 프로젝트 루트 기준 xlsx 폴더
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            output_dir = os.path.join(base_dir, "xlsx")
-            
-            os.makedirs(output_dir, exist_ok=True)
-            base = f"agro_report_{datetime.now().strftime('%m%d')}"
-            n = 1
-            output_path = os.path.join(output_dir, f"{base}({n}).xlsx")
-            while os.path.exists(output_path):
-                n += 1
-                output_path = os.path.join(output_dir, f"{base}({n}).xlsx")
-
-        output_path = os.path.abspath(output_path)
-        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-
-        # 엑셀 저장 (openpyxl 엔진으로 컬럼 너비·하이퍼링크 조정)
-        with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-            out.to_excel(writer, index=False, sheet_name="어그로추천주제")
-            worksheet = writer.sheets["어그로추천주제"]
-            _set_column_widths(worksheet)
-            _set_header_center_alignment(worksheet, len(OUTPUT_COLUMNS))
-            _set_center_alignment_columns(worksheet, len(out))
-            _apply_hyperlinks(worksheet, out)
-
-        return output_path
-
-        return output_path
+        out = _prepare_ranked(df, score_column, ascending, top_n)
+        return _write_xlsx(out, output_path, streaming=streaming)
 
     except ValueError as e:
         raise e
@@ -266,45 +711,8 @@ def export_to_json(
         if df.empty:
             return ""
 
-        # 점수 컬럼 통일
-        if "추천점수" not in df.columns and score_column in df.columns:
-            df = df.copy()
-            df["추천점수"] = df[score_column]
-
-        # 컬럼 정규화
-        out = _ensure_columns(df)
-
-        # 추천점수 기준 정렬
-        try:
-            out["추천점수"] = pd.to_numeric(out["추천점수"], errors="coerce").fillna(0)
-        except Exception:
-            pass
-        out = out.sort_values(by="추천점수", ascending=ascending)
-
-        # 1~30위만 선택
-        out = out.head(TOP_N).reset_index(drop=True)
-        out.insert(0, "순위", list(range(1, len(out) + 1)))
-
-        # 날짜 정규화
-        for col in ("업로드일", "뉴스기사2_날짜", "뉴스기사3_날짜"):
-            if col in out.columns:
-                out[col] = out[col].apply(_normalize_date)
-
-        # 저장 경로: web/data.json
-        if not output_path:
-            output_dir = "web"
-            os.makedirs(output_dir, exist_ok=True)
-            output_path = os.path.join(output_dir, "data.json")
-
-        output_path = os.path.abspath(output_path)
-        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-
-        # JSON 저장
-        data = out.to_dict(orient="records")
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-
-        return output_path
+        out = _prepare_ranked(df, score_column, ascending)
+        return _write_json(out, output_path)
 
     except Exception as e:
         print(f"[오류] JSON 저장 실패: {e}")
@@ -317,63 +725,205 @@ def export_to_js(
     score_column: str = "추천점수",
     ascending: bool = False,
     scraper_status: dict = None,
+    per_category: bool = False,
 ) -> str:
     """
     DataFrame을 웹용 JS 파일로 저장합니다.
     const keywordData = [...]; 형태로 저장되어
     HTML에서 <script src="data.js"></script>로 불러올 수 있습니다.
+    per_category=True면 카테고리별 상위 TOP_N을 저장합니다 (웹 UI 카테고리 탭용).
     """
     try:
         if df.empty:
             return ""
 
-        # 점수 컬럼 통일
-        if "추천점수" not in df.columns and score_column in df.columns:
-            df = df.copy()
-            df["추천점수"] = df[score_column]
+        out = _prepare_ranked(df, score_column, ascending, per_category=per_category)
+        return _write_js(out, output_path, scraper_status=scraper_status)
 
-        # 컬럼 정규화
-        out = _ensure_columns(df)
+    except Exception as e:
+        print(f"[오류] JS 저장 실패: {e}")
+        return ""
+
+
+def export_all(
+    df: pd.DataFrame,
+    sinks: Iterable[str] = ("xlsx", "json", "js"),
+    output_paths: Optional[Dict[str, str]] = None,
+    score_column: str = "추천점수",
+    ascending: bool = False,
+    top_n: Optional[int] = TOP_N,
+    per_category: bool = False,
+    parallel: bool = False,
+    **options,
+) -> Dict[str, str]:
+    """
+    순위 DataFrame을 한 번만 준비해 여러 형식(xlsx, json, js, ...)으로 저장합니다.
+
+    Args:
+        df: 수집·분석된 데이터
+        sinks: 저장할 형식 목록 (EXPORT_SINKS 키)
+        output_paths: 형식별 저장 경로 (없으면 각 형식의 기본 경로)
+        score_column, ascending, top_n: export_to_* 와 동일
+        per_category: True면 웹 형식(PER_CATEGORY_SINKS)만 카테고리별 상위 top_n (export_to_js와 동일)
+        parallel: True면 형식별 저장을 스레드로 동시에 수행
+        **options: 저장 함수에 전달할 옵션 (scraper_status, streaming 등)
 
-        # 추천점수 기준 정렬
+    Returns:
+        {형식: 저장 경로} (실패한 형식은 "")
+    """
+    sinks = list(dict.fromkeys(sinks))
+    unknown = [s for s in sinks if s not in EXPORT_SINKS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 출력 형식: {unknown} (지원: {list(EXPORT_SINKS)})")
+
+    results = {sink: "" for sink in sinks}
+    if df.empty or not sinks:
+        return results
+
+    # 순위 방식(전체 / 카테고리별)마다 한 번만 준비
+    modes = {sink: per_category and sink in PER_CATEGORY_SINKS for sink in sinks}
+    prepared = {
+        mode: _prepare_ranked(df, score_column, ascending, top_n, mode)
+        for mode in set(modes.values())
+    }
+    output_paths = output_paths or {}
+
+    def _write(sink: str) -> str:
         try:
-            out["추천점수"] = pd.to_numeric(out["추천점수"], errors="coerce").fillna(0)
-        except Exception:
-            pass
-        out = out.sort_values(by="추천점수", ascending=ascending)
+            return EXPORT_SINKS[sink](prepared[modes[sink]], output_paths.get(sink), **options)
+        except Exception as e:
+            print(f"[오류] {sink} 저장 실패: {e}")
+            return ""
 
-        # 1~30위만 선택
-        out = out.head(TOP_N).reset_index(drop=True)
-        out.insert(0, "순위", list(range(1, len(out) + 1)))
+    if parallel and len(sinks) > 1:
+        from concurrent.futures import ThreadPoolExecutor
 
-        # 날짜 정규화
-        for col in ("업로드일", "뉴스기사2_날짜", "뉴스기사3_날짜"):
-            if col in out.columns:
-                out[col] = out[col].apply(_normalize_date)
+        with ThreadPoolExecutor(max_workers=len(sinks)) as pool:
+            for sink, path in zip(sinks, pool.map(_write, sinks)):
+                results[sink] = path
+    else:
+        for sink in sinks:
+            results[sink] = _write(sink)
 
-        # 저장 경로: ../data.js (루트)
-        if not output_path:
-            # 프로젝트 루트 기준 data.js
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            output_path = os.path.join(base_dir, "data.js")
+    return results
 
-        output_path = os.path.abspath(output_path)
-        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
 
-        # JS 저장
-        data = out.to_dict(orient="records")
-        json_str = json.dumps(data, ensure_ascii=False, indent=2)
-        
-        status_str = json.dumps(scraper_status or {}, ensure_ascii=False, indent=2)
-        
-        js_content = f"const keywordData = {json_str};\n"
-        js_content += f"const scraperStatus = {status_str};\n"
+# ========== 컬럼형 히스토리 (Parquet) ==========
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(js_content)
+# 파티션 키: 수집일(YYYY-MM-DD) / 카테고리
+PARQUET_PARTITION_COLUMNS = ["수집일", "카테고리"]
 
-        return output_path
+
+def _parquet_schema():
+    """히스토리 Parquet 스키마 (분석용 타입 지정)."""
+    return pa.schema([
+        ("제목", pa.string()),
+        ("추천점수", pa.float64()),
+        ("키워드", pa.string()),
+        ("카테고리", pa.string()),
+        ("출처", pa.string()),
+        ("유튜브_URL", pa.string()),
+        ("뉴스기사_URL", pa.string()),
+        ("업로드일", pa.date32()),
+        ("뉴스기사2_URL", pa.string()),
+        ("뉴스기사2_날짜", pa.date32()),
+        ("뉴스기사3_URL", pa.string()),
+        ("뉴스기사3_날짜", pa.date32()),
+        ("조회수", pa.int64()),
+        ("시간당조회수", pa.float64()),
+        ("수집시각", pa.timestamp("s")),
+        ("수집일", pa.string()),
+    ])
+
+
+def export_to_parquet(
+    df: pd.DataFrame,
+    output_dir: Optional[str] = None,
+    collected_at: Optional[datetime] = None,
+    append: bool = True,
+) -> str:
+    """
+    수집 데이터 전체를 수집일·카테고리로 파티션된 Parquet 데이터셋에 저장합니다.
+    (TOP_N 제한 없음, 실행마다 새 파일을 추가하는 append 모드 기본)
+
+    history/수집일=2026-02-08/카테고리=경제/part-<실행시각>-<고유값>-0.parquet 형태로 저장되어
+    pandas.read_parquet(..., filters=...)나 pyarrow.dataset으로 필요한 파티션만 읽을 수 있습니다.
+
+    Args:
+        df: 수집·분석된 데이터 (한글 또는 영문 컬럼)
+        output_dir: 데이터셋 루트. None이면 프로젝트 루트의 history/
+        collected_at: 수집 시각 (None이면 현재 시각)
+        append: True=기존 파티션에 파일 추가, False=이번에 쓰는 파티션을 덮어쓰기
+
+    Returns:
+        데이터셋 루트 경로 (저장하지 않았으면 "")
+    """
+    if pa is None or pq is None:
+        print("[경고] pyarrow가 설치되어 있지 않아 Parquet 저장을 건너뜁니다.")
+        return ""
+    try:
+        if df.empty:
+            return ""
+
+        out = _ensure_columns(df)
+        out["추천점수"] = pd.to_numeric(out["추천점수"], errors="coerce").fillna(0).astype("float64")
+        out["조회수"] = pd.to_numeric(out["조회수"], errors="coerce").astype("Int64")
+        out["시간당조회수"] = pd.to_numeric(out["시간당조회수"], errors="coerce").astype("float64")
+        for col in ("업로드일", "뉴스기사2_날짜", "뉴스기사3_날짜"):
+            out[col] = pd.to_datetime(_normalize_date_column(out[col]), format="%Y-%m-%d", errors="coerce").dt.date
+        for col in ("제목", "키워드", "카테고리", "출처", "유튜브_URL", "뉴스기사_URL", "뉴스기사2_URL", "뉴스기사3_URL"):
+            out[col] = out[col].fillna("").astype(str)
+        out.loc[out["카테고리"] == "", "카테고리"] = "미분류"
+
+        collected_at = (collected_at or datetime.now()).replace(microsecond=0)
+        out["수집시각"] = pd.Timestamp(collected_at)
+        out["수집일"] = collected_at.strftime("%Y-%m-%d")
+
+        if not output_dir:
+            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            output_dir = os.path.join(base_dir, "history")
+        output_dir = os.path.abspath(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
+
+        table = pa.Table.from_pandas(out, schema=_parquet_schema(), preserve_index=False)
+        pq.write_to_dataset(
+            table,
+            root_path=output_dir,
+            partition_cols=PARQUET_PARTITION_COLUMNS,
+            # 같은 초에 여러 번 추가해도 이전 파일을 덮어쓰지 않도록 실행마다 고유한 이름
+            basename_template=f"part-{collected_at.strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:12]}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore" if append else "delete_matching",
+        )
+        return output_dir
 
     except Exception as e:
-        print(f"[오류] JS 저장 실패: {e}")
+        print(f"[오류] Parquet 저장 실패: {e}")
         return ""
+
+
+def read_parquet_history(
+    output_dir: Optional[str] = None,
+    filters: Optional[list] = None,
+    columns: Optional[list] = None,
+) -> pd.DataFrame:
+    """
+    Parquet 히스토리 조회 (파티션·조건 푸시다운).
+
+    예: read_parquet_history(filters=[("카테고리", "=", "경제"), ("수집일", ">=", "2026-02-01")])
+    """
+    if pa is None or pq is None:
+        raise RuntimeError("pyarrow가 설치되어 있지 않습니다. pip install pyarrow")
+    if not output_dir:
+        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output_dir = os.path.join(base_dir, "history")
+    if not os.path.isdir(output_dir):
+        return pd.DataFrame()
+    # history/에는 캐시·리포트 등 다른 파일도 있으므로 파티션 폴더의 parquet 파일만 읽음
+    files = glob.glob(os.path.join(output_dir, f"{PARQUET_PARTITION_COLUMNS[0]}=*", "**", "*.parquet"), recursive=True)
+    if not files:
+        return pd.DataFrame()
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(sorted(files), format="parquet", partitioning="hive", partition_base_dir=output_dir)
+    expression = pq.filters_to_expression(filters) if filters else None
+    return dataset.to_table(columns=columns, filter=expression).to_pandas()
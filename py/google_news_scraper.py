@@ -12,6 +12,14 @@ from urllib.parse import quote_plus
 
 import requests
 
+import http_client
+import run_report
+from article import Article
+from circuit_breaker import get_breaker
+from link_resolver import get_resolver
+from query_batcher import build_query, match_keywords, plan_batches
+from url_canon import SeenSet, canonical_url
+
 try:
     import feedparser
 except ImportError:
@@ -28,17 +36,31 @@ SEARCH_QUERIES = ["급락", "단독", "최초", "국세청", "폭락"]
 
 RSS_BASE = "https://news.google.com/rss/search"
 NEWSAPI_URL = "https://newsapi.org/v2/everything"
+# NewsAPI q 최대 길이 500자, OR 묶음 검색
+NEWSAPI_MAX_QUERY_LENGTH = 500
+NEWSAPI_MAX_TERMS = 10
+NEWSAPI_PER_KEYWORD = 5
 
 
-def _fetch_rss(query: str, max_results: int = 15, days_back: int = 7) -> List[dict]:
+def _fetch_rss(query: str, max_results: int = 15, days_back: int = 7) -> List[Article]:
     """구글 뉴스 RSS에서 기사 수집 (무료, API 키 불필요)."""
     if feedparser is None:
         return []
 
     url = f"{RSS_BASE}?q={quote_plus(query)}&hl=ko&gl=KR&ceid=KR:ko"
-    feed = feedparser.parse(url, request_headers={"User-Agent": "Mozilla/5.0"})
+    # 요청은 공용 클라이언트로 (녹화/재생 지원), feedparser는 파싱만 담당
+    breaker = get_breaker("google.rss")
+    try:
+        resp = http_client.get(url, headers={"User-Agent": "Mozilla/5.0"})
+        resp.raise_for_status()
+    except requests.RequestException as e:
+        breaker.record_failure(e)
+        return []
+    breaker.record_success()
+    feed = feedparser.parse(resp.content, response_headers=dict(resp.headers))
+    resolver = get_resolver()
     results = []
-    cutoff_date = datetime.now() - timedelta(days=days_back)
+    cutoff_date = http_client.now() - timedelta(days=days_back)
     
     for entry in feed.get("entries", [])[:max_results]:
         title = (entry.get("title") or "").strip()
@@ -53,19 +75,21 @@ def _fetch_rss(query: str, max_results: int = 15, days_back: int = 7) -> List[di
                 continue
         
         if title and len(title) > 3:
-            results.append({
-                "title": title,
-                "url": link,
-                "source": "구글뉴스",
-                "section": published,
-                "upload_date": published,
-            })
+            # 리다이렉트 링크 → 원문 URL 변환은 백그라운드로 예약 (병합 전에 적용)
+            resolver.submit(link)
+            results.append(Article(
+                title=title,
+                url=link,
+                source="구글뉴스",
+                section=published,
+                upload_date=published,
+            ))
     return results
 
 
-def _fetch_newsapi(api_key: str, query: str, max_results: int = 10) -> List[dict]:
+def _fetch_newsapi(api_key: str, query: str, max_results: int = 10, days_back: int = 7) -> List[Article]:
     """NewsAPI.org에서 기사 수집 (API 키 필요)."""
-    from_date = (datetime.utcnow() - timedelta(days=7)).strftime("%Y-%m-%d")
+    from_date = (http_client.utcnow() - timedelta(days=days_back)).strftime("%Y-%m-%d")
     params = {
         "q": query,
         "apiKey": api_key,
@@ -73,7 +97,7 @@ def _fetch_newsapi(api_key: str, query: str, max_results: int = 10) -> List[dict
         "sortBy": "publishedAt",
         "pageSize": min(max_results, 100),
     }
-    resp = requests.get(NEWSAPI_URL, params=params, timeout=15)
+    resp = http_client.get(NEWSAPI_URL, params=params, timeout=15)
     resp.raise_for_status()
     data = resp.json()
     if data.get("status") != "ok":
@@ -81,20 +105,19 @@ def _fetch_newsapi(api_key: str, query: str, max_results: int = 10) -> List[dict
     results = []
     for article in data.get("articles", []):
         title = (article.get("title") or "").strip()
-        url = article.get("url", "")
+        url = canonical_url(article.get("url", ""))
         published = (article.get("publishedAt") or "")[:10]
         if title and url:
-            results.append({
-                "title": title,
-                "url": url,
-                "source": "구글뉴스",
-                "views": "",
-                "upload_date": published,
-            })
+            results.append(Article(
+                title=title,
+                url=url,
+                source="구글뉴스",
+                upload_date=published,
+            ))
     return results
 
 
-def scrape_google_news(max_per_query: int = 10, max_total: int = 50, query_list: List[str] = None, days_back: int = 7) -> List[dict]:
+def scrape_google_news(max_per_query: int = 10, max_total: int = 50, query_list: List[str] = None, days_back: int = 7) -> List[Article]:
     """
     구글 뉴스 수집 (RSS + NewsAPI).
     
@@ -105,20 +128,25 @@ def scrape_google_news(max_per_query: int = 10, max_total: int = 50, query_list:
         days_back: 검색 기간 (일 단위, 기본 7일)
     
     Returns:
-        [{"title": str, "url": str, "source": "구글뉴스", "section": str}, ...]
+        [Article(title, url, source="구글뉴스", section, upload_date), ...]
     """
-    seen_urls = set()
+    seen_urls = SeenSet()
     results = []
 
     # 사용할 쿼리 목록 결정
     queries = query_list if query_list else SEARCH_QUERIES
 
-    # 1. RSS (항상 시도)
+    # 1. RSS (항상 시도, 차단되면 중단)
+    rss_breaker = get_breaker("google.rss")
     for query in queries:
-        if len(results) >= max_total:
+        if len(results) >= max_total or not rss_breaker.allow():
             break
-        for item in _fetch_rss(query, max_results=max_per_query, days_back=days_back):
-            url = item.get("url", "") or item.get("title", "")
+        with run_report.stage("google.rss", query=query, days_back=days_back) as st:
+            items = _fetch_rss(query, max_results=max_per_query, days_back=days_back)
+            st["items"] = len(items)
+        for item in items:
+            item.queries = (query,)
+            url = item.url or item.title
             if url and url not in seen_urls:
                 seen_urls.add(url)
                 results.append(item)
@@ -128,11 +156,25 @@ def scrape_google_news(max_per_query: int = 10, max_total: int = 50, query_list:
     # 2. NewsAPI (키 있으면 추가)
     api_key = (os.getenv("NEWS_API_KEY") or "").strip()
     if api_key:
-        for query in queries:
-            if len(results) >= max_total:
+        # NewsAPI 오류는 RSS 결과를 버리지 않고 차단기에만 반영
+        # 키워드를 OR 묶음으로 검색하여 일일 요청 한도 절약
+        newsapi_breaker = get_breaker("google.newsapi")
+        for group in plan_batches(queries, NEWSAPI_MAX_QUERY_LENGTH, " OR ", NEWSAPI_MAX_TERMS):
+            if len(results) >= max_total or not newsapi_breaker.allow():
                 break
-            for item in _fetch_newsapi(api_key, query, max_results=5):
-                url = item.get("url", "")
+            query = build_query(group)
+            with run_report.stage("google.newsapi", query=query, terms=len(group), days_back=days_back) as st:
+                try:
+                    items = _fetch_newsapi(
+                        api_key, query, max_results=NEWSAPI_PER_KEYWORD * len(group), days_back=days_back)
+                except Exception as e:
+                    newsapi_breaker.record_failure(e)
+                    continue
+                newsapi_breaker.record_success()
+                st["items"] = len(items)
+            for item in items:
+                item.queries = tuple(match_keywords(item.title, group))
+                url = item.url
                 if url and url not in seen_urls:
                     seen_urls.add(url)
                     results.append(item)
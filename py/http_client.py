@@ -0,0 +1,351 @@
+"""
+공용 HTTP 클라이언트
+모든 스크래퍼의 HTTP 요청이 거치는 단일 진입점.
+- 녹화(record): 실제 요청 후 응답을 카세트 파일로 저장 (API 키 등 비밀값 제거)
+- 재생(replay): 네트워크 없이 저장된 응답을 돌려줌 (선택: 지연 시간 주입)
+  재생 중 now()/utcnow()는 녹화 시각(manifest.json)으로 고정되고, 날짜 요청 값(publishedAfter 등)은
+  카세트 키에서 상대 일수로 바뀌므로 녹화 다음 날 이후에 재생해도 같은 결과가 나옵니다.
+
+환경 변수로도 설정 가능:
+    HTTP_CASSETTE_MODE=record|replay
+    HTTP_CASSETTE_DIR=cassettes
+    HTTP_CASSETTE_LATENCY=recorded|<밀리초>
+"""
+
+import base64
+import hashlib
+import json
+import os
+import re
+import time
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+import rate_limiter
+import run_report
+
+DEFAULT_TIMEOUT = 15
+# 429/5xx 응답 시 재시도 횟수, 재시도할 최대 대기 시간 (초, 넘으면 응답 그대로 반환)
+MAX_RETRIES = 2
+MAX_RETRY_WAIT = 60.0
+
+# 카세트에 남기면 안 되는 값
+SECRET_ENV_NAMES = ["YOUTUBE_API_KEY", "YOUTUBE_API_KEYS", "NEWS_API_KEY", "NAVER_CLIENT_ID", "NAVER_CLIENT_SECRET"]
+SECRET_PARAM_NAMES = {"key", "apikey", "api_key", "access_token"}
+SECRET_HEADER_NAMES = {"x-naver-client-id", "x-naver-client-secret", "authorization", "x-api-key"}
+SCRUBBED = "***"
+REPLAY_PLACEHOLDER = "replay-placeholder"
+
+# 실행 시각에서 계산되는 요청 값 (카세트 키에는 기준 날짜와의 일수 차이로 넣음)
+TIME_PARAM_NAMES = {"publishedAfter", "publishedBefore", "from", "to"}
+
+# 응답 헤더 중 저장할 항목
+KEPT_RESPONSE_HEADERS = {"content-type", "retry-after", "date", "etag", "last-modified"}
+
+_cassette = {
+    "mode": (os.getenv("HTTP_CASSETTE_MODE") or "").strip().lower(),
+    "dir": os.getenv("HTTP_CASSETTE_DIR") or "",
+    "latency": (os.getenv("HTTP_CASSETTE_LATENCY") or "").strip(),
+    # 녹화 시작 시각 (manifest.json에 저장) / 재생 중 고정된 현재 시각 (None=아직 안 읽음, ""=없음)
+    "recorded_at": None,
+    "frozen": None,
+}
+
+
+def default_cassette_dir() -> str:
+    """기본 카세트 폴더: 프로젝트 루트 cassettes/."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, "cassettes")
+
+
+def configure_cassette(
+    mode: Optional[str],
+    directory: Optional[str] = None,
+    latency: Union[None, str, float] = None,
+) -> None:
+    """
+    녹화/재생 모드 설정.
+
+    Args:
+        mode: "record", "replay", 또는 None(끄기)
+        directory: 카세트 폴더 (None이면 cassettes/)
+        latency: 재생 시 지연. "recorded"=녹화 당시 소요 시간, 숫자=고정 밀리초, None=지연 없음
+    """
+    mode = (mode or "").strip().lower()
+    if mode not in ("", "record", "replay"):
+        raise ValueError(f"알 수 없는 카세트 모드: {mode}")
+    _cassette["mode"] = mode
+    _cassette["dir"] = directory or ""
+    _cassette["latency"] = "" if latency is None else str(latency)
+    _cassette["recorded_at"] = None
+    _cassette["frozen"] = None
+    if mode == "replay":
+        _install_replay_env()
+
+
+def cassette_mode() -> str:
+    return _cassette["mode"]
+
+
+def _cassette_dir() -> str:
+    return _cassette["dir"] or default_cassette_dir()
+
+
+# ========== 시계 ==========
+
+
+def _wall_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _frozen_now() -> Optional[datetime]:
+    """재생 중이면 manifest.json의 녹화 시각 (없으면 None)."""
+    if _cassette["mode"] != "replay":
+        return None
+    if _cassette["frozen"] is None:
+        _cassette["frozen"] = ""
+        recorded_at = _read_manifest().get("recorded_at")
+        try:
+            _cassette["frozen"] = datetime.fromisoformat(recorded_at) if recorded_at else ""
+        except (TypeError, ValueError):
+            pass
+        if not _cassette["frozen"]:
+            print("[경고] 카세트에 녹화 시각이 없어 현재 시각 기준으로 재생합니다 (날짜 조건이 녹화 때와 다를 수 있음)")
+    return _cassette["frozen"] or None
+
+
+def now() -> datetime:
+    """
+    현재 시각 (naive 로컬 시각, datetime.now() 대체).
+    카세트 재생 중에는 녹화 시각으로 고정되어, 날짜 조건(최근 N일 등)이 녹화 때와 같게 계산됩니다.
+    """
+    return (_frozen_now() or _wall_now()).astimezone().replace(tzinfo=None)
+
+
+def utcnow() -> datetime:
+    """현재 UTC 시각 (naive, datetime.utcnow() 대체). 재생 중에는 녹화 시각으로 고정."""
+    return (_frozen_now() or _wall_now()).astimezone(timezone.utc).replace(tzinfo=None)
+
+
+# ========== 비밀값 제거 ==========
+
+
+def split_env_list(value: Optional[str]) -> List[str]:
+    """여러 값을 나열한 환경 변수(YOUTUBE_API_KEYS 등) → 값 목록 (쉼표·공백 구분)."""
+    return [v for v in re.split(r"[,\s]+", value or "") if v]
+
+
+def _secret_values() -> list:
+    # 여러 키를 나열한 값(YOUTUBE_API_KEYS)은 키마다 따로 제거
+    values = [v for name in SECRET_ENV_NAMES for v in split_env_list(os.getenv(name))]
+    return [v for v in values if len(v) >= 4 and v != REPLAY_PLACEHOLDER]
+
+
+def _scrub_text(text: str) -> str:
+    for value in _secret_values():
+        text = text.replace(value, SCRUBBED)
+    return text
+
+
+def _scrub_params(params: Optional[dict]) -> Dict[str, str]:
+    result = {}
+    for k, v in (params or {}).items():
+        result[str(k)] = SCRUBBED if str(k).lower() in SECRET_PARAM_NAMES else _scrub_text(str(v))
+    return result
+
+
+def _scrub_headers(headers: Optional[dict]) -> Dict[str, str]:
+    result = {}
+    for k, v in (headers or {}).items():
+        result[str(k)] = SCRUBBED if str(k).lower() in SECRET_HEADER_NAMES else _scrub_text(str(v))
+    return result
+
+
+def _scrub_url(url: str) -> str:
+    parts = urlsplit(url)
+    query = [(k, SCRUBBED if k.lower() in SECRET_PARAM_NAMES else v) for k, v in parse_qsl(parts.query, keep_blank_values=True)]
+    return _scrub_text(urlunsplit(parts._replace(query=urlencode(query))))
+
+
+# ========== 카세트 파일 ==========
+
+
+def _key_params(params: Dict[str, str]) -> Dict[str, str]:
+    """
+    카세트 키용 요청 값. 날짜 값(TIME_PARAM_NAMES)은 오늘(UTC)과의 일수 차이로 바꿔서
+    다른 날 재생해도 같은 요청("7일 전부터")이 같은 카세트를 찾도록 합니다 (날짜가 아니면 키에서 제외).
+    """
+    today = utcnow().date()
+    result = {}
+    for k, v in params.items():
+        if k in TIME_PARAM_NAMES:
+            try:
+                v = f"today{(date.fromisoformat(v[:10]) - today).days:+d}d"
+            except ValueError:
+                continue
+        result[k] = v
+    return result
+
+
+def _cassette_path(method: str, url: str, params: Dict[str, str]) -> str:
+    """요청(비밀값 제거 후)으로 카세트 파일 경로 결정."""
+    key = json.dumps([method.upper(), _scrub_url(url), sorted(_key_params(params).items())], ensure_ascii=False)
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    host = urlsplit(url).hostname or "unknown"
+    return os.path.join(_cassette_dir(), host, f"{digest}.json")
+
+
+def _save_cassette(path: str, method: str, url: str, params: dict, headers: dict,
+                   resp: requests.Response, elapsed: float) -> None:
+    body = resp.content or b""
+    try:
+        text = body.decode(resp.encoding or "utf-8")
+        body_field = {"text": _scrub_text(text), "encoding": resp.encoding or "utf-8"}
+    except (UnicodeDecodeError, LookupError):
+        body_field = {"base64": base64.b64encode(body).decode("ascii")}
+    record = {
+        "request": {
+            "method": method.upper(),
+            "url": _scrub_url(url),
+            "params": _scrub_params(params),
+            "headers": _scrub_headers(headers),
+        },
+        "response": {
+            "status": resp.status_code,
+            "reason": resp.reason,
+            "url": _scrub_url(resp.url or url),
+            "headers": {k: v for k, v in resp.headers.items() if k.lower() in KEPT_RESPONSE_HEADERS},
+            **body_field,
+        },
+        "elapsed": round(elapsed, 4),
+        "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(record, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, path)
+    _update_manifest()
+
+
+def _load_cassette(path: str, url: str) -> requests.Response:
+    if not os.path.exists(path):
+        raise requests.ConnectionError(f"카세트 없음 (재생 모드): {_scrub_url(url)}")
+    with open(path, "r", encoding="utf-8") as f:
+        record = json.load(f)
+
+    latency = _cassette["latency"]
+    if latency == "recorded":
+        time.sleep(float(record.get("elapsed", 0)))
+    elif latency:
+        time.sleep(float(latency) / 1000)
+
+    data = record["response"]
+    resp = requests.Response()
+    resp.status_code = int(data["status"])
+    resp.reason = data.get("reason", "")
+    resp.url = data.get("url", url)
+    resp.headers = CaseInsensitiveDict(data.get("headers", {}))
+    if "base64" in data:
+        resp._content = base64.b64decode(data["base64"])
+    else:
+        resp.encoding = data.get("encoding", "utf-8")
+        resp._content = data.get("text", "").encode(resp.encoding)
+    return resp
+
+
+def _read_manifest() -> dict:
+    try:
+        with open(os.path.join(_cassette_dir(), "manifest.json"), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _update_manifest() -> None:
+    """녹화 시작 시각과 녹화 당시 설정된 키 이름 목록 저장 (값은 저장하지 않음)."""
+    path = os.path.join(_cassette_dir(), "manifest.json")
+    if not _cassette["recorded_at"]:
+        _cassette["recorded_at"] = _wall_now().replace(microsecond=0).isoformat()
+    manifest = {
+        "recorded_at": _cassette["recorded_at"],
+        "env_present": [name for name in SECRET_ENV_NAMES if (os.getenv(name) or "").strip()],
+    }
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+    except OSError:
+        pass
+
+
+def _install_replay_env() -> None:
+    """재생 시 녹화 당시와 같은 수집 경로를 타도록, 있던 키 이름에 가짜 값 설정."""
+    for name in _read_manifest().get("env_present", []):
+        if not (os.getenv(name) or "").strip():
+            os.environ[name] = REPLAY_PLACEHOLDER
+
+
+# ========== 요청 ==========
+
+
+def get(
+    url: str,
+    params: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> requests.Response:
+    """
+    HTTP GET (requests.get 대체). 카세트 모드에 따라 녹화·재생합니다.
+    실제 요청은 호스트별 속도 제한을 거치며, 429/5xx는 대기 후 MAX_RETRIES회까지 재시도합니다.
+    오류 처리는 requests와 동일하게 호출하는 쪽에서 raise_for_status() 등을 사용합니다.
+    """
+    mode = _cassette["mode"]
+    start = time.perf_counter()
+    if mode == "replay":
+        try:
+            resp = _load_cassette(_cassette_path("GET", url, _scrub_params(params)), url)
+        except requests.RequestException:
+            run_report.record_request(url, time.perf_counter() - start, 0, None, source="cassette")
+            raise
+        run_report.record_request(url, time.perf_counter() - start, len(resp.content), resp.status_code,
+                                  source="cassette")
+        return resp
+
+    bucket = rate_limiter.bucket_for(url)
+    for attempt in range(MAX_RETRIES + 1):
+        bucket.acquire()
+        start = time.perf_counter()
+        try:
+            resp = requests.get(url, params=params, headers=headers, timeout=timeout)
+        except requests.RequestException:
+            run_report.record_request(url, time.perf_counter() - start, 0, None)
+            raise
+        elapsed = time.perf_counter() - start
+        run_report.record_request(url, elapsed, len(resp.content), resp.status_code)
+
+        delay = bucket.feedback(resp.status_code, rate_limiter.parse_retry_after(resp.headers.get("Retry-After")))
+        if delay is None:
+            break
+        retry = attempt < MAX_RETRIES and delay <= MAX_RETRY_WAIT
+        run_report.record_event(
+            "throttle",
+            host=urlsplit(url).hostname or "unknown",
+            status=resp.status_code,
+            wait_s=round(delay, 3),
+            rate=round(bucket.rate, 3),
+            retry=retry,
+        )
+        if not retry:
+            break
+
+    if mode == "record":
+        try:
+            _save_cassette(_cassette_path("GET", url, _scrub_params(params)), "GET", url,
+                           params or {}, headers or {}, resp, elapsed)
+        except Exception as e:
+            print(f"[경고] 카세트 저장 실패: {e}")
+    return resp
@@ -0,0 +1,260 @@
+"""
+키워드 성과 집계 (유튜브 조회수 기준)
+등급(TIER_1~3) 키워드가 실제로 조회수를 끌어올리는지 보기 위해
+카테고리 × 키워드별로 영상 수, 조회수 합·로그 합, 최근 가중 평균을 누적합니다.
+
+- 실행마다 새로 점수가 매겨진 유튜브 항목만 반영 (처음부터 다시 계산하지 않음, 실행당 O(새 항목))
+- 집계는 history/keyword_stats.db(sqlite)에 키워드·영상 단위로 저장되어, 실행마다 바뀐 행만 읽고 씁니다
+- 같은 영상이 다시 수집되면 영상 수는 그대로 두고 조회수 변화분만 반영
+  (최근 가중 합에는 그 영상의 처음 반영 시점 가중치로 더해, 오래된 영상이 "최근" 성과로 잡히지 않음)
+- 최근 가중 평균: 반감기 HALF_LIFE_DAYS의 지수 감쇠 (기준 시각을 함께 저장해 갱신 시에만 감쇠)
+- 기준선: 카테고리 전체 영상(키워드 "*"), 카테고리 "*"는 전체 카테고리 합산
+- 오래된 영상 기록 정리는 하루 한 번 (COMPACT_INTERVAL_S)
+
+조회:
+    python py/keyword_stats.py                    # 전체 카테고리, 조회수 상승폭 순
+    python py/keyword_stats.py --category 경제 --min-hits 5 --by recent_lift
+"""
+
+import argparse
+import json
+import math
+import os
+import sqlite3
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from view_log import video_id_from_url
+
+ALL = "*"
+HALF_LIFE_DAYS = 14.0
+VIDEO_TTL_DAYS = 30  # 영상별 마지막 반영 조회수 보관 기간 (이후 다시 나오면 새 영상으로 집계)
+MAX_VIDEOS = 50_000
+COMPACT_INTERVAL_S = 86400  # 영상 기록 정리 간격
+
+RANK_FIELDS = ("lift", "recent_lift", "hits", "mean_views")
+
+_CELL_FIELDS = ("hits", "views_sum", "log_sum", "w", "w_log", "t_ref")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cells (
+    category TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    hits INTEGER NOT NULL,
+    views_sum INTEGER NOT NULL,
+    log_sum REAL NOT NULL,
+    w REAL NOT NULL,
+    w_log REAL NOT NULL,
+    t_ref REAL NOT NULL,
+    PRIMARY KEY (category, keyword)
+);
+CREATE TABLE IF NOT EXISTS videos (
+    video_id TEXT PRIMARY KEY,
+    views INTEGER NOT NULL,
+    first_seen REAL NOT NULL,
+    updated REAL NOT NULL,
+    category TEXT NOT NULL,
+    keywords TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS videos_updated ON videos (updated);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value REAL NOT NULL
+);
+"""
+
+
+def default_stats_path() -> str:
+    """기본 저장 경로: 프로젝트 루트 history/keyword_stats.db."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, "history", "keyword_stats.db")
+
+
+def _views(value: Any) -> Optional[int]:
+    try:
+        views = int(value)
+    except (TypeError, ValueError):
+        return None
+    return views if views >= 0 else None
+
+
+def _keywords(item: Any) -> List[str]:
+    """항목의 점수 기여 키워드 (score_keywords: "a, b")."""
+    text = item.get("score_keywords") or ""
+    return [kw.strip() for kw in text.split(",") if kw.strip()]
+
+
+def _new_cell(now: float) -> Dict[str, float]:
+    return {"hits": 0, "views_sum": 0, "log_sum": 0.0, "w": 0.0, "w_log": 0.0, "t_ref": now}
+
+
+def _decay(cell: Dict[str, float], now: float) -> None:
+    """감쇠 합을 now 기준으로 옮김."""
+    elapsed = now - cell["t_ref"]
+    if elapsed > 0:
+        factor = 0.5 ** (elapsed / (HALF_LIFE_DAYS * 86400))
+        cell["w"] *= factor
+        cell["w_log"] *= factor
+        cell["t_ref"] = now
+
+
+class KeywordStats:
+    """카테고리 × 키워드 누적 집계 (sqlite)."""
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path or default_stats_path()
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "KeywordStats":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _cell(self, category: str, keyword: str, now: float) -> Dict[str, float]:
+        row = self._db.execute(
+            "SELECT hits, views_sum, log_sum, w, w_log, t_ref FROM cells WHERE category = ? AND keyword = ?",
+            (category, keyword),
+        ).fetchone()
+        cell = dict(zip(_CELL_FIELDS, row)) if row else _new_cell(now)
+        _decay(cell, now)
+        return cell
+
+    def _apply(self, category: str, keywords: List[str], hits: int, views: int, log_views: float,
+               weight: float, now: float) -> None:
+        """영상 1개의 변화분 반영 (weight: 그 영상의 현재 감쇠 가중치, 처음 반영이면 1)."""
+        for cat in (category, ALL):
+            for keyword in [ALL, *keywords]:
+                cell = self._cell(cat, keyword, now)
+                cell["hits"] += hits
+                cell["views_sum"] += views
+                cell["log_sum"] += log_views
+                cell["w"] += hits
+                cell["w_log"] += weight * log_views
+                self._db.execute(
+                    "INSERT OR REPLACE INTO cells VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (cat, keyword, *(cell[f] for f in _CELL_FIELDS)),
+                )
+
+    def update(self, articles: Iterable[Any], category: str, now: Optional[float] = None) -> int:
+        """
+        점수가 매겨진 유튜브 항목 반영.
+        처음 보는 영상은 영상 수 +1, 이미 반영한 영상은 조회수 변화분만 더합니다.
+
+        Returns:
+            반영한 항목 수
+        """
+        now = time.time() if now is None else now
+        count = 0
+        with self._db:
+            for item in articles:
+                if not getattr(item, "is_youtube", False):
+                    continue
+                vid = video_id_from_url(item.url)
+                views = _views(item.views)
+                if not vid or views is None:
+                    continue
+                log_views = math.log1p(views)
+                previous = self._db.execute(
+                    "SELECT views, first_seen, updated, category, keywords FROM videos WHERE video_id = ?", (vid,),
+                ).fetchone()
+                if previous is None or now - previous[2] > VIDEO_TTL_DAYS * 86400:
+                    first_seen, video_category, keywords = now, category, _keywords(item)
+                    self._apply(video_category, keywords, 1, views, log_views, 1.0, now)
+                else:
+                    # 처음 반영할 때의 카테고리·키워드·시점 기준으로 변화분만
+                    old_views, first_seen, _, video_category, keywords = previous
+                    keywords = json.loads(keywords)
+                    weight = 0.5 ** (max(now - first_seen, 0) / (HALF_LIFE_DAYS * 86400))
+                    self._apply(video_category, keywords, 0, views - old_views,
+                                log_views - math.log1p(old_views), weight, now)
+                self._db.execute(
+                    "INSERT OR REPLACE INTO videos VALUES (?, ?, ?, ?, ?, ?)",
+                    (vid, views, first_seen, now, video_category, json.dumps(keywords, ensure_ascii=False)),
+                )
+                count += 1
+            self._maybe_compact(now)
+        return count
+
+    def _maybe_compact(self, now: float) -> None:
+        """하루 한 번 오래된 영상 기록 삭제 + 최대 MAX_VIDEOS개 유지."""
+        row = self._db.execute("SELECT value FROM meta WHERE name = 'compacted_at'").fetchone()
+        if row and now - row[0] < COMPACT_INTERVAL_S:
+            return
+        self._db.execute("DELETE FROM videos WHERE updated < ?", (now - VIDEO_TTL_DAYS * 86400,))
+        self._db.execute(
+            "DELETE FROM videos WHERE video_id IN "
+            "(SELECT video_id FROM videos ORDER BY updated DESC LIMIT -1 OFFSET ?)",
+            (MAX_VIDEOS,),
+        )
+        self._db.execute("INSERT OR REPLACE INTO meta VALUES ('compacted_at', ?)", (now,))
+
+    def rank(self, category: str = ALL, min_hits: int = 3, by: str = "lift", now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        키워드 성과 순위.
+        lift = 키워드 영상의 로그 조회수 평균 − 카테고리 전체 평균을 배율로 환산 (기하평균 비율, 1.0 = 평균),
+        recent_lift = 같은 값을 최근 가중 평균으로 계산.
+        """
+        if by not in RANK_FIELDS:
+            raise ValueError(f"지원하지 않는 정렬 기준: {by} (지원: {RANK_FIELDS})")
+        now = time.time() if now is None else now
+        cells = {
+            keyword: dict(zip(_CELL_FIELDS, values))
+            for keyword, *values in self._db.execute(
+                "SELECT keyword, hits, views_sum, log_sum, w, w_log, t_ref FROM cells WHERE category = ?", (category,))
+        }
+        base = cells.get(ALL)
+        if not base or not base["hits"]:
+            return []
+        for cell in cells.values():
+            _decay(cell, now)
+        base_mean = base["log_sum"] / base["hits"]
+        base_recent = base["w_log"] / base["w"] if base["w"] else base_mean
+        rows = []
+        for keyword, cell in cells.items():
+            if keyword == ALL or cell["hits"] < min_hits:
+                continue
+            mean_log = cell["log_sum"] / cell["hits"]
+            recent_log = cell["w_log"] / cell["w"] if cell["w"] else mean_log
+            rows.append({
+                "keyword": keyword,
+                "category": category,
+                "hits": cell["hits"],
+                "mean_views": round(cell["views_sum"] / cell["hits"]),
+                "lift": round(math.exp(mean_log - base_mean), 3),
+                "recent_lift": round(math.exp(recent_log - base_recent), 3),
+            })
+        rows.sort(key=lambda r: r[by], reverse=True)
+        return rows
+
+
+def record_run(articles: Iterable[Any], category: str, path: Optional[str] = None) -> int:
+    """실행 1회의 유튜브 항목 반영 (바뀐 키워드·영상 행만 저장). 반영한 항목 수 반환."""
+    with KeywordStats(path) as stats:
+        return stats.update(articles, category)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="키워드 성과 (유튜브 조회수 상승폭) 조회")
+    parser.add_argument("--category", default=ALL, help="카테고리 (기본: 전체)")
+    parser.add_argument("--min-hits", type=int, default=3, help="최소 영상 수")
+    parser.add_argument("--by", choices=RANK_FIELDS, default="lift", help="정렬 기준")
+    parser.add_argument("--top", type=int, default=30, help="출력 개수")
+    args = parser.parse_args()
+    with KeywordStats() as stats:
+        rows = stats.rank(args.category, args.min_hits, args.by)
+    if not rows:
+        print("집계된 데이터가 없습니다.")
+        return
+    print(f"{'키워드':<12}{'영상':>6}{'평균 조회수':>14}{'상승폭':>9}{'최근':>9}")
+    for r in rows[:args.top]:
+        print(f"{r['keyword']:<12}{r['hits']:>6}{r['mean_views']:>14,}{r['lift']:>9.2f}{r['recent_lift']:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
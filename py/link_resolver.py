@@ -0,0 +1,225 @@
+"""
+구글 뉴스 리다이렉트 링크 → 언론사 원문 URL 변환
+RSS의 news.google.com/rss/articles/... 링크를 백그라운드 스레드 풀에서 변환하고
+결과를 디스크 캐시에 저장하여 같은 링크는 한 번만 변환합니다.
+
+사용 흐름:
+    resolver = get_resolver()
+    resolver.submit(url)                      # RSS 파싱 시 (즉시 반환)
+    ... 다른 출처 수집 계속 ...
+    resolver.apply(articles, timeout=15)      # 병합 전에 item.url 교체 (표준 URL로)
+    resolver.save()
+"""
+
+import base64
+import binascii
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+import http_client
+import run_report
+from url_canon import canonical_url
+
+GOOGLE_NEWS_HOST = "news.google.com"
+
+MAX_WORKERS = 8
+RESOLVE_TIMEOUT = 15.0  # apply()에서 기다리는 최대 시간 (초)
+CACHE_TTL_DAYS = 90  # 변환 성공 캐시 유지 기간
+NEGATIVE_TTL_DAYS = 1  # 변환 실패 캐시 유지 기간 (이후 재시도)
+CACHE_MAX_ENTRIES = 50_000
+
+_URL_IN_BYTES_RE = re.compile(rb"https?://[\x21-\x7e]+")
+_URL_IN_HTML_RE = re.compile(r'data-n-au="(https?://[^"]+)"')
+
+
+def default_cache_path() -> str:
+    """기본 캐시 경로: 프로젝트 루트 history/google_redirects.json."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, "history", "google_redirects.json")
+
+
+def needs_resolution(url: str) -> bool:
+    """구글 뉴스 리다이렉트 링크인지."""
+    parts = urlsplit(url or "")
+    return parts.hostname == GOOGLE_NEWS_HOST and "/articles/" in parts.path
+
+
+def _decode_article_id(url: str) -> str:
+    """
+    링크의 기사 ID(base64)에 원문 URL이 들어 있으면 네트워크 없이 추출.
+    (예전 형식 ID만 해당, 새 형식은 "")
+    """
+    article_id = urlsplit(url).path.rstrip("/").rsplit("/", 1)[-1]
+    try:
+        raw = base64.urlsafe_b64decode(article_id + "=" * (-len(article_id) % 4))
+    except (binascii.Error, ValueError):
+        return ""
+    match = _URL_IN_BYTES_RE.search(raw)
+    return match.group(0).decode("ascii") if match else ""
+
+
+def _follow(url: str) -> str:
+    """리다이렉트를 따라가 원문 URL 확인 (실패 시 "")."""
+    resp = http_client.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10)
+    final = resp.url or ""
+    if final and urlsplit(final).hostname not in (GOOGLE_NEWS_HOST, None):
+        return final
+    # 중간 안내 페이지에 원문 링크가 들어 있는 경우
+    match = _URL_IN_HTML_RE.search(resp.text or "")
+    return match.group(1) if match else ""
+
+
+def resolve_url(url: str) -> str:
+    """리다이렉트 링크 1개 변환 (실패 시 "")."""
+    return _decode_article_id(url) or _follow(url)
+
+
+class LinkResolver:
+    """리다이렉트 링크 변환기 (스레드 풀 + 디스크 캐시)."""
+
+    def __init__(self, cache_path: Optional[str] = None, max_workers: int = MAX_WORKERS) -> None:
+        self.cache_path = cache_path or default_cache_path()
+        self.max_workers = max_workers
+        self._cache: Optional[Dict[str, list]] = None
+        self._futures: Dict[str, Future] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    # ========== 캐시 ==========
+
+    def _load(self) -> Dict[str, list]:
+        if self._cache is None:
+            try:
+                with open(self.cache_path, "r", encoding="utf-8") as f:
+                    self._cache = json.load(f)
+            except (OSError, ValueError):
+                self._cache = {}
+        return self._cache
+
+    def cached(self, url: str) -> Optional[str]:
+        """캐시된 원문 URL (실패 기록이면 "", 없거나 만료면 None)."""
+        with self._lock:
+            entry = self._load().get(url)
+        if not entry:
+            return None
+        resolved, ts = entry
+        ttl = CACHE_TTL_DAYS if resolved else NEGATIVE_TTL_DAYS
+        if time.time() - ts > ttl * 86400:
+            return None
+        return resolved
+
+    def _store(self, url: str, resolved: str) -> None:
+        with self._lock:
+            self._load()[url] = [resolved, int(time.time())]
+            self._dirty = True
+
+    def save(self) -> None:
+        """캐시 저장 (만료 항목 정리, 임시 파일 후 교체)."""
+        with self._lock:
+            if not self._dirty or self._cache is None:
+                return
+            now = time.time()
+            entries = {
+                url: entry for url, entry in self._cache.items()
+                if now - entry[1] <= (CACHE_TTL_DAYS if entry[0] else NEGATIVE_TTL_DAYS) * 86400
+            }
+            if len(entries) > CACHE_MAX_ENTRIES:
+                newest = sorted(entries.items(), key=lambda kv: kv[1][1], reverse=True)[:CACHE_MAX_ENTRIES]
+                entries = dict(newest)
+            self._cache = entries
+            self._dirty = False
+        os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+        tmp_path = self.cache_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False)
+        os.replace(tmp_path, self.cache_path)
+
+    # ========== 변환 ==========
+
+    def _resolve_and_store(self, url: str) -> str:
+        try:
+            resolved = resolve_url(url)
+        except requests.RequestException:
+            resolved = ""
+        self._store(url, resolved)
+        return resolved
+
+    def submit(self, url: str) -> None:
+        """변환 예약 (즉시 반환). 캐시에 있거나 리다이렉트 링크가 아니면 무시."""
+        if not needs_resolution(url):
+            return
+        hit = self.cached(url) is not None
+        run_report.record_cache("google_redirect", hit)
+        if hit:
+            return
+        with self._lock:
+            if url in self._futures:
+                return
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="resolver")
+            # 변환 요청은 예약한 단계(google.collect 등)에 합산
+            self._futures[url] = self._pool.submit(run_report.bind(self._resolve_and_store), url)
+
+    def apply(self, articles: Iterable, timeout: float = RESOLVE_TIMEOUT) -> int:
+        """
+        Article 목록의 리다이렉트 링크를 원문 URL로 교체.
+        예약된 변환을 최대 timeout초 기다리며, 끝나지 않은 링크는 그대로 둡니다.
+
+        Returns:
+            교체한 건수
+        """
+        articles = [a for a in articles if needs_resolution(a.url)]
+        for a in articles:
+            self.submit(a.url)
+        with self._lock:
+            pending = [self._futures[a.url] for a in articles if a.url in self._futures]
+        if pending:
+            wait(pending, timeout=timeout)
+        replaced = 0
+        for a in articles:
+            resolved = self.cached(a.url)
+            if resolved:
+                a.url = canonical_url(resolved)
+                replaced += 1
+        return replaced
+
+    def shutdown(self) -> None:
+        """대기 중인 변환 취소 (진행 중인 요청은 끝까지) 후 캐시 저장."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self._futures.clear()
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        self.save()
+
+
+_default: Optional[LinkResolver] = None
+_default_lock = threading.Lock()
+
+
+def get_resolver() -> LinkResolver:
+    """프로세스 공용 변환기."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = LinkResolver()
+        return _default
+
+
+def configure_resolver(cache_path: Optional[str] = None) -> LinkResolver:
+    """공용 변환기를 cache_path 캐시를 쓰는 새 변환기로 교체 (카세트 재생 등). 이전 변환기는 정리 후 저장."""
+    global _default
+    with _default_lock:
+        previous, _default = _default, LinkResolver(cache_path)
+    if previous is not None:
+        previous.shutdown()
+    return _default
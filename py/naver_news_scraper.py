@@ -1,18 +1,27 @@
 """
 네이버 뉴스 수집 (스크래핑 + API 병행)
-- 스크래핑: '가장 많이 본 뉴스' 경제/사회 섹션 (인증 불필요)
+- 스크래핑: '가장 많이 본 뉴스' 섹션 100~105를 동시에 받아 한 번만 파싱한 스냅샷 (인증 불필요, 실행 동안 재사용)
 - API: 뉴스 검색 API (Client ID + Secret 있으면 추가 수집)
 """
 
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from email.utils import parsedate_to_datetime
-from typing import List
+from typing import Container, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import quote_plus, urljoin
 
-import requests
 from bs4 import BeautifulSoup
 
+import http_client
+import run_report
+from article import Article
+from circuit_breaker import get_breaker
+from url_canon import SeenSet, canonical_url
+
 try:
     from dotenv import load_dotenv
     load_dotenv()
@@ -23,11 +32,23 @@ except ImportError:
 RANKING_URL = "https://news.naver.com/main/ranking/popularDay.naver"
 SECTION_ECONOMY = 101
 SECTION_SOCIETY = 102
+# 랭킹 스냅샷에서 한 번에 받는 섹션
+RANKING_SECTIONS = {
+    "100": "정치", "101": "경제", "102": "사회",
+    "103": "생활/문화", "104": "세계", "105": "IT/과학",
+}
+# 카테고리 → 랭킹 섹션 (없는 카테고리는 정치)
+CATEGORY_SECTIONS = {"정치": 100, "경제": 101, "사회": 102, "장년": 103}
+RANKING_PARSE_LIMIT = 200  # 섹션당 파싱 최대 기사 수
+SNAPSHOT_MAX_AGE = 600  # 스냅샷 재사용 시간 (초)
 
 # API 검색 키워드 (구글/유튜브와 동일)
 SEARCH_QUERIES = ["급락", "단독", "최초", "국세청", "폭락"]
 
 NAVER_NEWS_API = "https://openapi.naver.com/v1/search/news.json"
+# 검색 API 한 페이지 최대 건수, start 최대값 (API 제한)
+NAVER_API_PAGE_SIZE = 100
+NAVER_API_MAX_START = 1000
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
@@ -47,20 +68,119 @@ def _strip_html(text: str) -> str:
 
 
 def _fetch_ranking_page(sid1: int) -> str:
-    """랭킹 페이지 HTML 조회."""
-    try:
-        resp = requests.get(RANKING_URL, params={"sid1": sid1}, headers=HEADERS, timeout=15)
+    """랭킹 페이지 HTML 조회 (요청 오류는 그대로 발생)."""
+    with run_report.stage("naver.ranking", sid1=sid1):
+        resp = http_client.get(RANKING_URL, params={"sid1": sid1}, headers=HEADERS, timeout=15)
         resp.raise_for_status()
         resp.encoding = resp.apparent_encoding or "utf-8"
         return resp.text
-    except requests.RequestException as e:
-        raise RuntimeError(f"네이버 뉴스 페이지 조회 실패 (sid1={sid1}): {e}") from e
 
 
-def _extract_from_html(html: str, limit: int = 20) -> List[dict]:
+def _parse_ranking(html: str, limit: int) -> List[Article]:
+    """랭킹 페이지 파싱 (실행 리포트에 파싱 시간 기록)."""
+    with run_report.stage("naver.parse") as st:
+        items = _extract_from_html(html, limit)
+        st["items"] = len(items)
+    return items
+
+
+class RankingSnapshot:
+    """
+    랭킹 섹션 전체를 한 번에 받아 파싱한 결과.
+    섹션별 (제목, URL) 목록만 보관하고, 읽을 때마다 새 Article을 만들어 돌려줍니다
+    (호출자가 section·category·점수를 바꿔도 스냅샷은 그대로).
+    """
+
+    def __init__(self, entries: Dict[str, List[Tuple[str, str]]], errors: Dict[str, str]) -> None:
+        self.entries = entries
+        self.errors = errors
+        self.fetched_at = time.time()
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+    def items(self, sid1: int, limit: Optional[int] = None) -> List[Article]:
+        """섹션 기사 (상위 limit개). 이 섹션 조회·파싱에 실패했으면 경고 후 빈 목록."""
+        sid1 = str(sid1)
+        if sid1 not in self.entries:
+            reason = self.errors.get(sid1, "스냅샷에 없는 섹션")
+            print(f"[경고] 네이버 랭킹 섹션 없음 (sid1={sid1}): {reason}")
+            return []
+        section = RANKING_SECTIONS.get(sid1, "기타")
+        return [
+            Article(title=title, url=url, source="네이버뉴스", section=section)
+            for title, url in self.entries[sid1][:limit]
+        ]
+
+
+def _download_section(sid1: str) -> List[Tuple[str, str]]:
+    html = _fetch_ranking_page(int(sid1))
+    return [(a.title, a.url) for a in _parse_ranking(html, RANKING_PARSE_LIMIT)]
+
+
+def fetch_ranking_snapshot(sections: Iterable[str] = RANKING_SECTIONS) -> RankingSnapshot:
+    """
+    랭킹 섹션을 동시에 조회·파싱 (차단기에는 스냅샷 1회를 호출 1건으로 반영).
+    섹션별 조회·파싱 오류는 errors에 기록하고 나머지는 그대로 쓰며, 전부 실패하면 RuntimeError.
+    """
+    sections = [str(s) for s in sections]
+    breaker = get_breaker("naver.ranking")
+    breaker.check()
+    entries: Dict[str, List[Tuple[str, str]]] = {}
+    errors: Dict[str, str] = {}
+    first_error: Optional[Exception] = None
+    with run_report.stage("naver.snapshot", sections=len(sections)) as st:
+        with ThreadPoolExecutor(max_workers=len(sections) or 1, thread_name_prefix="naver-ranking") as pool:
+            futures = {sid1: pool.submit(run_report.bind(_download_section), sid1) for sid1 in sections}
+        for sid1, future in futures.items():
+            try:
+                entries[sid1] = future.result()
+            except Exception as e:  # 요청 오류뿐 아니라 페이지 구조 변경 등 파싱 오류도 섹션 단위로 격리
+                errors[sid1] = f"{type(e).__name__}: {e}"
+                first_error = first_error or e
+                run_report.record_event("naver_section_failed", sid1=sid1, error=errors[sid1])
+        st["items"] = sum(len(v) for v in entries.values())
+    if entries or first_error is None:
+        breaker.record_success()
+    else:
+        breaker.record_failure(first_error)
+        raise RuntimeError(f"네이버 뉴스 랭킹 조회 실패: {first_error}") from first_error
+    return RankingSnapshot(entries, errors)
+
+
+_snapshot: Optional[RankingSnapshot] = None
+_snapshot_lock = threading.Lock()
+
+
+def get_ranking_snapshot(max_age: float = SNAPSHOT_MAX_AGE) -> RankingSnapshot:
+    """
+    프로세스 공용 랭킹 스냅샷 (max_age초가 지났으면 다시 조회).
+    여러 카테고리를 한 번에 갱신해도 랭킹 페이지는 1회만 받습니다.
+    """
+    global _snapshot
+    with _snapshot_lock:
+        if _snapshot is None or _snapshot.age > max_age:
+            _snapshot = fetch_ranking_snapshot()
+        return _snapshot
+
+
+def reset_ranking_snapshot() -> None:
+    """스냅샷 폐기 (다음 조회 시 새로 받음)."""
+    global _snapshot
+    with _snapshot_lock:
+        _snapshot = None
+
+
+def section_for_category(category: str) -> int:
+    """카테고리 → 랭킹 섹션 코드 (매핑이 없으면 정치 100)."""
+    return CATEGORY_SECTIONS.get(category, 100)
+
+
+def _extract_from_html(html: str, limit: int = 20) -> List[Article]:
     """HTML에서 기사 제목과 URL 추출."""
     soup = BeautifulSoup(html, "html.parser")
-    seen_urls = set()
+    seen_urls = SeenSet()
     articles = []
 
     for a in soup.find_all("a", href=True):
@@ -68,7 +188,8 @@ def _extract_from_html(html: str, limit: int = 20) -> List[dict]:
         if "n.news.naver.com/article" not in href or "ntype=RANKING" not in href:
             continue
 
-        url = urljoin("https://news.naver.com", href)
+        # ?ntype=RANKING 등 제거 → 검색 API 결과와 같은 표준 URL
+        url = canonical_url(urljoin("https://news.naver.com", href))
         if url in seen_urls:
             continue
 
@@ -77,7 +198,7 @@ def _extract_from_html(html: str, limit: int = 20) -> List[dict]:
             continue
 
         seen_urls.add(url)
-        articles.append({"title": title, "url": url, "source": "네이버뉴스", "section": ""})
+        articles.append(Article(title=title, url=url, source="네이버뉴스"))
         if len(articles) >= limit:
             break
 
@@ -87,23 +208,23 @@ def _extract_from_html(html: str, limit: int = 20) -> List[dict]:
 # ========== API (뉴스 검색) ==========
 
 
-def _fetch_naver_api(client_id: str, client_secret: str, query: str, display: int = 10) -> List[dict]:
-    """네이버 뉴스 검색 API 호출."""
+def _fetch_naver_api(client_id: str, client_secret: str, query: str, display: int = 10, start: int = 1) -> List[Article]:
+    """네이버 뉴스 검색 API 호출 (1페이지, 최신순)."""
     headers = {
         "X-Naver-Client-Id": client_id,
         "X-Naver-Client-Secret": client_secret,
     }
-    params = {"query": query, "display": min(display, 100), "sort": "date"}
+    params = {"query": query, "display": min(display, NAVER_API_PAGE_SIZE), "start": start, "sort": "date"}
 
     try:
-        resp = requests.get(NAVER_NEWS_API, params=params, headers=headers, timeout=15)
+        resp = http_client.get(NAVER_NEWS_API, params=params, headers=headers, timeout=15)
         resp.raise_for_status()
         data = resp.json()
         items = data.get("items", [])
         results = []
         for item in items:
             title = _strip_html(item.get("title", ""))
-            url = item.get("link") or item.get("originallink", "")
+            url = canonical_url(item.get("link") or item.get("originallink", ""))
             raw_pub = item.get("pubDate") or ""
             upload_date = ""
             if raw_pub:
@@ -114,22 +235,67 @@ def _fetch_naver_api(client_id: str, client_secret: str, query: str, display: in
                     if len(raw_pub) >= 10 and raw_pub[4] == "-":
                         upload_date = raw_pub[:10]
             if title and url:
-                results.append({
-                    "title": title,
-                    "url": url,
-                    "source": "네이버뉴스",
-                    "section": "API",
-                    "upload_date": upload_date,
-                })
+                results.append(Article(
+                    title=title,
+                    url=url,
+                    source="네이버뉴스",
+                    section="API",
+                    upload_date=upload_date,
+                ))
+        get_breaker("naver.api").record_success()
         return results
-    except Exception:
+    except Exception as e:
+        get_breaker("naver.api").record_failure(e)
         return []
 
 
+def _collect_naver_api(
+    client_id: str,
+    client_secret: str,
+    query: str,
+    limit: int,
+    days_back: int = 7,
+    seen_urls: Optional[SeenSet] = None,
+    known: Optional[Container[str]] = None,
+) -> List[Article]:
+    """
+    검색 API 페이지 단위 수집.
+    큰 페이지(최대 100건)로 start를 넘기며 새 URL limit개를 모으면 중단하고,
+    최신순 결과가 days_back 이전 기사에 도달하거나 마지막 페이지면 더 요청하지 않습니다.
+    seen_urls가 주어지면 중복 확인에 사용하고 새로 모은 URL을 추가합니다.
+    known(이전 실행에서 처리한 기사 색인)이 주어지면 아는 기사가 나온 페이지에서 중단합니다
+    (최신순이므로 그 뒤는 이미 처리한 기간).
+    """
+    seen_urls = SeenSet() if seen_urls is None else seen_urls
+    cutoff = (http_client.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
+    results = []
+    start = 1
+    while len(results) < limit and start <= NAVER_API_MAX_START:
+        page = _fetch_naver_api(client_id, client_secret, query, display=NAVER_API_PAGE_SIZE, start=start)
+        passed_cutoff = reached_known = False
+        for item in page:
+            if item.upload_date and item.upload_date < cutoff:
+                passed_cutoff = True
+                break
+            if known is not None and item.url in known:
+                reached_known = True
+            if item.url in seen_urls:
+                continue
+            seen_urls.add(item.url)
+            item.queries = (query,)
+            results.append(item)
+            if len(results) >= limit:
+                break
+        if passed_cutoff or reached_known or len(page) < NAVER_API_PAGE_SIZE:
+            break
+        start += NAVER_API_PAGE_SIZE
+    return results
+
+
 # ========== 통합 ==========
 
 
-def scrape_ranking_news(economy_count: int = 10, society_count: int = 10, total_limit: int = 30, sid1: int = 101, query_list: List[str] = None, days_back: int = 7) -> List[dict]:
+def scrape_ranking_news(economy_count: int = 10, society_count: int = 10, total_limit: int = 30, sid1: int = 101, query_list: List[str] = None, days_back: int = 7, known: Optional[Container[str]] = None, snapshot: Optional[RankingSnapshot] = None) -> List[Article]:
     """
     네이버 뉴스 수집 (랭킹 + API).
     
@@ -139,47 +305,45 @@ def scrape_ranking_news(economy_count: int = 10, society_count: int = 10, total_
         total_limit: 전체 최대 결과 수
         sid1: 섹션 코드 (100=정치, 101=경제, 102=사회 등)
         query_list: 검색 키워드 리스트 (API 사용시)
-        days_back: 검색 기간 (일 단위, 랭킹에는 미적용)
+        days_back: 검색 API 수집 기간 (일 단위, 랭킹에는 미적용)
+        known: 이전 실행에서 처리한 기사 색인 (검색 API 페이지 조기 중단용)
+        snapshot: 랭킹 스냅샷 (None이면 프로세스 공용 스냅샷 사용)
     
     Returns:
-        [{"title": str, "url": str, "source": "네이버뉴스", "section": str}, ...]
+        [Article(title, url, source="네이버뉴스", section, upload_date), ...]
     """
-    seen_urls = set()
+    seen_urls = SeenSet()
     results = []
 
-    # 1. 스크래핑 (가장 많이 본 뉴스) - 항상
+    # 1. 스크래핑 (가장 많이 본 뉴스) - 항상, 전체 섹션을 한 번에 받은 스냅샷에서 읽음
+    # 랭킹을 못 받아도 아래 검색 API 수집은 그대로 진행
+    if snapshot is None:
+        try:
+            snapshot = get_ranking_snapshot()
+        except RuntimeError as e:  # 전 섹션 실패·차단(SourceUnavailable) 포함
+            snapshot = RankingSnapshot({}, {sid: str(e) for sid in RANKING_SECTIONS})
     if sid1:
         # 특정 섹션 지정 시
-        html = _fetch_ranking_page(int(sid1))
         # 수집 개수는 total_limit 만큼 (경제+사회 나누지 않음)
-        count = total_limit
-        # 섹션 이름 매핑 (단순화)
-        section_name = "경제" if str(sid1) == "101" else "사회" if str(sid1) == "102" else "기타"
-        
-        for item in _extract_from_html(html, count):
-            item["section"] = section_name
-            if item["url"] not in seen_urls:
-                seen_urls.add(item["url"])
+        for item in snapshot.items(sid1, total_limit):
+            if item.url not in seen_urls:
+                seen_urls.add(item.url)
                 results.append(item)
             if len(results) >= total_limit:
                 break
     else:
         # 기본 동작 (경제+사회 병행)
-        html_econ = _fetch_ranking_page(SECTION_ECONOMY)
-        for item in _extract_from_html(html_econ, economy_count):
-            item["section"] = "경제"
-            if item["url"] not in seen_urls:
-                seen_urls.add(item["url"])
+        for item in snapshot.items(SECTION_ECONOMY, economy_count):
+            if item.url not in seen_urls:
+                seen_urls.add(item.url)
                 results.append(item)
             if len(results) >= total_limit:
                 return results[:total_limit] # 여기서 break 하면 아래 함수 종료되므로 return이 나을 수도, 일단 로직 유지
 
         if len(results) < total_limit:
-            html_soc = _fetch_ranking_page(SECTION_SOCIETY)
-            for item in _extract_from_html(html_soc, society_count):
-                item["section"] = "사회"
-                if item["url"] not in seen_urls:
-                    seen_urls.add(item["url"])
+            for item in snapshot.items(SECTION_SOCIETY, society_count):
+                if item.url not in seen_urls:
+                    seen_urls.add(item.url)
                     results.append(item)
                 if len(results) >= total_limit:
                     break
@@ -192,14 +356,19 @@ def scrape_ranking_news(economy_count: int = 10, society_count: int = 10, total_
     queries = query_list if query_list else SEARCH_QUERIES
 
     if client_id and client_secret:
+        api_breaker = get_breaker("naver.api")
         for query in queries:
-            if len(results) >= total_limit:
+            if len(results) >= total_limit or not api_breaker.allow():
                 break
-            for item in _fetch_naver_api(client_id, client_secret, query, display=5):
-                if item["url"] not in seen_urls:
-                    seen_urls.add(item["url"])
-                    results.append(item)
-                if len(results) >= total_limit:
-                    break
+            with run_report.stage("naver.api", query=query, days_back=days_back) as st:
+                items = _collect_naver_api(
+                    client_id, client_secret, query,
+                    limit=total_limit - len(results),
+                    days_back=days_back,
+                    seen_urls=seen_urls,
+                    known=known,
+                )
+                st["items"] = len(items)
+            results.extend(items)
 
     return results[:total_limit]
@@ -0,0 +1,211 @@
+"""
+웹 데이터 게시 (git 커밋 + 백그라운드 푸시)
+- 내보낸 파일의 내용 해시(git blob 해시)를 HEAD와 비교하여 실제로 바뀐 파일만 커밋
+- 바뀐 파일이 없으면 커밋·푸시 모두 생략
+- 푸시는 별도 프로세스에서 실행하여 수집 실행을 막지 않음
+- 푸시 중에 다시 게시되면 대기 표시만 남기고, 진행 중인 푸시가 끝난 뒤 한 번 더 푸시 (여러 카테고리 갱신을 1회 푸시로 합침)
+
+푸시 작업 프로세스:
+    python py/publisher.py --push [--repo DIR] [--remote origin] [--branch main]
+"""
+
+import argparse
+import hashlib
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PUBLISH_REMOTE = "origin"
+PUBLISH_BRANCH = "main"
+
+# 푸시 잠금·대기 표시 파일 (.git 폴더 안, 작업 트리에 남지 않음)
+LOCK_NAME = "aggro-publish.lock"
+PENDING_NAME = "aggro-publish.pending"
+LOG_NAME = "aggro-publish.log"
+# 잠금 파일이 이 시간(초)보다 오래되면 비정상 종료로 보고 무시
+STALE_LOCK_S = 600
+
+
+def _git(args: List[str], repo_dir: str, check: bool = True) -> subprocess.CompletedProcess:
+    return subprocess.run(["git", *args], cwd=repo_dir, capture_output=True, text=True, check=check)
+
+
+def blob_hash(path: str) -> str:
+    """파일 내용의 git blob 해시 (git hash-object와 동일)."""
+    h = hashlib.sha1()
+    h.update(f"blob {os.path.getsize(path)}\0".encode("ascii"))
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _head_hashes(rel_paths: List[str], repo_dir: str) -> Dict[str, str]:
+    """HEAD에 커밋된 파일별 blob 해시 (없는 파일은 제외)."""
+    if not rel_paths:
+        return {}
+    out = _git(["ls-tree", "HEAD", "--", *rel_paths], repo_dir, check=False)
+    hashes = {}
+    for line in out.stdout.splitlines():
+        meta, _, path = line.partition("\t")
+        parts = meta.split()
+        if len(parts) == 3:
+            hashes[path] = parts[2]
+    return hashes
+
+
+def changed_files(paths: Iterable[str], repo_dir: str = ROOT_DIR) -> List[str]:
+    """
+    HEAD와 내용이 다른 파일 목록 (저장소 기준 상대 경로).
+    저장소 밖의 파일, 존재하지 않는 파일은 제외합니다.
+    """
+    repo_dir = os.path.abspath(repo_dir)
+    rel_paths = []
+    for path in paths:
+        if not path:
+            continue
+        abs_path = os.path.abspath(path)
+        rel = os.path.relpath(abs_path, repo_dir)
+        if rel.startswith("..") or not os.path.isfile(abs_path):
+            continue
+        rel_paths.append(rel.replace(os.sep, "/"))
+    head = _head_hashes(rel_paths, repo_dir)
+    return [rel for rel in rel_paths if head.get(rel) != blob_hash(os.path.join(repo_dir, rel))]
+
+
+def _git_dir(repo_dir: str) -> str:
+    out = _git(["rev-parse", "--absolute-git-dir"], repo_dir)
+    return out.stdout.strip()
+
+
+def commit_changes(paths: Iterable[str], repo_dir: str = ROOT_DIR, message: Optional[str] = None) -> Optional[str]:
+    """
+    바뀐 파일만 커밋 (다른 변경·스테이징은 건드리지 않음).
+
+    Returns:
+        새 커밋 해시, 바뀐 파일이 없으면 None
+    """
+    changed = changed_files(paths, repo_dir)
+    if not changed:
+        return None
+    message = message or f"Auto: Update data files ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')})"
+    _git(["add", "--", *changed], repo_dir)
+    _git(["commit", "-m", message, "--only", "--", *changed], repo_dir)
+    return _git(["rev-parse", "HEAD"], repo_dir).stdout.strip()
+
+
+def request_push(repo_dir: str = ROOT_DIR, remote: str = PUBLISH_REMOTE, branch: str = PUBLISH_BRANCH) -> None:
+    """대기 표시를 남기고 백그라운드 푸시 프로세스 시작 (즉시 반환)."""
+    git_dir = _git_dir(repo_dir)
+    with open(os.path.join(git_dir, PENDING_NAME), "w", encoding="utf-8") as f:
+        f.write(datetime.now().isoformat(timespec="seconds"))
+    _spawn_push_worker(git_dir, repo_dir, remote, branch)
+
+
+def _spawn_push_worker(git_dir: str, repo_dir: str, remote: str, branch: str) -> None:
+    """푸시 작업 프로세스를 세션에서 분리해 실행 (출력은 .git/aggro-publish.log)."""
+    with open(os.path.join(git_dir, LOG_NAME), "a", encoding="utf-8") as log:
+        subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "--push",
+             "--repo", repo_dir, "--remote", remote, "--branch", branch],
+            cwd=repo_dir,
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+
+
+def publish(
+    paths: Iterable[str],
+    repo_dir: str = ROOT_DIR,
+    message: Optional[str] = None,
+    push: bool = True,
+    remote: str = PUBLISH_REMOTE,
+    branch: str = PUBLISH_BRANCH,
+) -> Optional[str]:
+    """
+    게시: 바뀐 파일만 커밋하고 백그라운드 푸시 요청.
+
+    Returns:
+        새 커밋 해시, 바뀐 파일이 없으면 None
+    """
+    commit = commit_changes(paths, repo_dir, message)
+    if commit is None:
+        print("[Git] 변경된 데이터 파일 없음 → 커밋·푸시 생략")
+        return None
+    print(f"[Git] 커밋 완료: {commit[:7]}")
+    if push:
+        request_push(repo_dir, remote, branch)
+        print("[Git] 푸시는 백그라운드에서 진행됩니다.")
+    return commit
+
+
+# ========== 푸시 작업 프로세스 ==========
+
+
+def _acquire_lock(path: str) -> bool:
+    try:
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        try:
+            if time.time() - os.path.getmtime(path) < STALE_LOCK_S:
+                return False
+            os.remove(path)
+        except OSError:
+            return False
+        return _acquire_lock(path)
+    with os.fdopen(fd, "w") as f:
+        f.write(str(os.getpid()))
+    return True
+
+
+def run_push_worker(repo_dir: str, remote: str, branch: str) -> int:
+    """
+    대기 표시가 남아 있는 동안 푸시 반복. 다른 작업 프로세스가 푸시 중이면 바로 종료
+    (그 프로세스가 끝나기 전에 대기 표시를 다시 확인).
+
+    Returns:
+        실행한 푸시 횟수
+    """
+    git_dir = _git_dir(repo_dir)
+    lock_path = os.path.join(git_dir, LOCK_NAME)
+    pending_path = os.path.join(git_dir, PENDING_NAME)
+    pushes = 0
+    # 바깥 반복: 잠금 해제 직전에 들어온 요청이 있으면 다시 잠금을 잡고 한 번 더
+    while os.path.exists(pending_path):
+        if not _acquire_lock(lock_path):
+            break
+        try:
+            while os.path.exists(pending_path):
+                os.remove(pending_path)
+                result = _git(["push", remote, branch], repo_dir, check=False)
+                pushes += 1
+                stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                if result.returncode == 0:
+                    print(f"[{stamp}] 푸시 완료 ({remote} {branch})", flush=True)
+                else:
+                    print(f"[{stamp}] 푸시 실패: {result.stderr.strip()}", flush=True)
+        finally:
+            os.remove(lock_path)
+    return pushes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="웹 데이터 게시 (백그라운드 푸시)")
+    parser.add_argument("--push", action="store_true", help="대기 중인 푸시 실행 (작업 프로세스용)")
+    parser.add_argument("--repo", default=ROOT_DIR)
+    parser.add_argument("--remote", default=PUBLISH_REMOTE)
+    parser.add_argument("--branch", default=PUBLISH_BRANCH)
+    args = parser.parse_args()
+    if args.push:
+        run_push_worker(args.repo, args.remote, args.branch)
+
+
+if __name__ == "__main__":
+    main()
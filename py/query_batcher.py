@@ -0,0 +1,71 @@
+"""
+검색 키워드 OR 묶음 계획
+API 호출 수(유튜브 검색 100 유닛/회, NewsAPI 일일 요청 한도)를 줄이기 위해
+키워드 여러 개를 API의 OR 문법으로 묶어 한 번에 검색하고,
+결과를 실제로 일치하는 키워드에 다시 배정합니다.
+"""
+
+import re
+from typing import Iterable, List, Optional
+
+
+def _quote(keyword: str) -> str:
+    """공백이 있는 키워드는 구문 검색(따옴표)으로."""
+    keyword = keyword.strip().replace('"', "")
+    return f'"{keyword}"' if " " in keyword else keyword
+
+
+def build_query(keywords: Iterable[str], separator: str = " OR ") -> str:
+    """키워드 묶음 → 검색어 문자열 (예: 국세청 OR "세계 최초")."""
+    return separator.join(_quote(k) for k in keywords)
+
+
+def plan_batches(
+    keywords: Iterable[str],
+    max_length: int,
+    separator: str = " OR ",
+    max_terms: Optional[int] = None,
+) -> List[List[str]]:
+    """
+    키워드를 입력 순서대로 OR 묶음으로 나눔 (검색어 길이 max_length, 묶음당 max_terms개 이하).
+    중복·빈 키워드는 제외하며, 혼자서 길이를 넘는 키워드는 단독 묶음이 됩니다.
+    """
+    batches: List[List[str]] = []
+    current: List[str] = []
+    seen = set()
+    for keyword in keywords:
+        keyword = (keyword or "").strip()
+        if not keyword or keyword in seen:
+            continue
+        seen.add(keyword)
+        candidate = current + [keyword]
+        too_long = len(build_query(candidate, separator)) > max_length
+        too_many = max_terms is not None and len(candidate) > max_terms
+        if current and (too_long or too_many):
+            batches.append(current)
+            current = [keyword]
+        else:
+            current = candidate
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _compact(text: str) -> str:
+    return re.sub(r"\s+", "", text or "").lower()
+
+
+def match_keywords(text: str, keywords: Iterable[str]) -> List[str]:
+    """
+    text(제목 등)에 실제로 나타나는 키워드 목록.
+    띄어쓰기 차이는 무시하고, 여러 단어 키워드는 모든 단어가 있으면 일치로 봅니다.
+    """
+    compact = _compact(text)
+    matched = []
+    for keyword in keywords:
+        words = [_compact(w) for w in keyword.split()]
+        if not words:
+            continue
+        if _compact(keyword) in compact or all(w in compact for w in words):
+            matched.append(keyword)
+    return matched
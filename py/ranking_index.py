@@ -0,0 +1,170 @@
+"""
+카테고리별 상위 N 순위 인덱스
+점수가 매겨진 항목이 들어올 때마다 카테고리(선택: 출처)별 크기 N 힙을 갱신하여
+전체 정렬 없이 카테고리별 상위 N을 유지합니다.
+"""
+
+import heapq
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from article import Article
+
+
+def _field(item: Any, kor: str, eng: str, default: Any = "") -> Any:
+    """Article / 한글 컬럼 dict / 영문 키 dict 어느 쪽이든 값 조회."""
+    if isinstance(item, Article):
+        return getattr(item, eng, default)
+    value = item.get(kor)
+    if value is None or value == "":
+        value = item.get(eng, default)
+    return default if value is None else value
+
+
+def _score(item: Any) -> float:
+    try:
+        return float(_field(item, "추천점수", "score", 0) or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _url(item: Any) -> str:
+    if isinstance(item, Article):
+        return item.url or ""
+    return str(item.get("유튜브_URL") or item.get("뉴스기사_URL") or item.get("url") or item.get("news_url")
+               or item.get("youtube_url") or "")
+
+
+class _Entry:
+    """힙 항목. '<'는 '순위가 더 낮다'(먼저 밀려날 항목)를 의미."""
+
+    __slots__ = ("score", "tiebreak", "item", "removed")
+
+    def __init__(self, score: float, tiebreak: Tuple[str, str], item: Any) -> None:
+        self.score = score
+        self.tiebreak = tiebreak
+        self.item = item
+        self.removed = False
+
+    def __lt__(self, other: "_Entry") -> bool:
+        # 점수가 낮을수록, 동점이면 (URL, 제목)이 사전순으로 뒤일수록 순위가 낮음
+        if self.score != other.score:
+            return self.score < other.score
+        return self.tiebreak > other.tiebreak
+
+    def rank_key(self) -> Tuple[float, Tuple[str, str]]:
+        """정렬용 키 (작을수록 상위)."""
+        return (-self.score, self.tiebreak)
+
+
+class RankingIndex:
+    """
+    카테고리(선택: 출처)별 상위 N 유지 인덱스.
+
+    - add(): O(log N) 갱신, 같은 버킷의 같은 URL은 점수가 높은 쪽만 유지
+    - top(): 버킷 하나의 상위 N (N log N 정렬, 전체 데이터 정렬 없음)
+    - 동점은 (URL, 제목) 사전순으로 결정 → 입력 순서와 무관하게 같은 결과
+    """
+
+    def __init__(self, top_n: int, by_source: bool = False) -> None:
+        if top_n <= 0:
+            raise ValueError("top_n은 1 이상이어야 합니다.")
+        self.top_n = top_n
+        self.by_source = by_source
+        self._heaps: Dict[Tuple[str, ...], List[_Entry]] = {}
+        self._members: Dict[Tuple[str, ...], Dict[str, _Entry]] = {}
+
+    def _bucket(self, item: Any) -> Tuple[str, ...]:
+        category = str(_field(item, "카테고리", "category", "") or "")
+        if self.by_source:
+            return (category, str(_field(item, "출처", "source", "") or ""))
+        return (category,)
+
+    def _prune(self, heap: List[_Entry]) -> None:
+        """힙 최상단의 삭제 표시 항목 정리."""
+        while heap and heap[0].removed:
+            heapq.heappop(heap)
+
+    def add(self, item: Any) -> bool:
+        """
+        항목 1건 반영.
+
+        Returns:
+            상위 N에 포함되었으면 True
+        """
+        bucket = self._bucket(item)
+        heap = self._heaps.setdefault(bucket, [])
+        members = self._members.setdefault(bucket, {})
+
+        url = _url(item)
+        title = str(_field(item, "제목", "title", "") or "")
+        entry = _Entry(_score(item), (url, title), item)
+        member_key = url or title
+
+        old = members.get(member_key)
+        if old is not None:
+            if not old < entry:
+                return False  # 기존 항목이 같거나 더 높음
+            old.removed = True
+            del members[member_key]
+            if len(heap) > 2 * self.top_n:
+                # 삭제 표시 항목이 쌓이면 힙 재구성 (크기 상한 유지)
+                heap[:] = [e for e in heap if not e.removed]
+                heapq.heapify(heap)
+
+        if len(members) < self.top_n:
+            heapq.heappush(heap, entry)
+            members[member_key] = entry
+            return True
+
+        self._prune(heap)
+        if not heap[0] < entry:
+            return False
+
+        evicted = heapq.heapreplace(heap, entry)
+        members.pop(evicted.tiebreak[0] or evicted.tiebreak[1], None)
+        members[member_key] = entry
+        self._prune(heap)
+        return True
+
+    def update(self, items: Iterable[Any]) -> int:
+        """여러 항목 반영. 상위 N에 포함된 건수 반환."""
+        return sum(1 for item in items if self.add(item))
+
+    def discard_category(self, category: str) -> None:
+        """카테고리 전체 삭제 (해당 카테고리를 새로 수집한 경우)."""
+        for bucket in [b for b in self._heaps if b[0] == category]:
+            del self._heaps[bucket]
+            del self._members[bucket]
+
+    def buckets(self) -> List[Tuple[str, ...]]:
+        return sorted(self._heaps)
+
+    def categories(self) -> List[str]:
+        return sorted({b[0] for b in self._heaps})
+
+    def top(self, category: str, source: Optional[str] = None) -> List[Any]:
+        """
+        카테고리(및 출처)의 상위 N 항목 (점수 높은 순).
+        by_source=True에서 source를 생략하면 출처별 상위 N을 합친 목록을 반환합니다.
+        """
+        entries: List[_Entry] = []
+        for bucket, members in self._members.items():
+            if bucket[0] != category:
+                continue
+            if source is not None and self.by_source and bucket[1] != source:
+                continue
+            entries.extend(members.values())
+        entries.sort(key=_Entry.rank_key)
+        if not self.by_source or source is not None:
+            entries = entries[: self.top_n]
+        return [e.item for e in entries]
+
+    def export_items(self) -> List[Any]:
+        """모든 카테고리의 상위 N 항목 (카테고리 순, 카테고리 내 점수 높은 순)."""
+        result: List[Any] = []
+        for category in self.categories():
+            result.extend(self.top(category))
+        return result
+
+    def __len__(self) -> int:
+        return sum(len(m) for m in self._members.values())
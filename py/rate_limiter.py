@@ -0,0 +1,170 @@
+"""
+호스트별 요청 속도 제한 (토큰 버킷 + 적응형 백오프)
+- 호스트마다 초당 요청 수(rate)와 순간 허용량(burst)을 따로 설정
+- 429/5xx 응답 시 속도를 절반으로 낮추고 Retry-After(없으면 지수 백오프)만큼 대기
+- 정상 응답이 이어지면 설정 속도까지 조금씩 회복
+
+환경 변수로 덮어쓰기:
+    HTTP_RATE_LIMITS="news.google.com=1/2,newsapi.org=0.5/1"   (호스트=초당요청/순간허용량)
+"""
+
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+# 호스트별 (초당 요청 수, 순간 허용량)
+HOST_LIMITS: Dict[str, Tuple[float, int]] = {
+    "news.naver.com": (2.0, 4),
+    "openapi.naver.com": (8.0, 10),
+    "news.google.com": (2.0, 4),
+    "www.googleapis.com": (5.0, 5),
+    "newsapi.org": (1.0, 2),
+}
+DEFAULT_LIMIT: Tuple[float, int] = (5.0, 5)
+
+BACKOFF_BASE = 1.0  # Retry-After가 없을 때 첫 대기 (초)
+BACKOFF_MAX = 60.0  # 대기 상한 (초)
+RECOVERY_STEP = 0.1  # 정상 응답마다 설정 속도의 10%씩 회복
+MIN_RATE_RATIO = 1 / 16  # 속도 하한 (설정 속도 대비)
+
+
+def is_throttle_status(status: int) -> bool:
+    """속도를 낮춰야 하는 응답 (429, 5xx)."""
+    return status == 429 or 500 <= status < 600
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 (초 또는 HTTP 날짜) → 대기 초. 해석 불가면 None."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class TokenBucket:
+    """호스트 1개의 토큰 버킷. 여러 스레드에서 동시에 사용 가능."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        if rate <= 0 or burst <= 0:
+            raise ValueError("rate와 burst는 0보다 커야 합니다.")
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = int(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.failures = 0
+        self.throttled = 0
+        self.waited_s = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        if now > self.updated:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def acquire(self) -> float:
+        """토큰 1개 사용 (부족하면 대기). 대기한 초 반환."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            wait = max(self.blocked_until - now, 0.0)
+            if self.tokens < 0:
+                wait = max(wait, -self.tokens / self.rate)
+            self.waited_s += wait
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def feedback(self, status: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        응답 결과 반영.
+
+        Returns:
+            429/5xx이면 다음 요청 전 대기할 초, 아니면 None
+        """
+        with self._lock:
+            if not is_throttle_status(status):
+                self.failures = 0
+                self.rate = min(self.max_rate, self.rate + self.max_rate * RECOVERY_STEP)
+                return None
+            self.failures += 1
+            self.throttled += 1
+            self.rate = max(self.max_rate * MIN_RATE_RATIO, self.rate / 2)
+            if retry_after is None:
+                delay = min(BACKOFF_BASE * 2 ** (self.failures - 1), BACKOFF_MAX)
+            else:
+                delay = retry_after
+            # 아주 긴 Retry-After(일일 한도 등)로 실행 전체가 멈추지 않도록 대기 상한 적용
+            now = time.monotonic()
+            self.blocked_until = max(self.blocked_until, now + min(delay, BACKOFF_MAX))
+            self.tokens = min(self.tokens, 0.0)
+            return delay
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "rate": round(self.rate, 3),
+                "max_rate": self.max_rate,
+                "burst": self.burst,
+                "throttled": self.throttled,
+                "waited_s": round(self.waited_s, 3),
+            }
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def _env_limits() -> Dict[str, Tuple[float, int]]:
+    """HTTP_RATE_LIMITS 환경 변수 해석."""
+    limits = {}
+    for part in (os.getenv("HTTP_RATE_LIMITS") or "").split(","):
+        host, _, spec = part.strip().partition("=")
+        if not host or not spec:
+            continue
+        rate, _, burst = spec.partition("/")
+        try:
+            limits[host] = (float(rate), int(burst or max(1, round(float(rate)))))
+        except ValueError:
+            print(f"[경고] HTTP_RATE_LIMITS 형식 오류: {part}")
+    return limits
+
+
+def configure(host: str, rate: float, burst: Optional[int] = None) -> None:
+    """호스트 속도 설정 (이미 만들어진 버킷은 교체)."""
+    burst = burst or max(1, round(rate))
+    with _buckets_lock:
+        HOST_LIMITS[host] = (rate, burst)
+        _buckets[host] = TokenBucket(rate, burst)
+
+
+def bucket_for(url: str) -> TokenBucket:
+    """URL의 호스트 버킷 (없으면 설정값으로 생성)."""
+    host = urlsplit(url).hostname or "unknown"
+    bucket = _buckets.get(host)
+    if bucket is not None:
+        return bucket
+    with _buckets_lock:
+        if host not in _buckets:
+            rate, burst = _env_limits().get(host) or HOST_LIMITS.get(host) or DEFAULT_LIMIT
+            _buckets[host] = TokenBucket(rate, burst)
+        return _buckets[host]
+
+
+def snapshot() -> Dict[str, dict]:
+    """호스트별 현재 속도·스로틀 횟수·누적 대기 시간."""
+    with _buckets_lock:
+        buckets = dict(_buckets)
+    return {host: bucket.snapshot() for host, bucket in sorted(buckets.items())}
@@ -0,0 +1,219 @@
+"""
+키워드 사전 변경 후 저장된 점수 재계산
+aggro_keywords/*.py의 TIER_1~3을 고친 뒤 실행하면 마지막 재계산 때의 사전(history/keyword_snapshot.json)과
+비교하여 추가·삭제·등급 변경된 키워드만 골라내고, 제목 역색인으로 그 키워드가 들어간 행만 찾아
+프로세스 풀에서 나누어 다시 점수를 매긴 뒤 data.js / data.json / 엑셀 리포트를 갱신합니다.
+(다시 수집하지 않음)
+
+사용법:
+    python py/rescore.py              # 바뀐 키워드가 든 행만 재계산
+    python py/rescore.py --dry-run    # 영향 받는 행 수만 확인
+    python py/rescore.py --full       # 전체 재계산
+    python py/rescore.py --publish    # 재계산 후 게시 (바뀐 파일만 커밋 + 백그라운드 푸시)
+"""
+
+import argparse
+import json
+import os
+import sys
+from bisect import bisect_right
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "py"))
+
+import pandas as pd
+
+from aggro_analyzer import score_titles
+from aggro_keywords import AGGRO_DICTIONARY
+from web_data import load_web_data
+
+CHUNK_SIZE = 2_000  # 프로세스 1회 작업 행 수
+PARALLEL_MIN_ROWS = 5_000  # 이보다 적으면 프로세스 풀 없이 바로 계산
+
+
+def default_snapshot_path() -> str:
+    """기본 사전 기록 경로: 프로젝트 루트 history/keyword_snapshot.json."""
+    return os.path.join(ROOT_DIR, "history", "keyword_snapshot.json")
+
+
+# ========== 사전 비교 ==========
+
+
+def keyword_weights(dictionary: Dict[str, Dict[str, Any]]) -> Dict[str, float]:
+    """키워드별 가중치 합 (여러 등급에 있으면 합산, calculate_aggro_score와 동일)."""
+    weights: Dict[str, float] = defaultdict(float)
+    for data in dictionary.values():
+        for kw in set(data.get("keywords", [])):
+            if kw:
+                weights[kw] += data.get("weight", 0)
+    return dict(weights)
+
+
+def changed_keywords(old: Dict[str, Dict[str, Any]], new: Dict[str, Dict[str, Any]]) -> List[str]:
+    """추가·삭제·등급(가중치) 변경된 키워드."""
+    old_w, new_w = keyword_weights(old), keyword_weights(new)
+    return sorted(kw for kw in set(old_w) | set(new_w) if old_w.get(kw) != new_w.get(kw))
+
+
+def load_snapshot(path: Optional[str] = None) -> Optional[Dict[str, Dict[str, Any]]]:
+    """마지막 재계산 때의 사전 (없으면 None)."""
+    try:
+        with open(path or default_snapshot_path(), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_snapshot(dictionary: Dict[str, Dict[str, Any]], path: Optional[str] = None) -> None:
+    path = path or default_snapshot_path()
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    data = {
+        tier: {"keywords": sorted(set(d.get("keywords", []))), "weight": d.get("weight", 0)}
+        for tier, d in dictionary.items()
+    }
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+# ========== 키워드 → 행 색인 ==========
+
+
+class TitleIndex:
+    """
+    키워드 → 행 번호 색인.
+    제목을 한 문자열로 이어 두고 키워드 위치(str.find)를 행 번호로 바꾸며, 키워드별 결과는 캐시합니다.
+    (바뀐 키워드만 조회하므로 전체 행을 다시 계산하지 않음)
+    """
+
+    def __init__(self, titles: Iterable[str]) -> None:
+        titles = [t.replace("\n", " ") if isinstance(t, str) else "" for t in titles]
+        self._text = "\n".join(titles)
+        self._starts = [0]
+        for title in titles[:-1]:
+            self._starts.append(self._starts[-1] + len(title) + 1)
+        self._rows: Dict[str, Set[int]] = {}
+
+    def rows_containing(self, keyword: str) -> Set[int]:
+        """keyword가 제목에 들어 있는 행 번호."""
+        if not keyword or "\n" in keyword:
+            return set()
+        rows = self._rows.get(keyword)
+        if rows is None:
+            rows = set()
+            pos = self._text.find(keyword)
+            while pos != -1:
+                row = bisect_right(self._starts, pos) - 1
+                rows.add(row)
+                # 같은 행의 나머지는 건너뛰고 다음 행부터
+                next_start = self._starts[row + 1] if row + 1 < len(self._starts) else len(self._text)
+                pos = self._text.find(keyword, next_start)
+            self._rows[keyword] = rows
+        return rows
+
+    def rows_affected(self, keywords: Iterable[str]) -> Set[int]:
+        rows: Set[int] = set()
+        for kw in keywords:
+            rows |= self.rows_containing(kw)
+        return rows
+
+
+# ========== 재계산 ==========
+
+
+def _score_chunk(chunk: List[Tuple[str, Any]]) -> List[Tuple[float, str]]:
+    """(제목, 시간당조회수) 묶음 → (점수, 키워드) (프로세스 풀 작업 단위)."""
+    titles = [title for title, _ in chunk]
+    velocities = [velocity for _, velocity in chunk]
+    return [(score, ", ".join(matched)) for score, matched in score_titles(titles, velocities)]
+
+
+def rescore_rows(rows: List[Dict[str, Any]], indices: Iterable[int], workers: Optional[int] = None) -> int:
+    """
+    지정한 행의 추천점수·키워드를 현재 사전으로 다시 계산 (제자리 수정).
+    행이 많고 CPU가 여러 개면 CHUNK_SIZE씩 나누어 프로세스 풀에서 계산합니다.
+
+    Returns:
+        점수나 키워드가 바뀐 행 수
+    """
+    indices = sorted(indices)
+    payload = [(rows[i].get("제목") or "", rows[i].get("시간당조회수")) for i in indices]
+    chunks = [payload[i:i + CHUNK_SIZE] for i in range(0, len(payload), CHUNK_SIZE)]
+    workers = workers or os.cpu_count() or 1
+    if len(payload) < PARALLEL_MIN_ROWS or workers == 1:
+        scored = [r for chunk in chunks for r in _score_chunk(chunk)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            scored = [r for part in pool.map(_score_chunk, chunks) for r in part]
+    changed = 0
+    for i, (score, keywords) in zip(indices, scored):
+        row = rows[i]
+        if row.get("추천점수") != score or (row.get("키워드") or "") != keywords:
+            row["추천점수"] = score
+            row["키워드"] = keywords
+            changed += 1
+    return changed
+
+
+def rescore(full: bool = False, dry_run: bool = False, workers: Optional[int] = None, publish: bool = False) -> Dict[str, Any]:
+    """
+    저장된 웹 데이터 점수 재계산.
+
+    Returns:
+        {"keywords": 바뀐 키워드 수, "affected": 대상 행 수, "changed": 실제 바뀐 행 수, "paths": 출력 경로}
+    """
+    from excel_reporter import export_all
+
+    rows, status = load_web_data()
+    old = load_snapshot()
+    if old is None and not full:
+        print("[재계산] 이전 키워드 사전 기록이 없어 전체 재계산합니다.")
+        full = True
+    keywords = [] if full else changed_keywords(old, AGGRO_DICTIONARY)
+    if full:
+        affected = set(range(len(rows)))
+    else:
+        affected = TitleIndex(row.get("제목") for row in rows).rows_affected(keywords)
+    summary = {"keywords": len(keywords), "affected": len(affected), "changed": 0, "paths": {}}
+    print(f"[재계산] 바뀐 키워드 {len(keywords)}개, 대상 {len(affected)}/{len(rows)}행")
+    if dry_run:
+        if keywords:
+            print("  " + ", ".join(keywords))
+        return summary
+
+    summary["changed"] = rescore_rows(rows, affected, workers) if affected else 0
+    if summary["changed"]:
+        summary["paths"] = export_all(
+            pd.DataFrame(rows),
+            sinks=("xlsx", "json", "js"),
+            per_category=True,
+            parallel=True,
+            scraper_status=status,
+        )
+        print(f"[재계산] {summary['changed']}행 점수 변경 → 웹 데이터·엑셀 갱신")
+        if publish:
+            import publisher
+            publisher.publish([summary["paths"].get("js"), summary["paths"].get("json")])
+    else:
+        print("[재계산] 점수가 바뀐 행 없음")
+    save_snapshot(AGGRO_DICTIONARY)
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="키워드 사전 변경 후 저장된 점수 재계산")
+    parser.add_argument("--full", action="store_true", help="바뀐 키워드와 관계없이 전체 재계산")
+    parser.add_argument("--dry-run", action="store_true", help="대상 행 수만 출력 (파일 변경 없음)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--publish", action="store_true", help="재계산 후 게시 (커밋 + 백그라운드 푸시)")
+    args = parser.parse_args()
+    rescore(full=args.full, dry_run=args.dry_run, workers=args.workers, publish=args.publish)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+"""
+오프라인 벤치마크 실행 스크립트
+합성 한국어 헤드라인(1k / 10k / 100k)으로 점수 계산·유사 뉴스 보강·HTML 파싱·출력 경로의
+소요 시간을 측정하고 결과를 JSON으로 저장합니다. (네트워크 불필요)
+
+사용법:
+    python py/run_benchmark.py                          # 기본 크기 전체 측정
+    python py/run_benchmark.py --sizes 1000 10000       # 크기 지정
+    python py/run_benchmark.py --fixtures DIR           # 다른 랭킹 페이지(*.html) 폴더 사용 (기본: py/bench_fixtures)
+    python py/run_benchmark.py --capture-fixtures       # 현재 랭킹 페이지를 py/bench_fixtures에 저장 (네트워크 필요)
+    python py/run_benchmark.py --compare bench/benchmark_0208_101500.json  # 이전 결과와 비교
+"""
+
+import argparse
+import glob
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "py"))
+
+import pandas as pd
+
+from aggro_analyzer import analyze_articles, calculate_aggro_score
+from aggro_keywords import AGGRO_DICTIONARY, SEARCH_TOPICS
+from article import Article
+from excel_reporter import articles_to_frame, export_to_excel, export_to_js, export_to_json
+from naver_news_scraper import _extract_from_html
+from run_all import _enrich_with_similar_news, _is_similar
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DEFAULT_OUTPUT_DIR = os.path.join(ROOT_DIR, "bench")
+# 저장소에 포함된 랭킹 페이지 HTML (bench/는 .gitignore 대상이라 py/ 아래에 둠)
+DEFAULT_FIXTURES_DIR = os.path.join(ROOT_DIR, "py", "bench_fixtures")
+# --capture-fixtures로 저장할 랭킹 섹션
+FIXTURE_SECTIONS = (100, 101)
+
+# 합성 제목용 일반 단어 (키워드 사전에 없는 단어)
+FILLER_WORDS = [
+    "정부", "서울", "올해", "시장", "기업", "국민", "지역", "관계자", "주민", "업계",
+    "전문가", "내년", "하반기", "정책", "현장", "소비자", "투자자", "대책", "가격", "수도권",
+]
+SOURCES = ["유튜브", "구글뉴스", "네이버뉴스"]
+
+
+# ========== 합성 데이터 ==========
+
+
+def make_titles(n: int, seed: int = 42) -> List[str]:
+    """키워드 사전·검색 키워드·일반 단어를 섞은 합성 헤드라인 n개."""
+    rng = random.Random(seed)
+    tier_words = [kw for data in AGGRO_DICTIONARY.values() for kw in data["keywords"]]
+    topic_words = [kw for kws in SEARCH_TOPICS.values() for kw in kws]
+    titles = []
+    for _ in range(n):
+        words = rng.sample(FILLER_WORDS, rng.randint(2, 4))
+        words += rng.sample(topic_words, rng.randint(1, 2))
+        words += rng.sample(tier_words, rng.randint(0, 3))
+        rng.shuffle(words)
+        prefix = rng.choice(["", "", "[단독] ", "[속보] ", "\"충격\" "])
+        titles.append(prefix + " ".join(words) + rng.choice(["", "…", "?", "...결국"]))
+    return titles
+
+
+def make_articles(n: int, seed: int = 42) -> List[Article]:
+    """합성 Article n개 (출처·카테고리·날짜·조회수 포함)."""
+    rng = random.Random(seed)
+    categories = list(SEARCH_TOPICS.keys())
+    articles = []
+    for i, title in enumerate(make_titles(n, seed)):
+        source = SOURCES[i % len(SOURCES)]
+        if source == "유튜브":
+            url = f"https://www.youtube.com/watch?v={i:011d}"
+            upload_date = f"2026-02-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:00:00Z"
+            views = rng.randint(100_000, 5_000_000)
+        elif source == "구글뉴스":
+            url = f"https://news.example.com/article/{i}"
+            upload_date = f"2026-02-{rng.randint(1, 28):02d}"
+            views = ""
+        else:
+            url = f"https://n.news.naver.com/article/{i % 1000:03d}/{i:010d}"
+            upload_date = f"Mon, {rng.randint(1, 28):02d} Feb 2026 {rng.randint(0, 23):02d}:00:00 +0900"
+            views = ""
+        articles.append(Article(
+            title=title,
+            url=url,
+            source=source,
+            upload_date=upload_date,
+            views=views,
+            category=rng.choice(categories),
+        ))
+    return articles
+
+
+def make_ranking_html(n_items: int = 500, seed: int = 42) -> str:
+    """네이버 '많이 본 뉴스' 랭킹 페이지 구조를 흉내 낸 합성 HTML."""
+    rng = random.Random(seed)
+    titles = make_titles(n_items, seed)
+    boxes = []
+    for press in range(0, n_items, 5):
+        links = []
+        for j, title in enumerate(titles[press:press + 5]):
+            oid = f"{press // 5:03d}"
+            aid = f"{press + j:010d}"
+            links.append(
+                f'<li><em class="list_ranking_num">{j + 1}</em><div class="list_content">'
+                f'<a href="https://n.news.naver.com/article/{oid}/{aid}?ntype=RANKING" class="list_title">{title}</a>'
+                f'<span class="list_time">{rng.randint(1, 59)}분전</span></div></li>'
+            )
+        boxes.append(
+            f'<div class="rankingnews_box"><a href="https://media.naver.com/press/{press:03d}">'
+            f'<strong class="rankingnews_name">언론사{press}</strong></a>'
+            f'<ul class="rankingnews_list">{"".join(links)}</ul>'
+            f'<a href="#" class="rankingnews_more">닫기</a></div>'
+        )
+    return (
+        "<html><head><title>랭킹</title></head><body><div class=\"rankingnews_box_wrap\">"
+        + "".join(boxes)
+        + "</div></body></html>"
+    )
+
+
+def capture_fixtures(fixtures_dir: str = DEFAULT_FIXTURES_DIR, sections: Iterable[int] = FIXTURE_SECTIONS) -> List[str]:
+    """현재 네이버 랭킹 페이지를 파싱 벤치마크용 HTML로 저장 (popularDay_sid<섹션>.html)."""
+    from naver_news_scraper import _fetch_ranking_page
+
+    os.makedirs(fixtures_dir, exist_ok=True)
+    paths = []
+    for sid1 in sections:
+        path = os.path.join(fixtures_dir, f"popularDay_sid{sid1}.html")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_fetch_ranking_page(sid1))
+        paths.append(path)
+    return paths
+
+
+def load_fixtures(fixtures_dir: Optional[str] = DEFAULT_FIXTURES_DIR) -> Dict[str, str]:
+    """저장된 랭킹 페이지 HTML 로드 (없으면 합성 페이지 1개)."""
+    pages = {}
+    if fixtures_dir:
+        for path in sorted(glob.glob(os.path.join(fixtures_dir, "*.html"))):
+            with open(path, "r", encoding="utf-8") as f:
+                pages[os.path.basename(path)] = f.read()
+    if not pages:
+        pages["synthetic_ranking.html"] = make_ranking_html()
+    return pages
+
+
+# ========== 측정 ==========
+
+
+def _fresh(path: str) -> str:
+    """출력 파일 삭제 후 경로 반환 (같은 내용 저장 생략이 측정에 섞이지 않도록)."""
+    if os.path.exists(path):
+        os.remove(path)
+    return path
+
+
+def _measure(name: str, func: Callable[[], object], size: int, repeat: int) -> dict:
+    """func를 repeat회 실행하여 최소·평균 소요 시간 기록."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    result = {
+        "name": name,
+        "size": size,
+        "repeat": repeat,
+        "min_s": round(best, 6),
+        "mean_s": round(sum(timings) / len(timings), 6),
+        "per_item_us": round(best / size * 1e6, 3) if size else None,
+    }
+    print(f"  {name:<32} n={size:<7} min={best:.4f}s  ({result['per_item_us']} µs/건)")
+    return result
+
+
+def run_benchmarks(sizes: List[int], repeat: int, fixtures: Dict[str, str], skip: List[str]) -> List[dict]:
+    """모든 벤치마크 실행."""
+    results = []
+    for size in sizes:
+        print(f"\n[n={size}]")
+        titles = make_titles(size)
+        # 큰 입력은 1회만 측정
+        rep = repeat if size <= 10_000 else 1
+
+        if "score" not in skip:
+            results.append(_measure(
+                "calculate_aggro_score", lambda: [calculate_aggro_score(t) for t in titles], size, rep))
+            articles = make_articles(size)
+            results.append(_measure(
+                "analyze_articles", lambda: analyze_articles(articles), size, rep))
+
+        if "dedup" not in skip:
+            pairs = list(zip(titles, titles[1:] + titles[:1]))
+            results.append(_measure(
+                "_is_similar", lambda: [_is_similar(a, b) for a, b in pairs], size, rep))
+            pool = analyze_articles(make_articles(size))
+            top = articles_to_frame(pool[:30])
+            results.append(_measure(
+                "_enrich_with_similar_news", lambda: _enrich_with_similar_news(top, pool), size, rep))
+
+        if "export" not in skip:
+            df = articles_to_frame(analyze_articles(make_articles(size)))
+            with tempfile.TemporaryDirectory() as tmp:
+                results.append(_measure(
+                    "export_to_excel", lambda: export_to_excel(df, _fresh(os.path.join(tmp, "r.xlsx"))), size, rep))
+                results.append(_measure(
+                    "export_to_json", lambda: export_to_json(df, _fresh(os.path.join(tmp, "d.json"))), size, rep))
+                results.append(_measure(
+                    "export_to_js", lambda: export_to_js(df, _fresh(os.path.join(tmp, "d.js"))), size, rep))
+
+    if "parse" not in skip:
+        print("\n[랭킹 페이지 파싱]")
+        for name, html in fixtures.items():
+            count = len(_extract_from_html(html, limit=10_000))
+            result = _measure(
+                f"_extract_from_html:{name}", lambda: _extract_from_html(html, limit=10_000), count, repeat)
+            result["html_bytes"] = len(html.encode("utf-8"))
+            results.append(result)
+
+    return results
+
+
+# ========== 결과 저장·비교 ==========
+
+
+def _git_revision() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except Exception:
+        return ""
+
+
+def save_results(results: List[dict], output_path: Optional[str] = None) -> str:
+    """결과를 JSON으로 저장 (기본: bench/benchmark_MMDD_HHMMSS.json)."""
+    if not output_path:
+        os.makedirs(DEFAULT_OUTPUT_DIR, exist_ok=True)
+        output_path = os.path.join(DEFAULT_OUTPUT_DIR, f"benchmark_{datetime.now().strftime('%m%d_%H%M%S')}.json")
+    payload = {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pandas": pd.__version__,
+            "keyword_counts": {grade: len(data["keywords"]) for grade, data in AGGRO_DICTIONARY.items()},
+        },
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)) or ".", exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+    return output_path
+
+
+def compare_results(results: List[dict], baseline_path: str) -> None:
+    """이전 결과 파일과 비교 출력 (비율 > 1 이면 느려짐)."""
+    try:
+        with open(baseline_path, "r", encoding="utf-8") as f:
+            baseline = {(r["name"], r["size"]): r for r in json.load(f).get("results", [])}
+    except Exception as e:
+        print(f"[경고] 비교 파일 로드 실패: {e}")
+        return
+    print(f"\n[비교] 기준: {baseline_path}")
+    for r in results:
+        base = baseline.get((r["name"], r["size"]))
+        if not base or not base.get("min_s"):
+            continue
+        ratio = r["min_s"] / base["min_s"]
+        flag = "  ← 느려짐" if ratio > 1.2 else ""
+        print(f"  {r['name']:<32} n={r['size']:<7} {base['min_s']:.4f}s → {r['min_s']:.4f}s  (x{ratio:.2f}){flag}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="어그로 파이프라인 오프라인 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="합성 제목 개수 목록")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (10k 초과는 1회)")
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES_DIR, help="랭킹 페이지 HTML(*.html) 폴더")
+    parser.add_argument("--capture-fixtures", action="store_true", help="현재 랭킹 페이지를 --fixtures 폴더에 저장하고 종료")
+    parser.add_argument("--skip", nargs="*", default=[], choices=["score", "dedup", "parse", "export"])
+    parser.add_argument("--output", default=None, help="결과 JSON 경로")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON 경로")
+    args = parser.parse_args()
+
+    if args.capture_fixtures:
+        for path in capture_fixtures(args.fixtures):
+            print(f"랭킹 페이지 저장 완료: {path}")
+        return
+
+    try:
+        results = run_benchmarks(args.sizes, max(1, args.repeat), load_fixtures(args.fixtures), args.skip)
+        path = save_results(results, args.output)
+        print(f"\n벤치마크 결과 저장 완료: {path}")
+        if args.compare:
+            compare_results(results, args.compare)
+    except Exception as e:
+        print(f"오류 발생: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    main()
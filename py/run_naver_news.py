@@ -2,10 +2,8 @@
 네이버 뉴스 스크래핑 → 어그로 분석 → 엑셀 출력
 """
 
-import pandas as pd
-
 from aggro_analyzer import analyze_articles
-from excel_reporter import export_to_excel
+from excel_reporter import articles_to_frame, export_to_excel
 from naver_news_scraper import scrape_ranking_news
 
 
@@ -27,18 +25,7 @@ def main() -> None:
         scored = analyze_articles(articles, title_key="title")
 
         # 3. 엑셀용 DataFrame 생성 (뉴스 URL 포함)
-        rows = []
-        for item in scored:
-            rows.append({
-                "title": item.get("title", ""),
-                "score": item.get("score", 0),
-                "source": item.get("source", "네이버뉴스"),
-                "youtube_url": "",
-                "news_url": item.get("url", ""),
-                "views": "",
-                "upload_date": item.get("section", ""),
-            })
-        df = pd.DataFrame(rows)
+        df = articles_to_frame(scored)
 
         # 4. 엑셀 출력
         path = export_to_excel(df)
@@ -0,0 +1,229 @@
+"""
+실행 리포트 (단계별·요청별 소요 시간 기록)
+수집·파싱·점수·보강·병합·출력·git 단계와 HTTP 요청을 기록하여
+실행이 느려졌을 때 어느 출처·단계가 원인인지 JSON으로 확인할 수 있게 합니다.
+
+사용 예:
+    with run_report.stage("youtube.query", query=q) as st:
+        items = ...
+        st["items"] = len(items)
+
+스레드 풀 작업은 run_report.bind(fn)으로 감싸서 제출하면 제출한 단계 아래에 기록됩니다:
+    pool.submit(run_report.bind(download), url)
+"""
+
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+_lock = threading.Lock()
+# 열려 있는 단계 (바깥 → 안쪽). bind()로 감싼 작업은 제출 시점의 단계를 이어받음
+_stack: contextvars.ContextVar[Tuple[Dict[str, Any], ...]] = contextvars.ContextVar("run_report_stack", default=())
+_report: Dict[str, Any] = {}
+
+
+def default_report_dir() -> str:
+    """기본 저장 폴더: 프로젝트 루트 history/runs/."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, "history", "runs")
+
+
+def reset(**meta: Any) -> None:
+    """새 실행 리포트 시작 (meta: 카테고리 등 실행 정보)."""
+    with _lock:
+        _report.clear()
+        _report.update({
+            "started_at": datetime.now().isoformat(timespec="seconds"),
+            "meta": dict(meta),
+            "stages": [],
+            "hosts": {},
+            "caches": {},
+            "queries": {},
+            "_t0": time.perf_counter(),
+        })
+
+
+def annotate(**meta: Any) -> None:
+    """실행 정보 추가 (실행 도중 정해지는 값)."""
+    with _lock:
+        _report.setdefault("meta", {}).update(meta)
+
+
+def attach(section: str, data: Any) -> None:
+    """다른 모듈의 상태(속도 제한 등)를 리포트 항목으로 추가."""
+    with _lock:
+        _report[section] = data
+
+
+def bind(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    fn을 지금 열린 단계 안에서 실행되도록 감쌈 (스레드 풀에 제출할 때 사용).
+    작업 스레드에서 연 단계는 제출한 단계의 하위 단계가 되고, 요청·캐시 적중도 그 단계에 합산됩니다.
+    작업마다 따로 감싸야 합니다 (같은 컨텍스트를 여러 스레드에서 동시에 쓸 수 없음).
+    """
+    return functools.partial(contextvars.copy_context().run, fn)
+
+
+@contextmanager
+def stage(name: str, **meta: Any) -> Iterator[Dict[str, Any]]:
+    """
+    단계 1개의 소요 시간 기록. 단계 안에서 발생한 HTTP 요청·캐시 적중은
+    열려 있는 모든 상위 단계에도 합산됩니다.
+    yield된 dict의 "items"에 처리 건수를 넣을 수 있습니다.
+    """
+    stack = _stack.get()
+    record = {
+        "name": name,
+        "parent": stack[-1]["name"] if stack else "",
+        "start_s": round(time.perf_counter() - _report.get("_t0", time.perf_counter()), 4),
+        "wall_s": 0.0,
+        "items": None,
+        "requests": 0,
+        "bytes": 0,
+        "cache_hits": 0,
+        "errors": 0,
+    }
+    if meta:
+        record["meta"] = meta
+    token = _stack.set(stack + (record,))
+    start = time.perf_counter()
+    try:
+        yield record
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        record["wall_s"] = round(time.perf_counter() - start, 4)
+        _stack.reset(token)
+        with _lock:
+            _report.setdefault("stages", []).append(record)
+
+
+def record_request(url: str, elapsed: float, nbytes: int, status: Optional[int], source: str = "network") -> None:
+    """
+    HTTP 요청 1건 기록 (http_client에서 호출).
+
+    Args:
+        source: "network"(실제 요청), "cassette"(재생), "cache"(로컬 캐시)
+    """
+    host = urlsplit(url).hostname or "unknown"
+    failed = status is None or status >= 400
+    hit = source != "network" and status is not None
+    with _lock:
+        stats = _report.setdefault("hosts", {}).setdefault(host, {
+            "requests": 0, "bytes": 0, "wall_s": 0.0, "errors": 0, "cache_hits": 0, "status": {},
+        })
+        stats["requests"] += 1
+        stats["bytes"] += nbytes
+        stats["wall_s"] = round(stats["wall_s"] + elapsed, 4)
+        stats["errors"] += int(failed)
+        stats["cache_hits"] += int(hit)
+        key = str(status) if status is not None else "error"
+        stats["status"][key] = stats["status"].get(key, 0) + 1
+        # 작업 스레드에서도 같은 단계에 합산하므로 잠금 안에서
+        for record in _stack.get():
+            record["requests"] += 1
+            record["bytes"] += nbytes
+            record["errors"] += int(failed)
+            record["cache_hits"] += int(hit)
+
+
+def record_cache(name: str, hit: bool) -> None:
+    """로컬 캐시 조회 1건 기록 (name: 캐시 이름)."""
+    with _lock:
+        stats = _report.setdefault("caches", {}).setdefault(name, {"hits": 0, "misses": 0})
+        stats["hits" if hit else "misses"] += 1
+        if hit:
+            for record in _stack.get():
+                record["cache_hits"] += 1
+
+
+def record_queries(source: str, items: Iterable[Any]) -> None:
+    """
+    검색 키워드별 결과 건수 기록 (item.queries 기준, OR 묶음 검색은 실제로 일치한 키워드에 배정).
+    키워드 없이 수집된 항목(랭킹 등)은 제외합니다.
+    """
+    counts: Dict[str, int] = {}
+    for item in items:
+        for query in getattr(item, "queries", ()) or ():
+            counts[query] = counts.get(query, 0) + 1
+    if not counts:
+        return
+    with _lock:
+        stats = _report.setdefault("queries", {}).setdefault(source, {})
+        for query, count in counts.items():
+            stats[query] = stats.get(query, 0) + count
+
+
+def record_event(name: str, **data: Any) -> None:
+    """요청 스로틀 등 이벤트 1건 기록."""
+    with _lock:
+        _report.setdefault("events", []).append({
+            "name": name,
+            "at_s": round(time.perf_counter() - _report.get("_t0", time.perf_counter()), 4),
+            **data,
+        })
+
+
+def _by_stage() -> Dict[str, Dict[str, Any]]:
+    """단계 이름별 합계."""
+    result: Dict[str, Dict[str, Any]] = {}
+    for record in _report.get("stages", []):
+        agg = result.setdefault(record["name"], {
+            "count": 0, "wall_s": 0.0, "requests": 0, "bytes": 0, "cache_hits": 0, "errors": 0, "items": 0,
+        })
+        agg["count"] += 1
+        agg["wall_s"] = round(agg["wall_s"] + record["wall_s"], 4)
+        for key in ("requests", "bytes", "cache_hits", "errors"):
+            agg[key] += record[key]
+        agg["items"] += record["items"] or 0
+    return result
+
+
+def summary() -> Dict[str, Any]:
+    """scraperStatus에 넣을 요약 (최상위 단계별 소요 시간·요청 수)."""
+    with _lock:
+        top = {}
+        for record in _report.get("stages", []):
+            if record["parent"]:
+                continue
+            top[record["name"]] = round(top.get(record["name"], 0.0) + record["wall_s"], 2)
+        hosts = _report.get("hosts", {})
+        return {
+            "total_s": round(time.perf_counter() - _report.get("_t0", time.perf_counter()), 2),
+            "requests": sum(h["requests"] for h in hosts.values()),
+            "bytes": sum(h["bytes"] for h in hosts.values()),
+            "stages_s": top,
+        }
+
+
+def to_dict() -> Dict[str, Any]:
+    """JSON으로 저장할 리포트 전체."""
+    result = summary()
+    with _lock:
+        report = {k: v for k, v in _report.items() if not k.startswith("_")}
+        report["finished_at"] = datetime.now().isoformat(timespec="seconds")
+        report["total_s"] = result["total_s"]
+        report["by_stage"] = _by_stage()
+        report["stages"] = sorted(report.get("stages", []), key=lambda r: r["start_s"])
+    return report
+
+
+def save(output_path: Optional[str] = None) -> str:
+    """리포트를 JSON으로 저장 (기본: history/runs/run_YYYYMMDD_HHMMSS.json)."""
+    if not output_path:
+        output_path = os.path.join(default_report_dir(), f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)) or ".", exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(to_dict(), f, ensure_ascii=False, indent=2)
+    return output_path
+
+
+reset()
@@ -0,0 +1,309 @@
+"""
+학습형 점수 모델 (선택 사항)
+유튜브 제목·조회수로 오프라인 학습한 선형 모델로 어그로 점수를 계산합니다.
+- 특징: 글자 2~3-gram + 등급 키워드 일치 + 등급 (해시 트릭으로 2^HASH_BITS 차원에 투영, n-gram 해시는 묶음 단위 numpy 계산)
+- 목표: log1p(조회수) (영상별 최신 값), 릿지 회귀를 켤레 기울기법으로 학습
+- 추론: 제목 묶음을 희소 행렬(CSR)로 만들어 가중치 벡터와 한 번에 곱함 (numpy만 사용)
+- 점수: (예측 로그 조회수 − 학습 평균) × SCORE_SCALE, 0 미만은 0
+
+모델 파일(history/score_model.npz)이 없으면 aggro_analyzer는 등급 가중치 점수를 그대로 사용합니다.
+
+사용법:
+    python py/score_model.py train                 # Parquet 히스토리의 유튜브 항목으로 학습
+    python py/score_model.py train --l2 2.0 --bits 18
+    AGGRO_SCORER=model python run_all.py 경제       # 모델 점수로 수집 실행
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import zlib
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+HASH_BITS = 18
+NGRAM_RANGE = (2, 3)
+L2 = 1.0
+CG_ITERATIONS = 200
+CG_TOLERANCE = 1e-6
+SCORE_SCALE = 10.0  # 예측 조회수가 평균의 e배(약 2.7배)일 때 10점
+MIN_SAMPLES = 50
+
+_SPACE_RE = re.compile(r"\s+")
+
+
+def default_model_path() -> str:
+    """기본 모델 경로: 프로젝트 루트 history/score_model.npz."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, "history", "score_model.npz")
+
+
+# ========== 특징 ==========
+
+
+# n-gram 해시용 상수 (64비트 곱셈 해시, 실행·프로세스가 달라도 같은 값)
+_PRIMES = np.array([0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9], dtype=np.uint64)
+_MIX = np.uint64(0xFF51AFD7ED558CCD)
+_SEP = 0x0A  # 제목 구분 문자 (정규화 후 제목에는 없음)
+
+
+def _normalize(title: str) -> str:
+    return _SPACE_RE.sub(" ", title or "").strip().lower()
+
+
+def _ngram_pairs(texts: Sequence[str], mask: int) -> Tuple[np.ndarray, np.ndarray]:
+    """제목 묶음의 글자 n-gram 해시를 한 번에 계산 → (행 번호, 특징 번호)."""
+    joined = "\n".join(texts)
+    codes = np.frombuffer(joined.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    lengths = np.array([len(t) + 1 for t in texts], dtype=np.int64)
+    row_of = np.repeat(np.arange(len(texts)), lengths)[:len(codes)]
+    is_sep = codes == _SEP
+    rows, feats = [], []
+    for n in range(NGRAM_RANGE[0], NGRAM_RANGE[1] + 1):
+        count = len(codes) - n + 1
+        if count <= 0:
+            continue
+        h = np.full(count, np.uint64(n))
+        valid = np.ones(count, dtype=bool)
+        for k in range(n):
+            h = h * _PRIMES[k % len(_PRIMES)] + codes[k:k + count]
+            valid &= ~is_sep[k:k + count]
+        h ^= h >> np.uint64(31)
+        h *= _MIX
+        h ^= h >> np.uint64(29)
+        rows.append(row_of[:count][valid])
+        feats.append((h[valid] & np.uint64(mask)).astype(np.int64))
+    if not rows:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    return np.concatenate(rows), np.concatenate(feats)
+
+
+@lru_cache(maxsize=4096)
+def _token_feature(prefix: str, token: str, mask: int) -> int:
+    return zlib.crc32((prefix + token).encode("utf-8")) & mask
+
+
+def _keyword_tiers() -> Dict[str, List[str]]:
+    """키워드 → 속한 등급 목록 (현재 사전)."""
+    from aggro_keywords import AGGRO_DICTIONARY
+
+    tiers: Dict[str, List[str]] = {}
+    for tier, data in AGGRO_DICTIONARY.items():
+        for kw in data["keywords"]:
+            tiers.setdefault(kw, []).append(tier)
+    return tiers
+
+
+def build_matrix(
+    titles: Sequence[str],
+    keywords: Sequence[Sequence[str]],
+    bits: int = HASH_BITS,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    제목 묶음 → CSR 행렬 (값은 모두 1이므로 indptr, indices만, 행 안의 중복 특징은 1개로).
+
+    Args:
+        keywords: 제목별 일치한 등급 키워드 (calculate_aggro_score 결과)
+    """
+    mask = (1 << bits) - 1
+    rows, feats = _ngram_pairs([_normalize(t) for t in titles], mask)
+    kw_tiers = _keyword_tiers()
+    extra_rows, extra_feats = [], []
+    for row, kws in enumerate(keywords):
+        for kw in kws:
+            extra_rows.append(row)
+            extra_feats.append(_token_feature("k:", kw, mask))
+            for tier in kw_tiers.get(kw, ()):
+                extra_rows.append(row)
+                extra_feats.append(_token_feature("t:", tier, mask))
+    if extra_rows:
+        rows = np.concatenate([rows, np.array(extra_rows, dtype=np.int64)])
+        feats = np.concatenate([feats, np.array(extra_feats, dtype=np.int64)])
+    keys = np.sort((rows << bits) | feats)
+    if len(keys):
+        keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+    indices = keys & mask
+    indptr = np.zeros(len(titles) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys >> bits, minlength=len(titles)), out=indptr[1:])
+    return indptr, indices
+
+
+def _row_ids(indptr: np.ndarray) -> np.ndarray:
+    return np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+
+
+def _matvec(indptr: np.ndarray, indices: np.ndarray, rows: np.ndarray, w: np.ndarray) -> np.ndarray:
+    """X @ w."""
+    return np.bincount(rows, weights=w[indices], minlength=len(indptr) - 1)
+
+
+def _rmatvec(indices: np.ndarray, rows: np.ndarray, r: np.ndarray, dim: int) -> np.ndarray:
+    """X.T @ r."""
+    return np.bincount(indices, weights=r[rows], minlength=dim)
+
+
+# ========== 모델 ==========
+
+
+class ScoreModel:
+    """해시 특징 선형 모델."""
+
+    def __init__(self, weights: np.ndarray, bias: float, meta: Optional[dict] = None) -> None:
+        self.weights = weights.astype(np.float64)
+        self.bias = float(bias)
+        self.meta = meta or {}
+        self.bits = int(self.meta.get("bits", HASH_BITS))
+
+    def predict(self, titles: Sequence[str], keywords: Sequence[Sequence[str]]) -> np.ndarray:
+        """예측 log1p(조회수) (제목 묶음을 한 번의 희소 행렬 곱으로)."""
+        if not len(titles):
+            return np.zeros(0)
+        indptr, indices = build_matrix(titles, keywords, self.bits)
+        return self.bias + _matvec(indptr, indices, _row_ids(indptr), self.weights)
+
+    def score(self, titles: Sequence[str], keywords: Sequence[Sequence[str]]) -> List[float]:
+        """어그로 점수 (예측 로그 조회수의 평균 대비 상승분 × SCORE_SCALE)."""
+        lift = self.predict(titles, keywords) - self.bias
+        return [round(max(0.0, float(v) * SCORE_SCALE), 2) for v in lift]
+
+    def save(self, path: Optional[str] = None) -> str:
+        path = path or default_model_path()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = path + ".tmp.npz"
+        np.savez_compressed(
+            tmp_path,
+            weights=self.weights.astype(np.float32),
+            bias=np.float64(self.bias),
+            meta=np.array(json.dumps(self.meta, ensure_ascii=False)),
+        )
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> "ScoreModel":
+        with np.load(path or default_model_path()) as data:
+            return cls(data["weights"], float(data["bias"]), json.loads(str(data["meta"])))
+
+
+_model: Optional[ScoreModel] = None
+_model_loaded = False
+_model_lock = threading.Lock()
+
+
+def get_model() -> Optional[ScoreModel]:
+    """학습된 모델 (파일이 없거나 읽지 못하면 None → 등급 점수 사용)."""
+    global _model, _model_loaded
+    with _model_lock:
+        if not _model_loaded:
+            _model_loaded = True
+            path = default_model_path()
+            if os.path.exists(path):
+                try:
+                    _model = ScoreModel.load(path)
+                except Exception as e:
+                    print(f"[경고] 점수 모델 로드 실패, 등급 점수 사용: {e}")
+        return _model
+
+
+# ========== 학습 ==========
+
+
+def fit(
+    titles: Sequence[str],
+    keywords: Sequence[Sequence[str]],
+    views: Iterable[float],
+    bits: int = HASH_BITS,
+    l2: float = L2,
+) -> ScoreModel:
+    """릿지 회귀 학습: (XᵀX + λI) w = Xᵀ(y − ȳ) 를 켤레 기울기법으로 풂."""
+    y = np.log1p(np.asarray(list(views), dtype=np.float64))
+    bias = float(y.mean())
+    target = y - bias
+    indptr, indices = build_matrix(titles, keywords, bits)
+    rows = _row_ids(indptr)
+    dim = 1 << bits
+
+    def normal(v: np.ndarray) -> np.ndarray:
+        return _rmatvec(indices, rows, _matvec(indptr, indices, rows, v), dim) + l2 * v
+
+    w = np.zeros(dim)
+    r = _rmatvec(indices, rows, target, dim)
+    p = r.copy()
+    rs = r @ r
+    stop = CG_TOLERANCE * CG_TOLERANCE * max(rs, 1e-30)
+    iterations = 0
+    for iterations in range(1, CG_ITERATIONS + 1):
+        ap = normal(p)
+        alpha = rs / (p @ ap)
+        w += alpha * p
+        r -= alpha * ap
+        rs_new = r @ r
+        if rs_new <= stop:
+            break
+        p = r + (rs_new / rs) * p
+        rs = rs_new
+
+    pred = bias + _matvec(indptr, indices, rows, w)
+    meta = {
+        "bits": bits,
+        "l2": l2,
+        "samples": len(titles),
+        "iterations": iterations,
+        "rmse": round(float(np.sqrt(np.mean((pred - y) ** 2))), 4),
+        "trained_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    return ScoreModel(w, bias, meta)
+
+
+def load_training_data() -> Tuple[List[str], List[float]]:
+    """Parquet 히스토리의 유튜브 항목 (영상별 마지막 수집의 제목·조회수)."""
+    from excel_reporter import read_parquet_history
+
+    df = read_parquet_history(
+        filters=[("출처", "=", "유튜브")],
+        columns=["제목", "유튜브_URL", "조회수", "수집시각"],
+    )
+    if df.empty:
+        return [], []
+    df = df.dropna(subset=["조회수"])
+    df = df[df["제목"].astype(str).str.len() > 0]
+    df = df.sort_values("수집시각").drop_duplicates("유튜브_URL", keep="last")
+    return df["제목"].astype(str).tolist(), df["조회수"].astype(float).tolist()
+
+
+def train(bits: int = HASH_BITS, l2: float = L2, path: Optional[str] = None) -> Optional[str]:
+    """히스토리로 학습 후 저장. 저장 경로 반환 (표본이 부족하면 None)."""
+    from aggro_analyzer import calculate_aggro_score
+
+    titles, views = load_training_data()
+    if len(titles) < MIN_SAMPLES:
+        print(f"[모델] 학습 표본 부족: {len(titles)}건 (최소 {MIN_SAMPLES}건)")
+        return None
+    keywords = [calculate_aggro_score(t)[1] for t in titles]
+    model = fit(titles, keywords, views, bits=bits, l2=l2)
+    saved = model.save(path)
+    print(f"[모델] 학습 완료: {model.meta['samples']}건, RMSE {model.meta['rmse']} (log 조회수) → {saved}")
+    return saved
+
+
+def main() -> None:
+    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, root_dir)
+    parser = argparse.ArgumentParser(description="학습형 점수 모델")
+    parser.add_argument("command", choices=["train"], help="train: 히스토리로 학습")
+    parser.add_argument("--bits", type=int, default=HASH_BITS, help="해시 차원 (2^bits)")
+    parser.add_argument("--l2", type=float, default=L2, help="릿지 규제 강도")
+    parser.add_argument("--output", default=None, help="모델 파일 경로")
+    args = parser.parse_args()
+    if args.command == "train":
+        train(args.bits, args.l2, args.output)
+
+
+if __name__ == "__main__":
+    main()
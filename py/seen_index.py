@@ -0,0 +1,103 @@
+"""
+실행 간 처리 기사 색인 (증분 수집용)
+이전 실행에서 이미 처리한 기사를 표준 URL 해시(8바이트)로 기억하여
+- 스크래퍼: 최신순 결과에서 아는 기사에 도달하면 다음 페이지 요청 중단
+- 파이프라인: 이전 결과가 남아 있는 기사는 점수·비슷한 뉴스 보강을 다시 하지 않음
+
+저장 형식: history/seen_index.bin = 머리글 + (해시 u64, 마지막 확인 시각 u32) 레코드를 해시순 정렬
+오래된 항목은 TTL_DAYS 후 만료되고, 전체 크기는 MAX_ENTRIES개(약 12바이트/건)로 제한됩니다.
+"""
+
+import hashlib
+import os
+import struct
+import time
+from typing import Dict, Iterable, Optional
+
+from url_canon import url_key
+
+TTL_DAYS = 14
+MAX_ENTRIES = 200_000
+
+_MAGIC = b"AGSEEN1\n"
+_RECORD = struct.Struct("<QI")
+
+
+def default_index_path() -> str:
+    """기본 색인 경로: 프로젝트 루트 history/seen_index.bin."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, "history", "seen_index.bin")
+
+
+def _hash(url: str) -> int:
+    key = url_key(url)
+    if not key:
+        return 0
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class SeenIndex:
+    """처리한 기사 색인 (`url in index`로 확인, mark()로 기록, save()로 저장)."""
+
+    def __init__(self, path: Optional[str] = None, ttl_days: float = TTL_DAYS, max_entries: int = MAX_ENTRIES) -> None:
+        self.path = path or default_index_path()
+        self.ttl = ttl_days * 86400
+        self.max_entries = max_entries
+        self._entries: Optional[Dict[int, int]] = None
+        self._dirty = False
+
+    def _load(self) -> Dict[int, int]:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with open(self.path, "rb") as f:
+                    data = f.read()
+            except OSError:
+                return self._entries
+            body = data[len(_MAGIC):]
+            if not data.startswith(_MAGIC) or len(body) % _RECORD.size:
+                print(f"[경고] 처리 기사 색인 형식 오류, 새로 만듭니다: {self.path}")
+                return self._entries
+            self._entries = dict(_RECORD.iter_unpack(body))
+        return self._entries
+
+    def __contains__(self, url: str) -> bool:
+        h = _hash(url)
+        if not h:
+            return False
+        ts = self._load().get(h)
+        return ts is not None and time.time() - ts <= self.ttl
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def mark(self, urls: Iterable[str]) -> int:
+        """처리한 기사 기록 (마지막 확인 시각 갱신). 기록한 건수 반환."""
+        entries = self._load()
+        now = int(time.time())
+        count = 0
+        for url in urls:
+            h = _hash(url)
+            if h:
+                entries[h] = now
+                count += 1
+        self._dirty = self._dirty or count > 0
+        return count
+
+    def save(self) -> None:
+        """만료 항목 정리 후 저장 (최신 max_entries개, 임시 파일 후 교체)."""
+        if not self._dirty or self._entries is None:
+            return
+        now = time.time()
+        entries = {h: ts for h, ts in self._entries.items() if now - ts <= self.ttl}
+        if len(entries) > self.max_entries:
+            newest = sorted(entries.items(), key=lambda kv: kv[1], reverse=True)[:self.max_entries]
+            entries = dict(newest)
+        self._entries = entries
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_MAGIC)
+            f.write(b"".join(_RECORD.pack(h, ts) for h, ts in sorted(entries.items())))
+        os.replace(tmp_path, self.path)
+        self._dirty = False
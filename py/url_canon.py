@@ -0,0 +1,147 @@
+"""
+URL 정규화 및 출처 공용 중복 확인
+- canonical_url(): 추적·랭킹 파라미터 제거, 네이버 기사/유튜브 영상은 표준 주소로 통일 (실제 열리는 URL)
+- url_key(): 중복 판정용 키 (canonical_url + 스킴·www·모바일 호스트 차이 무시)
+- SeenSet: 수집 출처와 기존 데이터 병합이 함께 쓰는 중복 확인 집합
+"""
+
+import re
+import threading
+from typing import Any, Iterable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 제거할 쿼리 파라미터 (utm_*는 접두어로 처리)
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "igshid", "mc_cid", "mc_eid", "ref", "ref_src",
+    "ntype", "cds", "sns", "cmpid", "feature", "si",
+}
+
+# 정규화하지 않는 호스트 (리다이렉트 링크는 변환 전 그대로 유지)
+PASSTHROUGH_HOSTS = {"news.google.com"}
+
+_NAVER_ARTICLE_PATH_RE = re.compile(r"/article/(\d{3})/(\d{10})")
+_YOUTUBE_ID_RE = re.compile(r"^[A-Za-z0-9_-]{11}$")
+_MOBILE_PREFIXES = ("www.", "m.", "mobile.")
+
+
+def naver_article_id(url: str) -> str:
+    """네이버 뉴스 기사 URL에서 "언론사ID/기사ID" 추출 (아니면 "")."""
+    parts = urlsplit(url or "")
+    host = (parts.hostname or "").lower()
+    if not host.endswith("naver.com"):
+        return ""
+    match = _NAVER_ARTICLE_PATH_RE.search(parts.path)
+    if match:
+        return f"{match.group(1)}/{match.group(2)}"
+    query = dict(parse_qsl(parts.query))
+    oid, aid = query.get("oid", ""), query.get("aid", "")
+    if oid.isdigit() and aid.isdigit():
+        return f"{oid.zfill(3)}/{aid.zfill(10)}"
+    return ""
+
+
+def youtube_video_id(url: str) -> str:
+    """유튜브 URL에서 영상 ID 추출 (아니면 "")."""
+    parts = urlsplit(url or "")
+    host = (parts.hostname or "").lower()
+    candidate = ""
+    if host == "youtu.be":
+        candidate = parts.path.strip("/").split("/")[0]
+    elif host.endswith("youtube.com"):
+        if parts.path == "/watch":
+            candidate = dict(parse_qsl(parts.query)).get("v", "")
+        elif parts.path.startswith(("/shorts/", "/embed/", "/live/")):
+            candidate = parts.path.split("/")[2]
+    return candidate if _YOUTUBE_ID_RE.match(candidate) else ""
+
+
+def canonical_url(url: str) -> str:
+    """
+    표준 URL (열리는 주소 유지).
+    네이버 기사 → https://n.news.naver.com/article/{언론사}/{기사},
+    유튜브 → https://www.youtube.com/watch?v={ID}, 그 외 → 추적 파라미터·fragment 제거.
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    if not host or host in PASSTHROUGH_HOSTS:
+        return url
+
+    article_id = naver_article_id(url)
+    if article_id:
+        return f"https://n.news.naver.com/article/{article_id}"
+    video_id = youtube_video_id(url)
+    if video_id:
+        return f"https://www.youtube.com/watch?v={video_id}"
+
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    )
+    netloc = host
+    if parts.port and not (parts.scheme == "http" and parts.port == 80) and not (
+            parts.scheme == "https" and parts.port == 443):
+        netloc = f"{host}:{parts.port}"
+    path = parts.path or "/"
+    return urlunsplit(((parts.scheme or "https").lower(), netloc, path, urlencode(query), ""))
+
+
+def url_key(url: str) -> str:
+    """중복 판정 키: 스킴·www/m 호스트·끝 슬래시 차이 무시."""
+    canonical = canonical_url(url)
+    if not canonical:
+        return ""
+    parts = urlsplit(canonical)
+    host = parts.hostname or ""
+    for prefix in _MOBILE_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    path = parts.path.rstrip("/") or "/"
+    return f"{host}{path}" + (f"?{parts.query}" if parts.query else "")
+
+
+def item_url(item: Any) -> str:
+    """Article 또는 한글 컬럼 dict(기존 data.js 항목)의 URL."""
+    url = getattr(item, "url", None)
+    if url is None and hasattr(item, "get"):
+        url = item.get("유튜브_URL") or item.get("뉴스기사_URL") or item.get("url") or ""
+    return url or ""
+
+
+class SeenSet:
+    """
+    출처·병합 공용 중복 확인 집합 (url_key 기준, 스레드 안전).
+    URL이 없는 항목은 중복 판정하지 않고 통과시킵니다.
+    """
+
+    def __init__(self, urls: Optional[Iterable[str]] = None) -> None:
+        self._keys = set()
+        self._lock = threading.Lock()
+        for url in urls or ():
+            self.add(url)
+
+    def add(self, url: str) -> bool:
+        """추가. 처음 보는 URL이면 True."""
+        key = url_key(url)
+        if not key:
+            return True
+        with self._lock:
+            if key in self._keys:
+                return False
+            self._keys.add(key)
+            return True
+
+    def __contains__(self, url: str) -> bool:
+        key = url_key(url)
+        with self._lock:
+            return bool(key) and key in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def filter(self, items: Iterable[Any]) -> List[Any]:
+        """처음 나온 항목만 남김 (이미 본 URL은 제외하고, 남긴 URL은 집합에 추가)."""
+        return [item for item in items if self.add(item_url(item))]
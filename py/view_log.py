@@ -0,0 +1,173 @@
+"""
+유튜브 조회수 스냅샷 로그
+(video_id, 시각, 조회수)를 고정 길이 바이너리 레코드로 추가만 하는 로그에 기록하고,
+mmap으로 읽어 시간당 조회수(속도)를 계산합니다.
+
+레코드 형식 (24바이트, little-endian):
+    video_id 11바이트 + 패딩 1바이트 + 시각(epoch 초, uint32) + 조회수(uint64)
+"""
+
+import os
+import re
+import struct
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+RECORD = struct.Struct("<11sxIQ")
+RECORD_DTYPE = np.dtype({
+    "names": ["video_id", "ts", "views"],
+    "formats": ["S11", "<u4", "<u8"],
+    "offsets": [0, 12, 16],
+    "itemsize": RECORD.size,
+})
+
+# 속도 계산 시 두 스냅샷 사이 최소 간격 (같은 실행 안의 중복 기록 무시)
+MIN_INTERVAL_HOURS = 1.0
+
+_VIDEO_ID_RE = re.compile(r"(?:v=|youtu\.be/|/shorts/)([A-Za-z0-9_-]{11})")
+
+
+def default_log_path() -> str:
+    """기본 로그 경로: 프로젝트 루트 history/youtube_views.bin."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, "history", "youtube_views.bin")
+
+
+def video_id_from_url(url: str) -> str:
+    """유튜브 URL에서 11자리 영상 ID 추출 (없으면 "")."""
+    match = _VIDEO_ID_RE.search(url or "")
+    return match.group(1) if match else ""
+
+
+def append_snapshots(
+    snapshots: Iterable[Tuple[str, int]],
+    ts: Optional[int] = None,
+    path: Optional[str] = None,
+) -> int:
+    """
+    (video_id, 조회수) 스냅샷을 로그 끝에 추가.
+
+    Returns:
+        기록한 건수
+    """
+    path = path or default_log_path()
+    ts = int(ts if ts is not None else time.time())
+    buf = bytearray()
+    for video_id, views in snapshots:
+        vid = (video_id or "").encode("ascii", "ignore")
+        if len(vid) != 11:
+            continue
+        try:
+            views = int(views)
+        except (TypeError, ValueError):
+            continue
+        buf += RECORD.pack(vid, ts, max(views, 0))
+    if not buf:
+        return 0
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "ab") as f:
+        # 이전 실행이 기록 도중 중단되어 잘린 레코드가 있으면 잘라냄
+        size = f.tell()
+        if size % RECORD.size:
+            f.truncate(size - size % RECORD.size)
+            f.seek(0, os.SEEK_END)
+        f.write(buf)
+    return len(buf) // RECORD.size
+
+
+def load_snapshots(path: Optional[str] = None) -> np.ndarray:
+    """로그 전체를 mmap 배열로 열기 (video_id, ts, views 필드). 파일이 없으면 빈 배열."""
+    path = path or default_log_path()
+    if not os.path.exists(path):
+        return np.empty(0, dtype=RECORD_DTYPE)
+    count = os.path.getsize(path) // RECORD.size
+    if count == 0:
+        return np.empty(0, dtype=RECORD_DTYPE)
+    return np.memmap(path, dtype=RECORD_DTYPE, mode="r", shape=(count,))
+
+
+def history_for(video_ids: Iterable[str], path: Optional[str] = None) -> Dict[str, List[Tuple[int, int]]]:
+    """영상별 [(시각, 조회수), ...] (시각 순)."""
+    data = load_snapshots(path)
+    wanted = np.array([v.encode("ascii", "ignore") for v in video_ids if v], dtype="S11")
+    if data.size == 0 or wanted.size == 0:
+        return {}
+    # 문자열 비교는 느리므로 video_id 앞 8바이트를 정수로 보고 1차 선별 → 후보만 정확히 비교
+    raw = np.frombuffer(data, dtype=np.uint8).reshape(-1, RECORD.size)
+    prefix = raw[:, :8].copy().view("<u8").ravel()
+    wanted_prefix = np.frombuffer(b"".join(w.ljust(11, b"\0")[:8] for w in wanted), dtype="<u8")
+    subset = data[np.isin(prefix, wanted_prefix)]
+    subset = subset[np.isin(subset["video_id"], wanted)]
+    order = np.lexsort((subset["ts"], subset["video_id"]))
+    result: Dict[str, List[Tuple[int, int]]] = {}
+    for row in subset[order]:
+        result.setdefault(row["video_id"].decode("ascii"), []).append((int(row["ts"]), int(row["views"])))
+    return result
+
+
+def velocities(
+    video_ids: Iterable[str],
+    min_interval_hours: float = MIN_INTERVAL_HOURS,
+    path: Optional[str] = None,
+) -> Dict[str, float]:
+    """
+    영상별 시간당 조회수 (최신 스냅샷과, 그보다 min_interval_hours 이상 앞선 가장 가까운 스냅샷 비교).
+    비교할 스냅샷이 없는 영상은 결과에서 빠집니다.
+    """
+    result: Dict[str, float] = {}
+    min_gap = min_interval_hours * 3600
+    for video_id, points in history_for(video_ids, path).items():
+        last_ts, last_views = points[-1]
+        for ts, views in reversed(points[:-1]):
+            if last_ts - ts >= min_gap:
+                result[video_id] = round((last_views - views) / ((last_ts - ts) / 3600), 2)
+                break
+    return result
+
+
+def track_views(articles: Iterable, path: Optional[str] = None) -> int:
+    """
+    유튜브 Article 목록의 조회수를 로그에 기록하고 velocity(시간당 조회수)를 채움.
+
+    Returns:
+        기록한 건수
+    """
+    articles = [a for a in articles if a.is_youtube]
+    ids = {id(a): video_id_from_url(a.url) for a in articles}
+    written = append_snapshots(((ids[id(a)], a.views) for a in articles), path=path)
+    speed = velocities(set(ids.values()), path=path)
+    for a in articles:
+        a.velocity = speed.get(ids[id(a)], "")
+    return written
+
+
+def compact(max_age_days: int = 90, path: Optional[str] = None) -> int:
+    """
+    max_age_days보다 오래된 스냅샷 삭제 (영상별 최신 스냅샷은 유지).
+    임시 파일에 쓴 뒤 교체합니다.
+
+    Returns:
+        남은 레코드 수
+    """
+    path = path or default_log_path()
+    data = load_snapshots(path)
+    if data.size == 0:
+        return 0
+    cutoff = int(time.time()) - max_age_days * 86400
+    keep = data["ts"] >= cutoff
+    # 영상별 최신 스냅샷 위치 (시각 순 정렬 후 영상별 마지막)
+    order = np.lexsort((data["ts"], data["video_id"]))
+    ids_sorted = data["video_id"][order]
+    last = np.ones(len(order), dtype=bool)
+    last[:-1] = ids_sorted[:-1] != ids_sorted[1:]
+    keep[order[last]] = True
+
+    kept = np.array(data[keep])
+    del data
+    tmp_path = path + ".tmp"
+    kept.tofile(tmp_path)
+    os.replace(tmp_path, path)
+    return int(kept.size)
@@ -0,0 +1,47 @@
+"""
+웹 데이터(data.js) 읽기
+excel_reporter가 쓰는 data.js(const keywordData = [...]; const scraperStatus = {...};)에서
+행과 수집기 상태를 읽습니다. 재계산(rescore.py)과 조회 서버(data_server.py)가 함께 사용합니다.
+(표준 라이브러리만 사용)
+"""
+
+import json
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_DATA_RE = re.compile(r"const\s+keywordData\s*=\s*(\[.*\]);", re.DOTALL)
+_STATUS_RE = re.compile(r"const\s+scraperStatus\s*=\s*(\{.*?\});", re.DOTALL)
+
+
+def default_data_path() -> str:
+    """기본 경로: 프로젝트 루트 data.js."""
+    return os.path.join(ROOT_DIR, "data.js")
+
+
+def parse_web_data(content: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    data.js 내용 → (keywordData 행, scraperStatus).
+
+    Raises:
+        ValueError: keywordData가 없거나 JSON이 깨짐 (쓰는 도중의 파일 등)
+    """
+    data = _DATA_RE.search(content)
+    if not data:
+        raise ValueError("keywordData를 찾을 수 없습니다")
+    status = _STATUS_RE.search(content)
+    return json.loads(data.group(1)), (json.loads(status.group(1)) if status else {})
+
+
+def load_web_data(path: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """data.js의 keywordData 행과 scraperStatus (파일이 없거나 keywordData가 없으면 빈 값)."""
+    try:
+        with open(path or default_data_path(), "r", encoding="utf-8") as f:
+            content = f.read()
+    except OSError:
+        return [], {}
+    if not _DATA_RE.search(content):
+        return [], {}
+    return parse_web_data(content)
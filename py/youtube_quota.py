@@ -0,0 +1,172 @@
+"""
+유튜브 API 키 묶음 + 할당량 추적
+YOUTUBE_API_KEYS(쉼표·공백 구분)와 YOUTUBE_API_KEY의 키를 순서대로 쓰면서
+키별 사용 유닛(search 100, videos 1)을 기록하고, 남은 할당량이 모자라거나
+quotaExceeded 응답을 받으면 다음 키로 넘어갑니다.
+
+- 사용량은 history/youtube_quota.json에 키 해시(키 자체는 저장하지 않음)별로 저장되어 다음 실행에서도 이어집니다.
+- 할당량은 미국 태평양 시간 자정에 초기화되므로, 저장된 날짜(태평양 시간)가 바뀌면 사용량을 0으로 되돌립니다.
+- 카세트 재생(--cassette replay) 중에는 저장된 사용량을 읽지도 저장하지도 않습니다.
+- 모든 키가 소진되면 FatalSourceError → 유튜브 차단기가 열려 남은 호출을 건너뜁니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+import http_client
+from circuit_breaker import FatalSourceError
+
+try:
+    from zoneinfo import ZoneInfo
+    PACIFIC = ZoneInfo("America/Los_Angeles")
+except Exception:  # tzdata 없는 환경 (Windows 등): 표준시 고정 (서머타임 기간엔 1시간 늦게 초기화)
+    PACIFIC = timezone(timedelta(hours=-8))
+
+# 프로젝트 기본 할당량 (키당 하루 유닛)
+DAILY_QUOTA = int(os.getenv("YOUTUBE_DAILY_QUOTA") or 10_000)
+
+# 호출 종류별 유닛
+QUOTA_COST = {"search": 100, "videos": 1}
+
+# 할당량 소진을 뜻하는 403 사유
+QUOTA_REASONS = {"quotaExceeded", "dailyLimitExceeded"}
+
+
+def default_quota_path() -> str:
+    """기본 저장 경로: 프로젝트 루트 history/youtube_quota.json."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, "history", "youtube_quota.json")
+
+
+def quota_day(now: Optional[datetime] = None) -> str:
+    """할당량 기준 날짜 (태평양 시간)."""
+    now = now or datetime.now(timezone.utc)
+    return now.astimezone(PACIFIC).date().isoformat()
+
+
+def key_id(key: str) -> str:
+    """저장용 키 식별자 (키 해시 앞 12자리)."""
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:12]
+
+
+def keys_from_env() -> List[str]:
+    """YOUTUBE_API_KEYS(쉼표·공백 구분) + YOUTUBE_API_KEY (중복 제거, 순서 유지)."""
+    # 카세트 비밀값 제거(http_client)와 같은 규칙으로 나눔
+    raw = [*http_client.split_env_list(os.getenv("YOUTUBE_API_KEYS")),
+           *http_client.split_env_list(os.getenv("YOUTUBE_API_KEY"))]
+    return list(dict.fromkeys(raw))
+
+
+def is_quota_error(resp) -> bool:
+    """할당량 소진 응답 여부 (403 + error.errors[].reason)."""
+    if resp is None or resp.status_code != 403:
+        return False
+    try:
+        errors = resp.json().get("error", {}).get("errors", [])
+    except ValueError:
+        return False
+    return any(e.get("reason") in QUOTA_REASONS for e in errors)
+
+
+class KeyPool:
+    """키별 사용 유닛을 기록하며 할당량이 남은 키를 순서대로 고름 (스레드 안전)."""
+
+    def __init__(self, keys: List[str], path: Optional[str] = None, daily_quota: int = DAILY_QUOTA) -> None:
+        if not keys:
+            raise FatalSourceError(
+                ".env 파일에 YOUTUBE_API_KEY(여러 개면 YOUTUBE_API_KEYS=키1,키2)를 설정하세요. "
+                "Google Cloud Console에서 YouTube Data API v3 키를 발급받을 수 있습니다."
+            )
+        self.keys = keys
+        self.path = path or default_quota_path()
+        self.daily_quota = daily_quota
+        self.day = quota_day()
+        # 키 식별자 → {"used": 유닛, "exhausted": 소진 응답 여부}
+        self.usage: Dict[str, Dict[str, object]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        # 재생은 실제 할당량과 무관 (이 컴퓨터의 오늘 사용량에 따라 결과가 달라지지 않도록)
+        if http_client.cassette_mode() == "replay":
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("day") == self.day:
+            self.usage = data.get("keys", {})
+
+    def _entry(self, key: str) -> Dict[str, object]:
+        day = quota_day()
+        if day != self.day:
+            # 실행 중에 태평양 시간 자정이 지나면 초기화
+            self.day, self.usage = day, {}
+        return self.usage.setdefault(key_id(key), {"used": 0, "exhausted": False})
+
+    def remaining(self, key: str) -> int:
+        with self._lock:
+            entry = self._entry(key)
+            return 0 if entry["exhausted"] else max(self.daily_quota - int(entry["used"]), 0)
+
+    def acquire(self, kind: str) -> str:
+        """
+        kind 호출 1회분 유닛이 남은 첫 키를 골라 사용량을 미리 기록 (실패한 요청도 할당량이 차감됨).
+
+        Raises:
+            FatalSourceError: 모든 키의 할당량이 모자람
+        """
+        cost = QUOTA_COST[kind]
+        with self._lock:
+            for key in self.keys:
+                entry = self._entry(key)
+                if not entry["exhausted"] and self.daily_quota - int(entry["used"]) >= cost:
+                    entry["used"] = int(entry["used"]) + cost
+                    self._dirty = True
+                    return key
+        raise FatalSourceError(f"유튜브 API 키 {len(self.keys)}개 모두 오늘 할당량 소진 (태평양 시간 자정 초기화)")
+
+    def mark_exhausted(self, key: str) -> None:
+        """quotaExceeded 응답을 받은 키를 오늘 남은 시간 동안 제외."""
+        with self._lock:
+            self._entry(key)["exhausted"] = True
+            self._dirty = True
+        self.save()
+
+    def save(self) -> None:
+        """사용량 저장 (임시 파일 후 교체). 카세트 재생 중에는 실제 할당량을 쓰지 않으므로 저장하지 않음."""
+        if http_client.cassette_mode() == "replay":
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"day": self.day, "keys": {k: dict(v) for k, v in self.usage.items()}}
+            self._dirty = False
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def summary(self) -> Dict[str, int]:
+        """{"keys": 키 수, "used": 오늘 사용 유닛 합, "remaining": 남은 유닛 합}."""
+        remaining = sum(self.remaining(key) for key in self.keys)
+        with self._lock:
+            used = sum(int(self._entry(key)["used"]) for key in self.keys)
+        return {"keys": len(self.keys), "used": used, "remaining": remaining}
+
+
+def load_pool(path: Optional[str] = None) -> KeyPool:
+    """.env/환경 변수의 키로 키 묶음 생성."""
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+    return KeyPool(keys_from_env(), path)
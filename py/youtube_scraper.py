@@ -1,15 +1,22 @@
 """
 유튜브 검색 스크래퍼 (YouTube Data API v3)
 키워드 조합 검색, 7일 이내 + 10만 회 이상 영상 수집
+API 키는 여러 개를 묶어 할당량이 남은 키부터 사용 (youtube_quota.py)
 """
 
-import os
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import List
 from urllib.parse import quote_plus
 
 import requests
 
+import http_client
+import run_report
+from article import Article
+from circuit_breaker import get_breaker
+from query_batcher import build_query, match_keywords, plan_batches
+from youtube_quota import KeyPool, is_quota_error, key_id, load_pool
+
 # 검색 키워드 조합 (키워드 사전 기반)
 SEARCH_QUERIES = [
     "한국 국산화 성공",
@@ -24,27 +31,32 @@ SEARCH_QUERIES = [
 DAYS_BACK = 7
 MIN_VIEWS = 100_000
 
+# 검색 1회(100 유닛)에 묶을 키워드: q의 OR 연산자는 "|"
+QUERY_SEPARATOR = "|"
+MAX_QUERY_LENGTH = 100
+MAX_TERMS_PER_QUERY = 5
+MAX_SEARCH_RESULTS = 50
 
-def _get_api_key() -> str:
-    """환경 변수에서 API 키 로드."""
-    try:
-        from dotenv import load_dotenv
-        load_dotenv()
-    except ImportError:
-        pass
-    key = os.getenv("YOUTUBE_API_KEY")
-    if not key:
-        raise RuntimeError(
-            ".env 파일에 YOUTUBE_API_KEY를 설정하세요. "
-            "Google Cloud Console에서 YouTube Data API v3 키를 발급받을 수 있습니다."
-        )
-    return key.strip()
-
-
-def _search_youtube(api_key: str, query: str, max_results: int = 10, days_back: int = 7) -> List[dict]:
+
+def _youtube_get(pool: KeyPool, kind: str, params: dict) -> requests.Response:
+    """
+    YouTube Data API 호출 (kind: "search" / "videos").
+    할당량이 남은 키로 요청하고, quotaExceeded 응답이면 그 키를 제외한 뒤 다음 키로 다시 요청합니다.
+    """
+    url = f"https://www.googleapis.com/youtube/v3/{kind}"
+    while True:
+        key = pool.acquire(kind)
+        resp = http_client.get(url, params={**params, "key": key}, timeout=15)
+        if not is_quota_error(resp):
+            return resp
+        print(f"[유튜브] API 키 {key_id(key)} 할당량 소진 → 다음 키로 전환")
+        run_report.record_event("youtube_key_exhausted", key=key_id(key))
+        pool.mark_exhausted(key)
+
+
+def _search_youtube(pool: KeyPool, query: str, max_results: int = 10, days_back: int = 7) -> List[Article]:
     """키워드로 유튜브 검색."""
-    published_after = (datetime.utcnow() - timedelta(days=days_back)).strftime("%Y-%m-%dT00:00:00Z")
-    url = "https://www.googleapis.com/youtube/v3/search"
+    published_after = (http_client.utcnow() - timedelta(days=days_back)).strftime("%Y-%m-%dT00:00:00Z")
     params = {
         "part": "snippet",
         "q": query,
@@ -52,28 +64,28 @@ def _search_youtube(api_key: str, query: str, max_results: int = 10, days_back:
         "maxResults": max_results,
         "publishedAfter": published_after,
         "relevanceLanguage": "ko",
-        "key": api_key,
     }
-    resp = requests.get(url, params=params, timeout=15)
+    resp = _youtube_get(pool, "search", params)
     resp.raise_for_status()
     data = resp.json()
     items = data.get("items", [])
     video_ids = [i["id"]["videoId"] for i in items if i.get("id", {}).get("videoId")]
     if not video_ids:
         return []
-    return _get_video_details(api_key, video_ids)
+    with run_report.stage("youtube.details") as st:
+        details = _get_video_details(pool, video_ids)
+        st["items"] = len(details)
+    return details
 
 
-def _get_video_details(api_key: str, video_ids: List[str]) -> List[dict]:
+def _get_video_details(pool: KeyPool, video_ids: List[str]) -> List[Article]:
     """영상 상세(조회수, 업로드일) 조회."""
-    url = "https://www.googleapis.com/youtube/v3/videos"
     params = {
         "part": "snippet,statistics",
         "id": ",".join(video_ids[:50]),
-        "key": api_key,
     }
     try:
-        resp = requests.get(url, params=params, timeout=15)
+        resp = _youtube_get(pool, "videos", params)
         resp.raise_for_status()
         data = resp.json()
         results = []
@@ -85,22 +97,25 @@ def _get_video_details(api_key: str, video_ids: List[str]) -> List[dict]:
             if views < MIN_VIEWS:
                 continue
             published = snippet.get("publishedAt", "")[:10] if snippet.get("publishedAt") else ""
-            results.append({
-                "title": snippet.get("title", ""),
-                "url": f"https://www.youtube.com/watch?v={vid}",
-                "source": "유튜브",
-                "views": views,
-                "upload_date": published,
-            })
+            results.append(Article(
+                title=snippet.get("title", ""),
+                url=f"https://www.youtube.com/watch?v={vid}",
+                source="유튜브",
+                views=views,
+                upload_date=published,
+            ))
         return results
     except requests.RequestException as e:
         print(f"[유튜브] 상세 조회 오류: {e}")
+        get_breaker("youtube").record_failure(e)
         return []
 
 
-def scrape_youtube(max_per_query: int = 5, max_total: int = 30, query_list: List[str] = None, days_back: int = 7) -> List[dict]:
+def scrape_youtube(max_per_query: int = 5, max_total: int = 30, query_list: List[str] = None, days_back: int = 7) -> List[Article]:
     """
     키워드 조합으로 유튜브 검색.
+    키워드는 OR 묶음(최대 MAX_TERMS_PER_QUERY개)으로 검색하여 호출 수를 줄이고,
+    결과마다 제목과 일치하는 키워드를 item.queries에 기록합니다.
     
     Args:
         max_per_query: 쿼리당 최대 결과 수
@@ -109,24 +124,36 @@ def scrape_youtube(max_per_query: int = 5, max_total: int = 30, query_list: List
         days_back: 검색 기간 (일 단위, 기본 7일)
     
     Returns:
-        [{"title": str, "url": str, "source": "유튜브", "views": int, "upload_date": str}, ...]
+        [Article(title, url, source="유튜브", views, upload_date), ...]
     """
-    api_key = _get_api_key()
+    # 키 누락·모든 키 할당량 소진 등으로 차단되면 이후 호출은 네트워크 없이 바로 SourceUnavailable
+    breaker = get_breaker("youtube")
+    pool = breaker.call(load_pool)
     seen_urls = set()
     results = []
 
     # 사용할 쿼리 목록 결정
     queries = query_list if query_list else SEARCH_QUERIES
 
-    for query in queries:
-        if len(results) >= max_total:
-            break
-        items = _search_youtube(api_key, query, max_results=max_per_query, days_back=days_back)
-        for item in items:
-            if item["url"] not in seen_urls:
-                seen_urls.add(item["url"])
-                results.append(item)
+    try:
+        for group in plan_batches(queries, MAX_QUERY_LENGTH, QUERY_SEPARATOR, MAX_TERMS_PER_QUERY):
             if len(results) >= max_total:
                 break
+            query = build_query(group, QUERY_SEPARATOR)
+            max_results = min(max_per_query * len(group), MAX_SEARCH_RESULTS)
+            with run_report.stage("youtube.query", query=query, terms=len(group), days_back=days_back) as st:
+                items = breaker.call(_search_youtube, pool, query, max_results=max_results, days_back=days_back)
+                st["items"] = len(items)
+            for item in items:
+                item.queries = tuple(match_keywords(item.title, group))
+                if item.url not in seen_urls:
+                    seen_urls.add(item.url)
+                    results.append(item)
+                if len(results) >= max_total:
+                    break
+    finally:
+        pool.save()
+        usage = pool.summary()
+        print(f"[유튜브] API 키 {usage['keys']}개, 오늘 사용 {usage['used']:,}유닛 / 남은 {usage['remaining']:,}유닛")
 
     return results[:max_total]
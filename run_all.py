@@ -3,12 +3,13 @@
 유튜브 + 구글뉴스 + 네이버 뉴스 -> 통합 엑셀 1개 파일
 """
 
+import argparse
 import os
 import re
 import json
-import subprocess
 import difflib
 import sys
+import tempfile
 from datetime import datetime
 
 # py 폴더를 모듈 경로에 추가
@@ -24,31 +25,26 @@ except ImportError:
 
 import pandas as pd
 
-from aggro_analyzer import analyze_articles
-from excel_reporter import export_to_js
+import circuit_breaker
+import http_client
+import keyword_stats
+import publisher
+import rate_limiter
+import run_report
+from aggro_analyzer import VELOCITY_WEIGHT, analyze_articles
+from article import Article
+from circuit_breaker import SourceUnavailable
+from excel_reporter import TOP_N, articles_to_frame, export_all, export_to_parquet
 from google_news_scraper import scrape_google_news
-from naver_news_scraper import scrape_ranking_news
+from link_resolver import configure_resolver, get_resolver
+from naver_news_scraper import scrape_ranking_news, section_for_category
+from ranking_index import RankingIndex
+from seen_index import SeenIndex
+from url_canon import SeenSet, item_url, url_key
+from view_log import track_views
 from youtube_scraper import scrape_youtube
 
 
-def _to_row(item: dict, source_type: str) -> dict:
-    """소스별 통일된 행 형식으로 변환."""
-    base = {
-        "title": item.get("title", ""),
-        "score": item.get("score", 0),
-        "score_keywords": item.get("score_keywords", ""),
-        "source": source_type if source_type == "유튜브" else item.get("source", source_type),
-        "youtube_url": item.get("url", "") if source_type == "유튜브" else "",
-        "news_url": "" if source_type == "유튜브" else item.get("url", ""),
-        "views": item.get("views", ""),
-        "upload_date": item.get("upload_date", item.get("section", "")),
-        "category": item.get("category", ""), # 카테고리 필드 추가
-    }
-    if source_type == "유튜브":
-        base["source"] = "유튜브"
-    return base
-
-
 def _title_words(title: str) -> set:
     """제목에서 유의미한 단어(2자 이상) 추출."""
     if not title or not isinstance(title, str):
@@ -67,13 +63,21 @@ def _is_similar(title1: str, title2: str) -> bool:
     return difflib.SequenceMatcher(None, t1, t2).ratio() >= 0.5
 
 
-def _enrich_with_similar_news(df: pd.DataFrame, all_news: list) -> pd.DataFrame:
-    """뉴스 행에 비슷한 기사 최대 2개 추가 (뉴스기사2_URL, 뉴스기사2_날짜, 뉴스기사3_URL, 뉴스기사3_날짜)."""
+# 이전 실행 결과를 그대로 쓰는 필드 (점수 + 비슷한 뉴스 보강)
+CARRIED_FIELDS = ("score", "score_keywords", "news2_url", "news2_date", "news3_url", "news3_date")
+_SIMILAR_COLUMNS = ("뉴스기사2_URL", "뉴스기사2_날짜", "뉴스기사3_URL", "뉴스기사3_날짜")
+
+
+def _enrich_with_similar_news(df: pd.DataFrame, all_news: list, carried: set = frozenset()) -> pd.DataFrame:
+    """
+    뉴스 행에 비슷한 기사 최대 2개 추가 (뉴스기사2_URL, 뉴스기사2_날짜, 뉴스기사3_URL, 뉴스기사3_날짜).
+    all_news는 Article 레코드 또는 dict 리스트.
+    carried(URL 키 집합)에 든 행은 이전 실행의 보강 결과를 그대로 둡니다.
+    """
     out = df.copy()
-    out["뉴스기사2_URL"] = ""
-    out["뉴스기사2_날짜"] = ""
-    out["뉴스기사3_URL"] = ""
-    out["뉴스기사3_날짜"] = ""
+    for column in _SIMILAR_COLUMNS:
+        if column not in out.columns or not carried:
+            out[column] = ""
 
     news_pool = [
         (r.get("news_url", "") or r.get("뉴스기사_URL", ""), r.get("upload_date", "") or r.get("업로드일", ""), r.get("title", ""))
@@ -85,6 +89,10 @@ def _enrich_with_similar_news(df: pd.DataFrame, all_news: list) -> pd.DataFrame:
         news_url = row.get("뉴스기사_URL", "") or row.get("news_url", "")
         if not news_url or not str(news_url).strip():
             continue
+        if carried and url_key(str(news_url)) in carried:
+            continue
+        for column in _SIMILAR_COLUMNS:
+            out.at[idx, column] = ""
         title = row.get("제목", "") or row.get("title", "")
         used_urls = {str(news_url).strip()}
         similar = []
@@ -105,12 +113,12 @@ def _enrich_with_similar_news(df: pd.DataFrame, all_news: list) -> pd.DataFrame:
     return out
 
 
-def _load_existing_data() -> list:
-    """기존 data.js에서 JSON 데이터 로드."""
+def _load_existing_data(data_path: str = None) -> list:
+    """기존 data.js에서 JSON 데이터 로드 (data_path 없으면 프로젝트 루트 data.js)."""
     try:
         # 프로젝트 루트 기준 data.js (현재 파일이 루트에 있음)
         root_dir = os.path.dirname(os.path.abspath(__file__))
-        data_path = os.path.join(root_dir, "data.js")
+        data_path = data_path or os.path.join(root_dir, "data.js")
         
         if not os.path.exists(data_path):
             return []
@@ -134,6 +142,7 @@ def _collect_with_auto_expand(scraper_func, min_results=5, **kwargs):
     """
     자동 기간 확장 수집: 1일 → 3일 → 7일 → 30일
     최소 min_results개 이상 수집될 때까지 기간 확장.
+    출처가 차단되면(SourceUnavailable) 남은 기간은 시도하지 않고 그대로 발생시킵니다.
     
     Args:
         scraper_func: 스크래퍼 함수 (days_back 파라미터 지원 필요)
@@ -152,19 +161,139 @@ def _collect_with_auto_expand(scraper_func, min_results=5, **kwargs):
                 if days_back > 1:
                     print(f"    (기간 확장: {days_back}일)")
                 return results
+        except SourceUnavailable:
+            raise
         except Exception:
             continue
     
     # 모든 시도 실패 시 마지막 시도 결과 반환 (빈 리스트일 수 있음)
     try:
         return scraper_func(days_back=30, **kwargs)
+    except SourceUnavailable:
+        raise
     except Exception:
         return []
 
 
-def main() -> None:
-    """유튜브·구글·네이버 수집 → 어그로 점수 → 엑셀 1개 파일."""
+def _dedupe(seen: SeenSet, items: list, source: str) -> list:
+    """공용 중복 확인 집합으로 이미 나온 기사 제외 (점수·보강 전에). 남은 항목은 검색 키워드별로 집계."""
+    kept = seen.filter(items)
+    run_report.record_queries(source, kept)
+    dropped = len(items) - len(kept)
+    if dropped:
+        run_report.record_event("dedupe", source=source, dropped=dropped)
+        print(f"    (중복 {dropped}건 제외)")
+    return kept
+
+
+def _score_incremental(items: list, prior: dict, seen_index: SeenIndex, carried: set) -> list:
+    """
+    어그로 점수 (실행 간 증분).
+    이전 실행에서 처리해 같은 카테고리에 출력된 기사(색인 + 기존 행)는 점수·비슷한 뉴스를
+    이전 결과로 채우고 URL 키를 carried에 추가하며, 나머지만 새로 점수를 매깁니다.
+
+    Returns:
+        점수 높은 순 정렬된 items
+    """
+    fresh = []
+    for item in items:
+        row = prior.get(url_key(item.url)) if item.url in seen_index else None
+        run_report.record_cache("seen_index", row is not None)
+        # 시간당 조회수를 점수에 반영하면 유튜브는 실행마다 점수가 달라지므로 다시 계산
+        if row is None or (VELOCITY_WEIGHT and item.is_youtube):
+            fresh.append(item)
+            continue
+        previous = Article.from_record(row)
+        for field in CARRIED_FIELDS:
+            setattr(item, field, getattr(previous, field))
+        carried.add(url_key(item.url))
+    analyze_articles(fresh, title_key="title")
+    return sorted(items, key=lambda x: x.score or 0, reverse=True)
+
+
+def _record_breakers(scraper_status: dict, source: str, error: Exception = None, collected: int = 0) -> None:
+    """
+    출처 차단 상태를 scraper_status에 반영.
+    전체 실패(error)면 원인을, 하위 출처가 차단됐으면 수집 건수에 따라 '수집 불가'/'일부 수집 불가'로 표시합니다.
+    """
+    opened = circuit_breaker.open_breakers(source)
+    if opened:
+        scraper_status.setdefault("circuits", {}).update(opened)
+    if isinstance(error, SourceUnavailable):
+        scraper_status[source] = f"수집 불가 ({error.reason})"
+    elif opened and scraper_status.get(source) == "OK":
+        reasons = ", ".join(f"{name}: {state['reason']}" for name, state in opened.items())
+        scraper_status[source] = f"{'일부 수집 불가' if collected else '수집 불가'} ({reasons})"
+
+
+def replay_paths(state_dir: str) -> dict:
+    """
+    카세트 재생용 저장 경로 (모두 state_dir 아래).
+    재생은 실제 웹 데이터·히스토리(data.js, history/ 등)를 읽지도 바꾸지도 않고 빈 상태에서 시작하므로,
+    같은 카세트면 이 컴퓨터의 이전 실행과 관계없이 같은 결과가 나옵니다.
+    """
+    history_dir = os.path.join(state_dir, "history")
+    return {
+        "data_js": os.path.join(state_dir, "data.js"),
+        "data_json": os.path.join(state_dir, "web", "data.json"),
+        "xlsx": os.path.join(state_dir, "xlsx", "agro_report.xlsx"),
+        "history": history_dir,
+        "seen_index": os.path.join(history_dir, "seen_index.bin"),
+        "views": os.path.join(history_dir, "youtube_views.bin"),
+        "keyword_stats": os.path.join(history_dir, "keyword_stats.db"),
+        "redirects": os.path.join(history_dir, "google_redirects.json"),
+        "report": os.path.join(history_dir, "runs", f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"),
+    }
+
+
+def main(category: str = None, push: bool = True, status_timing: bool = False, state_dir: str = None) -> list:
+    """
+    유튜브·구글·네이버 수집 → 어그로 점수 → 엑셀 1개 파일.
+    단계별 소요 시간은 실행 리포트(history/runs/)로 저장됩니다.
+    카세트 재생 중에는 모든 출력·히스토리를 state_dir(없으면 새 임시 폴더)에 저장하고 게시하지 않습니다.
+
+    Args:
+        category: 수집할 카테고리 (None이면 번호 입력으로 선택)
+        push: 완료 후 깃허브 게시(바뀐 파일만 커밋 + 백그라운드 푸시) 여부
+        status_timing: scraperStatus에 소요 시간 요약 포함 여부
+        state_dir: 재생용 저장 폴더 (여러 카테고리를 이어서 재생할 때 같은 폴더 지정)
+
+    Returns:
+        게시 대상 웹 데이터 파일 경로 (출력하지 않았으면 빈 리스트)
+    """
+    run_report.reset(cassette=http_client.cassette_mode())
+    circuit_breaker.reset_all()
+    paths = {}
+    if http_client.cassette_mode() == "replay":
+        state_dir = state_dir or tempfile.mkdtemp(prefix="aggro_replay_")
+        paths = replay_paths(state_dir)
+        configure_resolver(paths["redirects"])
+        run_report.annotate(state_dir=state_dir)
+        print(f"[재생] 출력·히스토리는 임시 폴더에 저장: {state_dir}")
+        push = False
+    try:
+        web_paths = _run(category, status_timing, paths)
+        if push and web_paths:
+            with run_report.stage("publish"):
+                publish_outputs(web_paths)
+        return web_paths
+    finally:
+        try:
+            get_resolver().shutdown()
+        except Exception as e:
+            print(f"[경고] 링크 변환 캐시 저장 실패: {e}")
+        try:
+            run_report.attach("rate_limits", rate_limiter.snapshot())
+            print(f"실행 리포트 저장 완료: {run_report.save(paths.get('report'))}")
+        except Exception as e:
+            print(f"[경고] 실행 리포트 저장 실패: {e}")
+
+
+def _run(category: str, status_timing: bool, paths: dict) -> list:
+    """수집 → 점수 → 병합 → 출력 (main 본문). paths: 저장 경로 (replay_paths, 없는 항목은 기본 경로). 웹 데이터 파일 경로 반환."""
     all_items = []
+    # 카테고리별 상위 N 인덱스 (점수가 매겨질 때마다 갱신)
+    ranking = RankingIndex(TOP_N)
 
     from aggro_keywords import SEARCH_TOPICS, AGGRO_DICTIONARY
     
@@ -172,209 +301,285 @@ def main() -> None:
     # 스크래퍼 상태 추적
     scraper_status = {"youtube": "OK", "google": "OK", "naver": "OK"}
 
-    # 사용자 선택
-    print("\n[주제 선택]")
+    # 사용자 선택 (인자로 받으면 입력 생략)
     topics = list(SEARCH_TOPICS.keys()) # ['정치', '경제', '사회', '이슈', '장년']
-    for i, topic in enumerate(topics):
-        print(f"{i+1}. {topic}")
-    
-    try:
-        choice = int(input("\n번호를 입력하세요: "))
-        if 1 <= choice <= len(topics):
-            selected_category = topics[choice - 1]
-            # 기본적으로 사전(dictionary)에 있는 키워드 우선 사용
-            # + '뉴스' 키워드도 추가해서 포괄적 수집
-            base_keywords = SEARCH_TOPICS.get(selected_category, [])
-            selected_keywords = base_keywords + [selected_category, f"{selected_category} 뉴스"]
-        else:
+    if category is None:
+        print("\n[주제 선택]")
+        for i, topic in enumerate(topics):
+            print(f"{i+1}. {topic}")
+        try:
+            choice = int(input("\n번호를 입력하세요: "))
+        except ValueError:
+            print("숫자를 입력해주세요. 프로그램을 종료합니다.")
+            return []
+        if not 1 <= choice <= len(topics):
             print("잘못된 번호입니다. 프로그램을 종료합니다.")
-            return
-    except ValueError:
-        print("숫자를 입력해주세요. 프로그램을 종료합니다.")
-        return
+            return []
+        category = topics[choice - 1]
+    elif category not in topics:
+        print(f"알 수 없는 카테고리입니다: {category} (선택: {', '.join(topics)})")
+        return []
+
+    selected_category = category
+    run_report.annotate(category=selected_category)
+    # 기본적으로 사전(dictionary)에 있는 키워드 우선 사용
+    # + '뉴스' 키워드도 추가해서 포괄적 수집
+    base_keywords = SEARCH_TOPICS.get(selected_category, [])
+    selected_keywords = base_keywords + [selected_category, f"{selected_category} 뉴스"]
 
     print(f"\n=== [{selected_category}] 카테고리 수집 시작 ===")
+
+    # 기존 데이터 로드 (다른 카테고리 항목은 중복 확인에도 사용)
+    with run_report.stage("load_existing") as st:
+        existing_data = _load_existing_data(paths.get("data_js"))
+        st["items"] = len(existing_data)
+
+    # 출처·병합 공용 중복 확인 (표준 URL 기준, 먼저 나온 항목 유지)
+    # 기존 다른 카테고리 데이터 → 유튜브 → 네이버 → 구글 순
+    seen = SeenSet()
+    final_items = _dedupe(
+        seen, [item for item in existing_data if item.get("카테고리") != selected_category], "existing")
+
+    # 실행 간 처리 기사 색인: 이전에 처리해 이 카테고리에 출력된 기사는 점수·보강 재사용
+    seen_index = SeenIndex(paths.get("seen_index"))
+    prior = {
+        url_key(item_url(item)): item
+        for item in existing_data if item.get("카테고리") == selected_category and item_url(item)
+    }
+    carried = set()
     
     # 1. 유튜브
     try:
         print(f"  유튜브 수집 중 ({selected_keywords[:3]}...)")
-        yt = _collect_with_auto_expand(
-            scrape_youtube,
-            min_results=5,
-            max_per_query=3,
-            max_total=10,
-            query_list=selected_keywords
-        )
-        scored_yt = analyze_articles(yt, title_key="title")
+        with run_report.stage("youtube.collect") as st:
+            yt = _collect_with_auto_expand(
+                scrape_youtube,
+                min_results=5,
+                max_per_query=3,
+                max_total=10,
+                query_list=selected_keywords
+            )
+            st["items"] = len(yt)
+        yt = _dedupe(seen, yt, "youtube")
+        # 조회수 스냅샷 기록 + 시간당 조회수 계산 (실행당 1회)
+        try:
+            with run_report.stage("views") as st:
+                st["items"] = track_views(yt, path=paths.get("views"))
+        except Exception as e:
+            print(f"    [경고] 조회수 기록 실패: {e}")
+        with run_report.stage("score", source="youtube") as st:
+            scored_yt = _score_incremental(yt, prior, seen_index, carried)
+            st["items"] = len(scored_yt)
         for item in scored_yt:
-            row = _to_row(item, "유튜브")
-            row["카테고리"] = selected_category
-            all_items.append(row)
+            item.category = selected_category
+            all_items.append(item)
+        ranking.update(scored_yt)
+        # 키워드별 조회수 성과 누적 (이번 실행 항목만 반영)
+        try:
+            with run_report.stage("keyword_stats") as st:
+                st["items"] = keyword_stats.record_run(scored_yt, selected_category, path=paths.get("keyword_stats"))
+        except Exception as e:
+            print(f"    [경고] 키워드 성과 집계 실패: {e}")
         print(f"    → {len(scored_yt)}건")
     except Exception as e:
         err_msg = str(e)
         print(f"    → 건너뜀 (오류: {err_msg})")
         scraper_status["youtube"] = "수집 불가 (API 오류 등)"
+        _record_breakers(scraper_status, "youtube", e)
+    else:
+        _record_breakers(scraper_status, "youtube", collected=len(scored_yt))
 
     # 2. 구글 뉴스
     try:
         print(f"  구글 뉴스 수집 중...")
-        google = _collect_with_auto_expand(
-            scrape_google_news,
-            min_results=5,
-            max_per_query=5,
-            max_total=10,
-            query_list=selected_keywords
-        )
-        scored_google = analyze_articles(google, title_key="title")
-        for item in scored_google:
-            row = _to_row(item, "구글뉴스")
-            row["카테고리"] = selected_category
-            all_items.append(row)
-        print(f"    → {len(scored_google)}건")
+        with run_report.stage("google.collect") as st:
+            google = _collect_with_auto_expand(
+                scrape_google_news,
+                min_results=5,
+                max_per_query=5,
+                max_total=10,
+                query_list=selected_keywords
+            )
+            st["items"] = len(google)
+        # 중복 확인·점수는 리다이렉트 링크 변환 후 (네이버 수집 뒤)
+        print(f"    → {len(google)}건")
     except Exception as e:
         err_msg = str(e)
         print(f"    → 건너뜀 (오류: {err_msg})")
         scraper_status["google"] = "수집 불가"
+        _record_breakers(scraper_status, "google", e)
+        google = []
+    else:
+        _record_breakers(scraper_status, "google", collected=len(google))
 
     # 3. 네이버 뉴스
     try:
         print(f"  네이버 뉴스 수집 중...")
-        naver_section_map = {
-            "정치": "100", "경제": "101", "사회": "102", 
-            "장년": "103", # 생활/문화
-        }
-        sid1 = naver_section_map.get(selected_category, "100")
-        
-        naver = scrape_ranking_news(
-            economy_count=5, 
-            society_count=5, 
-            total_limit=10, 
-            sid1=sid1,
-            query_list=selected_keywords  # API 사용시에도 해당 카테고리로 검색
-        )  
+        sid1 = section_for_category(selected_category)
         
-        scored_naver = analyze_articles(naver, title_key="title")
+        with run_report.stage("naver.collect") as st:
+            naver = scrape_ranking_news(
+                economy_count=5, 
+                society_count=5, 
+                total_limit=10, 
+                sid1=sid1,
+                query_list=selected_keywords,  # API 사용시에도 해당 카테고리로 검색
+                known=seen_index,
+            )
+            st["items"] = len(naver)
+        naver = _dedupe(seen, naver, "naver")
+
+        with run_report.stage("score", source="naver") as st:
+            scored_naver = _score_incremental(naver, prior, seen_index, carried)
+            st["items"] = len(scored_naver)
         for item in scored_naver:
-            row = _to_row(item, "네이버뉴스")
-            row["카테고리"] = selected_category
-            all_items.append(row)
+            item.category = selected_category
+            all_items.append(item)
+        ranking.update(scored_naver)
         print(f"    → {len(scored_naver)}건")
     except Exception as e:
         err_msg = str(e)
         print(f"    → 건너뜀 (오류: {err_msg})")
         scraper_status["naver"] = "수집 불가"
+        _record_breakers(scraper_status, "naver", e)
+    else:
+        _record_breakers(scraper_status, "naver", collected=len(scored_naver))
+
+    # 구글 뉴스 리다이렉트 링크 → 원문 URL (네이버 수집 동안 백그라운드로 진행된 결과 적용)
+    if google:
+        with run_report.stage("resolve") as st:
+            st["items"] = get_resolver().apply(google)
+        google = _dedupe(seen, google, "google")
+        with run_report.stage("score", source="google") as st:
+            scored_google = _score_incremental(google, prior, seen_index, carried)
+            st["items"] = len(scored_google)
+        for item in scored_google:
+            item.category = selected_category
+            all_items.append(item)
+        ranking.update(scored_google)
 
     if not all_items:
         print("수집된 데이터가 없습니다. .env에 YOUTUBE_API_KEY를 확인하고, feedparser를 설치했는지 확인하세요.")
-        return
+        return []
 
     # 6. 엑셀 출력 & 웹용 JS 출력
     # (카테고리별로 모은 전체 데이터를 점수순 정렬)
     
     # [수정] 기존 데이터 병합 로직
-    # 1. 기존 데이터 로드
-    existing_data = _load_existing_data()
-    
-    # 2. 현재 수집한 카테고리의 기존 데이터 삭제 (업데이트)
+    # 1. 기존 데이터는 수집 전에 로드함
+    # 2. 현재 수집한 카테고리의 기존 데이터 삭제 (업데이트) → final_items (카테고리 간 중복 제외됨)
     # 카테고리가 없는 데이터는 '정치'로 간주하거나 유지? -> 일단 유지
-    final_items = [item for item in existing_data if item.get("카테고리") != selected_category]
     
     # 3. 새 데이터 추가
-    # 새 데이터도 포맷팅 필요 (all_items는 딕셔너리 리스트)
-    # _to_row 시점에서 이미 카테고리는 들어있음.
+    # all_items는 Article 레코드 리스트 (수집 시점에 카테고리 지정됨)
     
     # 점수 정렬 및 보강은 '이번에 수집한 데이터'에 대해서만? 아니면 전체?
     # -> 보강(_enrich)은 이번 수집 데이터에 대해서만 수행하고, 합치는 게 효율적.
     
-    df_new = pd.DataFrame(all_items)
-    if not df_new.empty:
-        df_new["추천점수"] = pd.to_numeric(df_new["score"], errors="coerce").fillna(0)
-        df_new = df_new.sort_values(by="추천점수", ascending=False)
-        
-        # 상위 30개 + 비슷한 뉴스 보강
-        df_new = df_new.head(30).copy()
-        df_new = _enrich_with_similar_news(df_new, all_items)
-        
-        # DataFrame -> Dict List 변환
-        # export_to_js 내부에서 컬럼 매핑 등을 수행하므로, 여기서는 그냥 합쳐서 넘기는 게 복잡함.
-        # export_to_js가 DataFrame을 받으니, 기존 데이터도 DF로 변환해서 합치는 게 낫다.
-        
-        # 기존 데이터 DF 변환
-        if existing_data:
-             df_old = pd.DataFrame(existing_data)
-        else:
-             df_old = pd.DataFrame()
-
-        # 병합: (Existing - CurrentCat) + New
-        # existing_data는 이미 필터링 됨 (final_items)
-        df_final = pd.DataFrame(final_items)
-        
-        # 컬럼 매핑 주의: existing_data는 이미 한글 컬럼명("제목", "추천점수" 등)
-        # df_new는 영문 컬럼명("title", "score" 등) 혼재 가능성 -> _ensure_columns가 처리함.
-        # 하지만 df_new는 _enrich_with_similar_news 거치면서 일부 한글 컬럼("뉴스기사2_URL" 등) 생성됨.
-        # 가장 깔끔한 방법: df_new를 export_to_js 로직과 유사하게 정규화한 뒤 합치기.
-        
-        # 편의상: df_new를 export_to_js에 넘기되, 'append_mode'를 지원하거나
-        # 여기서 다 합쳐서 넘기거나.
-        # export_to_js는 '순위'를 재매김. 카테고리별 순위? 아니면 전체 순위?
-        # 웹 UI는 카테고리별로 필터링해서 보여주므로, 전체 리스트에 순위는 의미가 적음(보여줄 때 다시 매김).
-        # 다만 export_to_js가 순위를 매겨버림.
-        
-        # 결론: df_new와 df_final(기존)을 합쳐서 df_merged를 만들고 export_to_js 호출.
-        # 단, df_final의 컬럼 이름은 "제목", "카테고리" 등 한글.
-        # df_new의 컬럼 이름은 "title", "category" 등 영문.
-        # -> pd.concat 시 컬럼 불일치 발생.
-        
-        # 해결: df_new의 컬럼명을 한글로 매핑한 뒤 병합.
-        from excel_reporter import _ensure_columns
-        df_new_mapped = _ensure_columns(df_new)
-        # _ensure_columns는 OUTPUT_COLUMNS_BASE(한글)만 남김.
-        # 단, '카테고리'가 _ensure_columns 로직에 추가되어 있어야 함. (앞 단계에서 추가했음)
-        
-        # df_final(기존)은 이미 한글 컬럼.
-        # 두 DF 병합
-        df_merged = pd.concat([df_final, df_new_mapped], ignore_index=True)
-        
-        json_path = export_to_js(df_merged, scraper_status=scraper_status)
-        print(f"웹 데이터 파일 업데이트 완료: {json_path}")
+    # Article → 한글 컬럼 매핑은 여기서 한 번만 수행
+    df_all = articles_to_frame(all_items)
+
+    # 분석용 히스토리: 이번 수집분 전체를 Parquet에 추가 (수집일/카테고리 파티션)
+    with run_report.stage("parquet") as st:
+        history_path = export_to_parquet(df_all, output_dir=paths.get("history"))
+        st["items"] = len(df_all)
+    if history_path:
+        print(f"히스토리(Parquet) 추가 완료: {history_path}")
+
+    # 기존 다른 카테고리 데이터도 인덱스에 반영 → 카테고리마다 상위 N 유지
+    with run_report.stage("rank") as st:
+        st["items"] = ranking.update(final_items)
+
+    if not df_all.empty:
+        # 이번 카테고리 상위 N (인덱스에서 바로 꺼냄, 전체 정렬 없음) + 비슷한 뉴스 보강
+        with run_report.stage("enrich") as st:
+            df_new = articles_to_frame(ranking.top(selected_category))
+            df_new = _enrich_with_similar_news(df_new, all_items, carried)
+            st["items"] = len(df_new)
+
+        # 병합: (Existing - CurrentCat) + New, 기존 항목은 이미 한글 컬럼
+        with run_report.stage("merge") as st:
+            df_final = pd.DataFrame([
+                item
+                for category in ranking.categories() if category != selected_category
+                for item in ranking.top(category)
+            ])
+            df_merged = pd.concat([df_final, df_new], ignore_index=True)
+            st["items"] = len(df_merged)
+
+        if status_timing:
+            scraper_status["timing"] = run_report.summary()
+
+        # 순위 데이터는 한 번만 준비하고 엑셀·JSON·JS로 동시에 저장
+        with run_report.stage("export") as st:
+            paths = export_all(
+                df_merged,
+                sinks=("xlsx", "json", "js"),
+                output_paths={"xlsx": paths.get("xlsx"), "json": paths.get("data_json"), "js": paths.get("data_js")},
+                per_category=True,
+                parallel=True,
+                scraper_status=scraper_status,
+            )
+            st["items"] = len(df_merged)
+        print(f"웹 데이터 파일 업데이트 완료: {paths['js']}")
+        print(f"엑셀 리포트 저장 완료: {paths['xlsx']}")
         print(f"총 {len(df_merged)}건 (누적)")
+        # 출력까지 끝난 기사만 처리 완료로 기록 (실패 시 다음 실행에서 다시 처리)
+        try:
+            seen_index.mark(item.url for item in all_items)
+            seen_index.save()
+        except Exception as e:
+            print(f"[경고] 처리 기사 색인 저장 실패: {e}")
+        return [paths["js"], paths["json"]]
 
     else:
         print("이번 실행에서 수집된 데이터가 없습니다. 기존 데이터 유지.")
         # 수집 실패해도 기존 데이터는 유지하고 status만 업데이트 필요할 수 있음.
         # 여기서는 간단히 패스.
+    return []
 
 
-    # 7. 깃허브 자동 푸시
-    git_push()
-
-
-def git_push():
-    """데이터 생성 후 깃허브에 자동 푸시"""
-    print("\n[Git] 깃허브 자동 푸시 시작...")
+def publish_outputs(paths: list) -> None:
+    """웹 데이터 파일 중 바뀐 것만 커밋하고 백그라운드로 푸시 (변경 없으면 생략)."""
+    print("\n[Git] 데이터 게시...")
     try:
-        # 프로젝트 루트로 이동 (현재 파일이 루트에 있음)
-        root_dir = os.path.dirname(os.path.abspath(__file__))
-        
-        # 1. git add
-        subprocess.run(["git", "add", "."], cwd=root_dir, check=True)
-        
-        # 2. git commit
-        # 변경사항이 없으면 에러가 날 수 있으므로 check=False로 하고 출력만 확인하거나
-        # status를 먼저 체크할 수도 있음. 여기서는 간단히 try로 감쌈.
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        commit_msg = f"Auto: Update data files ({current_time})"
-        subprocess.run(["git", "commit", "-m", commit_msg], cwd=root_dir, check=False)
-        
-        # 3. git push
-        subprocess.run(["git", "push", "origin", "main"], cwd=root_dir, check=True)
-        print("[Git] 푸시 완료!")
-        
+        publisher.publish(paths)
     except Exception as e:
-        print(f"[Git] 푸시 실패: {e}")
+        print(f"[Git] 게시 실패: {e}")
+
 
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="유튜브·구글·네이버 통합 수집")
+    parser.add_argument("categories", nargs="*", help="카테고리 (여러 개 가능, 생략 시 번호 입력)")
+    parser.add_argument("--cassette", choices=["record", "replay"], default=None,
+                        help="HTTP 응답 녹화/재생 (재생 시 네트워크 미사용)")
+    parser.add_argument("--cassette-dir", default=None, help="카세트 폴더 (기본: cassettes/)")
+    parser.add_argument("--latency", default=None,
+                        help="재생 지연: recorded(녹화 당시 소요 시간) 또는 밀리초")
+    parser.add_argument("--no-push", action="store_true", help="깃허브 게시(커밋·푸시) 생략")
+    parser.add_argument("--status-timing", action="store_true",
+                        help="data.js의 scraperStatus에 단계별 소요 시간 요약 포함")
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
-    main()
+    args = _parse_args()
+    if args.cassette:
+        http_client.configure_cassette(args.cassette, args.cassette_dir, args.latency)
+    push = not args.no_push and args.cassette != "replay"
+    if len(args.categories) <= 1:
+        main(
+            category=args.categories[0] if args.categories else None,
+            push=push,
+            status_timing=args.status_timing,
+        )
+    else:
+        # 여러 카테고리를 차례로 갱신하고 게시는 마지막에 한 번 (커밋·푸시 1회)
+        web_paths = []
+        # 재생은 카테고리마다 같은 임시 폴더에 이어서 저장 (실제 실행처럼 앞 카테고리 결과 위에 병합)
+        state_dir = tempfile.mkdtemp(prefix="aggro_replay_") if args.cassette == "replay" else None
+        for category in args.categories:
+            web_paths = main(category=category, push=False, status_timing=args.status_timing,
+                             state_dir=state_dir) or web_paths
+        if push and web_paths:
+            publish_outputs(web_paths)
@@ -0,0 +1,7 @@
+"""테스트 공통 설정: py/ 모듈을 바로 import할 수 있도록 경로 추가."""
+
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "py"))
@@ -0,0 +1,97 @@
+"""circuit_breaker: 오류 분류, 즉시/연속 차단, 성공 시 초기화, 출처별 조회."""
+
+import pytest
+import requests
+
+import circuit_breaker
+from circuit_breaker import (
+    FATAL, TRANSIENT, CircuitBreaker, FatalSourceError, SourceUnavailable, classify_error,
+)
+
+
+def _http_error(status: int) -> requests.HTTPError:
+    resp = requests.Response()
+    resp.status_code = status
+    return requests.HTTPError(response=resp)
+
+
+@pytest.fixture(autouse=True)
+def fresh_breakers():
+    circuit_breaker.reset_all()
+    yield
+    circuit_breaker.reset_all()
+
+
+@pytest.mark.parametrize("exc, kind", [
+    (FatalSourceError("키 없음"), FATAL),
+    (_http_error(401), FATAL),
+    (_http_error(403), FATAL),
+    (_http_error(429), FATAL),
+    (_http_error(500), TRANSIENT),
+    (_http_error(404), TRANSIENT),
+    (requests.Timeout(), TRANSIENT),
+    (requests.ConnectionError(), TRANSIENT),
+    (ValueError("파싱 오류"), TRANSIENT),
+])
+def test_classify_error(exc, kind):
+    assert classify_error(exc) == kind
+
+
+def test_fatal_error_opens_immediately():
+    breaker = CircuitBreaker("youtube")
+    assert breaker.record_failure(_http_error(403)) == FATAL
+    assert breaker.is_open
+    assert breaker.reason == "인증/할당량 오류 (HTTP 403)"
+    with pytest.raises(SourceUnavailable) as info:
+        breaker.check()
+    assert info.value.source == "youtube"
+    assert breaker.snapshot()["skipped"] == 1
+
+
+def test_transient_errors_open_at_threshold_and_success_resets():
+    breaker = CircuitBreaker("google.rss", threshold=3)
+    breaker.record_failure(requests.Timeout())
+    breaker.record_failure(requests.Timeout())
+    breaker.record_success()
+    breaker.record_failure(requests.Timeout())
+    breaker.record_failure(requests.Timeout())
+    assert not breaker.is_open
+    breaker.record_failure(requests.ConnectionError())
+    assert breaker.is_open
+    assert breaker.kind == TRANSIENT
+    assert breaker.reason == "연결 실패"
+
+
+def test_open_breaker_stays_open_after_success():
+    breaker = CircuitBreaker("naver.api")
+    breaker.record_failure(FatalSourceError("키 없음"))
+    breaker.record_success()
+    assert breaker.is_open
+    assert not breaker.allow()
+
+
+def test_call_records_result_and_reraises():
+    breaker = CircuitBreaker("newsapi", threshold=1)
+    assert breaker.call(lambda x: x * 2, 21) == 42
+
+    def fail():
+        raise requests.Timeout()
+
+    with pytest.raises(requests.Timeout):
+        breaker.call(fail)
+    assert breaker.is_open
+    with pytest.raises(SourceUnavailable):
+        breaker.call(lambda: "호출되지 않음")
+
+
+def test_registry_and_open_breakers_by_prefix():
+    rss = circuit_breaker.get_breaker("google.rss")
+    assert circuit_breaker.get_breaker("google.rss") is rss
+    rss.record_failure(_http_error(429))
+    circuit_breaker.get_breaker("google.newsapi")
+    circuit_breaker.get_breaker("googlex").record_failure(FatalSourceError("x"))
+
+    assert list(circuit_breaker.open_breakers("google")) == ["google.rss"]
+    assert set(circuit_breaker.open_breakers()) == {"google.rss", "googlex"}
+    circuit_breaker.reset_all()
+    assert circuit_breaker.open_breakers() == {}
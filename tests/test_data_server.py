@@ -0,0 +1,132 @@
+"""data_server: 조회 API, ETag/304, gzip, data.js 변경 시 다시 읽기, 예상 못 한 오류의 500 응답."""
+
+import gzip
+import http.client
+import json
+import os
+import threading
+from urllib.parse import quote
+
+import pytest
+
+import data_server
+
+
+def _write_data(path, rows, status=None):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"const keywordData = {json.dumps(rows, ensure_ascii=False)};\n")
+        f.write(f"const scraperStatus = {json.dumps(status or {'youtube': 'OK'}, ensure_ascii=False)};\n")
+
+
+ROWS = [
+    {"제목": "a", "카테고리": "정치", "출처": "유튜브", "업로드일": "2026-02-01", "추천점수": 3},
+    {"제목": "b", "카테고리": "정치", "출처": "네이버뉴스", "업로드일": "2026-02-05", "추천점수": 9},
+    {"제목": "c", "카테고리": "경제", "출처": "유튜브", "업로드일": "", "추천점수": 5},
+]
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_server, "RELOAD_CHECK_S", 0.0)
+    path = str(tmp_path / "data.js")
+    _write_data(path, ROWS)
+    srv = data_server.make_server("127.0.0.1", 0, path)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv, path
+    srv.shutdown()
+    srv.server_close()
+
+
+def _get(srv, path, headers=None):
+    conn = http.client.HTTPConnection("127.0.0.1", srv.server_address[1], timeout=10)
+    try:
+        conn.request("GET", quote(path, safe="/?=&"), headers=headers or {})
+        resp = conn.getresponse()
+        return resp.status, dict(resp.getheaders()), resp.read()
+    finally:
+        conn.close()
+
+
+def test_items_are_filtered_and_sorted_by_score(server):
+    srv, _ = server
+    status, _, body = _get(srv, "/api/items?category=정치&from=2026-02-03")
+    data = json.loads(body)
+    assert status == 200
+    assert [r["제목"] for r in data["items"]] == ["b"]
+
+    _, _, body = _get(srv, "/api/items")
+    assert [r["제목"] for r in json.loads(body)["items"]] == ["b", "c", "a"]
+
+
+def test_etag_revalidation_returns_304(server):
+    srv, _ = server
+    status, headers, body = _get(srv, "/api/categories")
+    assert status == 200
+    etag = headers["ETag"]
+    assert json.loads(body)["categories"] == {"정치": 2, "경제": 1}
+
+    status, headers, body = _get(srv, "/api/categories", {"If-None-Match": etag})
+    assert status == 304
+    assert headers["ETag"] == etag
+    assert body == b""
+
+
+def test_reload_when_data_file_changes(server):
+    srv, path = server
+    _, headers, _ = _get(srv, "/api/items")
+    etag = headers["ETag"]
+
+    _write_data(path, ROWS + [{"제목": "d", "카테고리": "사회", "출처": "유튜브", "업로드일": "", "추천점수": 1}])
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+    status, headers, body = _get(srv, "/api/items", {"If-None-Match": etag})
+    assert status == 200
+    assert headers["ETag"] != etag
+    assert json.loads(body)["total"] == 4
+
+
+def test_broken_data_file_keeps_last_good_rows(server, capsys):
+    srv, path = server
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("const keywordData = [{")
+    status, _, body = _get(srv, "/api/items")
+    assert status == 200
+    assert json.loads(body)["total"] == 3
+
+
+def test_gzip_when_accepted(server):
+    srv, path = server
+    _write_data(path, [dict(ROWS[0], 제목=f"제목 {i}") for i in range(100)])
+    status, headers, body = _get(srv, "/api/items?per_page=100", {"Accept-Encoding": "gzip"})
+    assert status == 200
+    assert headers["Content-Encoding"] == "gzip"
+    assert len(json.loads(gzip.decompress(body))["items"]) == 100
+
+
+def test_status_has_no_cached_date_field(server):
+    srv, _ = server
+    _, _, body = _get(srv, "/api/status")
+    data = json.loads(body)
+    assert data["rows"] == 3
+    assert data["scraperStatus"] == {"youtube": "OK"}
+    assert "today" not in data
+
+
+def test_bad_request_and_unknown_path(server):
+    srv, _ = server
+    assert _get(srv, "/api/items?top=x")[0] == 400
+    assert _get(srv, "/nope")[0] == 404
+
+
+def test_unexpected_error_returns_500(server, monkeypatch):
+    srv, _ = server
+
+    def boom(params):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(srv.RequestHandlerClass.store, "query", boom)
+    status, _, body = _get(srv, "/api/items?page=2")
+    assert status == 500
+    assert json.loads(body) == {"error": "서버 오류"}
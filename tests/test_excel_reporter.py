@@ -0,0 +1,46 @@
+"""excel_reporter: 업로드일 정규화 (값 단위·컬럼 단위 결과 일치, Tue/Thu 요일 RFC 2822 날짜)."""
+
+import pandas as pd
+import pytest
+
+from excel_reporter import _normalize_date, _normalize_date_column
+
+CASES = [
+    ("2026-02-03", "2026-02-03"),
+    ("2026-02-03T09:15:00Z", "2026-02-03"),
+    ("2026-02-03T23:59:59.123+09:00", "2026-02-03"),
+    ("2026-02-03 10:00", "2026-02-03"),
+    ("Tue, 03 Feb 2026 09:15:00 +0900", "2026-02-03"),   # 요일에 T가 있어도 ISO로 오인하지 않음
+    ("Thu, 5 Feb 2026 21:00:00 GMT", "2026-02-05"),
+    ("Mon, 02 Feb 2026 10:00:00 +0000", "2026-02-02"),
+    ("  2026-02-03  ", "2026-02-03"),
+    ("어제", ""),
+    ("", ""),
+    (None, ""),
+    (float("nan"), ""),
+]
+
+
+@pytest.mark.parametrize("value, expected", CASES)
+def test_normalize_date(value, expected):
+    assert _normalize_date(value) == expected
+
+
+def test_column_matches_scalar_normalization():
+    values = pd.Series([v for v, _ in CASES] * 3, index=range(100, 100 + 3 * len(CASES)), dtype=object)
+    result = _normalize_date_column(values)
+    assert list(result.index) == list(values.index)
+    assert result.tolist() == [expected for _, expected in CASES] * 3
+
+
+@pytest.mark.parametrize("values", [
+    ["Tue, 03 Feb 2026 09:15:00 +0900", "Thu, 05 Feb 2026 01:00:00 +0900", "2026-02-01T00:00:00Z"],
+    ["2026-02-01T00:00:00Z", "2026-02-02T12:00:00+09:00", "Thu, 05 Feb 2026 01:00:00 +0900"],
+])
+def test_column_falls_back_for_values_outside_detected_format(values):
+    # 감지된 형식(다수)과 다른 형식의 값도 기존 로직으로 처리
+    assert _normalize_date_column(pd.Series(values)).tolist() == [_normalize_date(v) for v in values]
+
+
+def test_empty_column():
+    assert _normalize_date_column(pd.Series([], dtype=object)).tolist() == []
@@ -0,0 +1,69 @@
+"""http_client 카세트: 날짜 요청 값 정규화, 녹화 시각 고정 재생."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+
+import http_client
+
+RECORDED = datetime(2026, 3, 2, 9, 30, tzinfo=timezone.utc)
+URL = "https://www.googleapis.com/youtube/v3/search"
+
+
+@pytest.fixture
+def cassette(tmp_path, monkeypatch):
+    """임시 카세트 폴더 (테스트 후 카세트 끄기)."""
+    monkeypatch.setattr(http_client, "_wall_now", lambda: RECORDED)
+    yield str(tmp_path)
+    http_client.configure_cassette(None)
+
+
+def _fake_get(url, params=None, headers=None, timeout=None):
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.url = url
+    resp.encoding = "utf-8"
+    resp._content = b'{"items": []}'
+    return resp
+
+
+def _params():
+    published_after = (http_client.utcnow() - timedelta(days=7)).strftime("%Y-%m-%dT00:00:00Z")
+    return {"q": "test", "publishedAfter": published_after}
+
+
+def test_date_params_are_keyed_relative_to_today(cassette, monkeypatch):
+    http_client.configure_cassette("record", cassette)
+    first = http_client._cassette_path("GET", URL, _params())
+    monkeypatch.setattr(http_client, "_wall_now", lambda: RECORDED + timedelta(days=30))
+    assert http_client._cassette_path("GET", URL, _params()) == first
+    # 기간이 다르면 다른 카세트
+    assert http_client._cassette_path("GET", URL, {**_params(), "publishedAfter": "2026-03-01T00:00:00Z"}) != first
+
+
+def test_non_date_time_param_is_dropped_from_key():
+    assert http_client._key_params({"q": "a", "from": "어제"}) == {"q": "a"}
+
+
+def test_replay_on_a_later_day_uses_recording_clock(cassette, monkeypatch):
+    monkeypatch.setattr(http_client.requests, "get", _fake_get)
+    http_client.configure_cassette("record", cassette)
+    http_client.get(URL, params=_params())
+
+    monkeypatch.setattr(http_client, "_wall_now", lambda: RECORDED + timedelta(days=10))
+    http_client.configure_cassette("replay", cassette)
+    assert http_client.utcnow() == RECORDED.replace(tzinfo=None)
+    assert http_client.now() == RECORDED.astimezone().replace(tzinfo=None)
+    assert http_client.get(URL, params=_params()).json() == {"items": []}
+
+
+def test_live_clock_outside_replay(cassette):
+    http_client.configure_cassette(None)
+    assert http_client.utcnow() == RECORDED.replace(tzinfo=None)
+
+
+def test_replay_without_recording_time_falls_back_to_wall_clock(cassette, monkeypatch, capsys):
+    http_client.configure_cassette("replay", cassette)
+    assert http_client.utcnow() == RECORDED.replace(tzinfo=None)
+    assert "녹화 시각" in capsys.readouterr().out
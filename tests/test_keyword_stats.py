@@ -0,0 +1,87 @@
+"""keyword_stats: 키워드별 조회수 집계, 다시 수집된 영상의 변화분, 최근 가중 상승폭."""
+
+import math
+
+import pytest
+
+import keyword_stats
+from article import Article
+from keyword_stats import HALF_LIFE_DAYS, KeywordStats, record_run
+
+DAY = 86400
+T0 = 1_770_000_000.0
+
+
+def _video(vid: str, views: int, keywords: str = "") -> Article:
+    return Article(title=vid, url=f"https://www.youtube.com/watch?v={vid}", source="유튜브",
+                   views=views, score_keywords=keywords)
+
+
+@pytest.fixture
+def stats(tmp_path):
+    with KeywordStats(str(tmp_path / "keyword_stats.db")) as s:
+        yield s
+
+
+def test_lift_against_category_baseline(stats):
+    stats.update([_video("AAAAAAAAAAA", 10_000, "폭락"), _video("BBBBBBBBBBB", 100)], "경제", now=T0)
+    (row,) = stats.rank("경제", min_hits=1, now=T0)
+    assert row["keyword"] == "폭락"
+    assert row["hits"] == 1
+    assert row["mean_views"] == 10_000
+    expected = round(math.exp((math.log1p(10_000) - math.log1p(100)) / 2), 3)
+    assert row["lift"] == row["recent_lift"] == expected
+    # 전체 카테고리("*")에도 합산
+    assert stats.rank(min_hits=1, now=T0)[0]["hits"] == 1
+
+
+def test_growth_of_old_video_uses_its_original_weight(stats):
+    stats.update([_video("AAAAAAAAAAA", 100, "폭락"), _video("BBBBBBBBBBB", 10_000)], "경제", now=T0)
+    later = T0 + HALF_LIFE_DAYS * DAY
+    stats.update([_video("AAAAAAAAAAA", 1_000_000, "폭락")], "경제", now=later)
+
+    (row,) = stats.rank("경제", min_hits=1, now=later)
+    assert row["hits"] == 1  # 다시 수집돼도 영상 수는 그대로
+    # 두 영상 모두 같은 시점에 처음 반영 → 최근 가중 평균도 전체 평균과 같아야 함
+    expected = round(math.exp((math.log1p(1_000_000) - math.log1p(10_000)) / 2), 3)
+    assert row["lift"] == expected
+    assert row["recent_lift"] == expected
+
+
+def test_recent_lift_favours_newly_seen_videos(stats):
+    stats.update([_video("AAAAAAAAAAA", 100, "폭락")], "경제", now=T0)
+    later = T0 + HALF_LIFE_DAYS * DAY
+    stats.update([_video("BBBBBBBBBBB", 10_000, "폭락"), _video("CCCCCCCCCCC", 1_000)], "경제", now=later)
+
+    (row,) = stats.rank("경제", min_hits=1, now=later)
+    a, b, c = math.log1p(100), math.log1p(10_000), math.log1p(1_000)
+    keyword_recent = (0.5 * a + b) / 1.5
+    base_recent = (0.5 * a + b + c) / 2.5
+    assert row["recent_lift"] == round(math.exp(keyword_recent - base_recent), 3)
+    assert row["lift"] == round(math.exp((a + b) / 2 - (a + b + c) / 3), 3)
+
+
+def test_record_run_persists_and_skips_non_youtube(tmp_path):
+    path = str(tmp_path / "keyword_stats.db")
+    news = Article(title="기사", url="https://n.news.naver.com/article/001/0000000001", source="네이버")
+    assert record_run([_video("AAAAAAAAAAA", 500, "폭락, 긴급"), news], "경제", path=path) == 1
+    assert record_run([_video("AAAAAAAAAAA", 800, "폭락, 긴급")], "경제", path=path) == 1
+    with KeywordStats(path) as stats:
+        rows = {r["keyword"]: r for r in stats.rank("경제", min_hits=1)}
+    assert set(rows) == {"폭락", "긴급"}
+    assert rows["폭락"]["hits"] == 1
+    assert rows["폭락"]["mean_views"] == 800
+
+
+def test_expired_video_counts_as_new(stats):
+    stats.update([_video("AAAAAAAAAAA", 100, "폭락")], "경제", now=T0)
+    later = T0 + (keyword_stats.VIDEO_TTL_DAYS + 1) * DAY
+    stats.update([_video("AAAAAAAAAAA", 200, "폭락")], "경제", now=later)
+    (row,) = stats.rank("경제", min_hits=1, now=later)
+    assert row["hits"] == 2
+
+
+def test_compaction_caps_video_records(stats, monkeypatch):
+    monkeypatch.setattr(keyword_stats, "MAX_VIDEOS", 2)
+    stats.update([_video(f"VIDEO{i:06d}", 10) for i in range(3)], "경제", now=T0)
+    assert stats._db.execute("SELECT COUNT(*) FROM videos").fetchone()[0] == 2
@@ -0,0 +1,117 @@
+"""publisher: 로컬 bare 저장소를 원격으로 두고 바뀐 파일만 커밋, 변경 없으면 생략, 푸시 합치기."""
+
+import os
+import subprocess
+import time
+
+import pytest
+
+import publisher
+
+
+def _git(repo, *args):
+    return subprocess.run(["git", *args], cwd=repo, capture_output=True, text=True, check=True).stdout.strip()
+
+
+def _write(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """작업 저장소(main) + 원격 bare 저장소(origin), 웹 데이터 파일 2개와 다른 파일 1개 커밋·푸시된 상태."""
+    for name in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{name}_NAME", "test")
+        monkeypatch.setenv(f"GIT_{name}_EMAIL", "test@example.com")
+    remote = tmp_path / "remote.git"
+    work = tmp_path / "work"
+    subprocess.run(["git", "init", "--bare", "-q", str(remote)], check=True)
+    work.mkdir()
+    _git(work, "init", "-q")
+    _git(work, "checkout", "-q", "-b", "main")
+    (work / "web").mkdir()
+    _write(work / "data.js", "const keywordData = [];")
+    _write(work / "web" / "data.json", "[]")
+    _write(work / "notes.txt", "memo")
+    _git(work, "add", ".")
+    _git(work, "commit", "-q", "-m", "init")
+    _git(work, "remote", "add", "origin", str(remote))
+    _git(work, "push", "-q", "origin", "main")
+    return str(work), str(remote)
+
+
+def _outputs(work):
+    return [os.path.join(work, "data.js"), os.path.join(work, "web", "data.json")]
+
+
+def _remote_head(remote):
+    return _git(remote, "rev-parse", "main")
+
+
+def test_commits_only_changed_artifacts(repo):
+    work, _ = repo
+    _write(os.path.join(work, "data.js"), "const keywordData = [1];")
+    _write(os.path.join(work, "notes.txt"), "작업 중인 다른 변경")
+    _git(work, "add", "notes.txt")
+
+    commit = publisher.publish(_outputs(work), repo_dir=work, push=False)
+
+    assert commit == _git(work, "rev-parse", "HEAD")
+    assert _git(work, "show", "--name-only", "--format=", commit).splitlines() == ["data.js"]
+    # 다른 파일의 스테이징은 그대로
+    assert _git(work, "diff", "--cached", "--name-only") == "notes.txt"
+
+
+def test_unchanged_run_makes_no_commit_and_no_push(repo, monkeypatch):
+    work, remote = repo
+    spawned = []
+    monkeypatch.setattr(publisher, "_spawn_push_worker", lambda *a: spawned.append(a))
+    head = _git(work, "rev-parse", "HEAD")
+
+    assert publisher.publish(_outputs(work), repo_dir=work) is None
+
+    assert _git(work, "rev-parse", "HEAD") == head
+    assert spawned == []
+    assert not os.path.exists(os.path.join(publisher._git_dir(work), publisher.PENDING_NAME))
+    assert _remote_head(remote) == head
+
+
+def test_back_to_back_publishes_coalesce_into_one_push(repo, monkeypatch):
+    work, remote = repo
+    # 백그라운드 작업 프로세스 대신 아래에서 직접 실행
+    monkeypatch.setattr(publisher, "_spawn_push_worker", lambda *a: None)
+    _write(os.path.join(work, "data.js"), "const keywordData = [1];")
+    publisher.publish(_outputs(work), repo_dir=work)
+    _write(os.path.join(work, "web", "data.json"), "[1]")
+    second = publisher.publish(_outputs(work), repo_dir=work)
+
+    assert publisher.run_push_worker(work, "origin", "main") == 1
+    assert _remote_head(remote) == second
+    # 대기 표시가 없으면 작업 프로세스는 푸시하지 않음
+    assert publisher.run_push_worker(work, "origin", "main") == 0
+
+
+def test_worker_skips_while_another_push_holds_the_lock(repo, monkeypatch):
+    work, remote = repo
+    monkeypatch.setattr(publisher, "_spawn_push_worker", lambda *a: None)
+    _write(os.path.join(work, "data.js"), "const keywordData = [1];")
+    commit = publisher.publish(_outputs(work), repo_dir=work)
+    git_dir = publisher._git_dir(work)
+    _write(os.path.join(git_dir, publisher.LOCK_NAME), "1")
+
+    assert publisher.run_push_worker(work, "origin", "main") == 0
+    # 대기 표시는 잠금을 가진 작업 프로세스가 처리하도록 남겨 둠
+    assert os.path.exists(os.path.join(git_dir, publisher.PENDING_NAME))
+    assert _remote_head(remote) != commit
+
+
+def test_background_push_reaches_remote(repo):
+    work, remote = repo
+    _write(os.path.join(work, "data.js"), "const keywordData = [1];")
+    commit = publisher.publish(_outputs(work), repo_dir=work)
+
+    deadline = time.time() + 30
+    while _remote_head(remote) != commit and time.time() < deadline:
+        time.sleep(0.2)
+    assert _remote_head(remote) == commit
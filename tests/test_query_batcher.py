@@ -0,0 +1,42 @@
+"""query_batcher: OR 검색어 만들기, 길이·개수 제한 묶음, 결과 키워드 재배정."""
+
+import pytest
+
+from query_batcher import build_query, match_keywords, plan_batches
+
+
+def test_build_query_quotes_phrases():
+    assert build_query(["국세청", "세계 최초", 'a"b']) == '국세청 OR "세계 최초" OR ab'
+    assert build_query(["a", "b"], separator="|") == "a|b"
+
+
+def test_batches_respect_max_length_and_keep_order():
+    keywords = ["가가가", "나나나", "다다다", "라라라"]
+    batches = plan_batches(keywords, max_length=len("가가가 OR 나나나"))
+    assert batches == [["가가가", "나나나"], ["다다다", "라라라"]]
+    for batch in batches:
+        assert len(build_query(batch)) <= len("가가가 OR 나나나")
+
+
+def test_batches_respect_max_terms():
+    assert plan_batches(list("abcde"), max_length=500, max_terms=2) == [["a", "b"], ["c", "d"], ["e"]]
+
+
+def test_duplicates_blanks_and_oversized_keywords():
+    batches = plan_batches(["a", " a ", "", None, "b", "아주 긴 키워드 하나", "c"], max_length=8)
+    assert batches == [["a", "b"], ["아주 긴 키워드 하나"], ["c"]]
+
+
+def test_empty_input():
+    assert plan_batches([], max_length=100) == []
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("국세청, 세무조사 착수", ["국세청"]),
+    ("세계최초 공개", ["세계 최초"]),        # 띄어쓰기 차이 무시
+    ("최초로 세계에 공개", ["세계 최초"]),   # 여러 단어 키워드는 모든 단어가 있으면 일치
+    ("GDP 발표", ["gdp"]),                   # 대소문자 무시
+    ("관련 없음", []),
+])
+def test_match_keywords(text, expected):
+    assert match_keywords(text, ["국세청", "세계 최초", "gdp", " "]) == expected
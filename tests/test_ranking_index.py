@@ -0,0 +1,110 @@
+"""RankingIndex: 상위 N 유지, 같은 URL 교체, 동점 순서."""
+
+import random
+
+import pytest
+
+from article import Article
+from ranking_index import RankingIndex
+
+
+def _row(title, score, category="정치", url=None, source="유튜브"):
+    return {
+        "제목": title,
+        "추천점수": score,
+        "카테고리": category,
+        "출처": source,
+        "유튜브_URL": url if url is not None else f"https://www.youtube.com/watch?v={title}",
+    }
+
+
+def _titles(items):
+    return [item["제목"] for item in items]
+
+
+def test_top_n_evicts_lowest():
+    index = RankingIndex(3)
+    for title, score in [("a", 1), ("b", 5), ("c", 3), ("d", 4), ("e", 2)]:
+        index.add(_row(title, score))
+    assert _titles(index.top("정치")) == ["b", "d", "c"]
+    assert len(index) == 3
+
+
+def test_add_reports_whether_item_entered_top_n():
+    index = RankingIndex(2)
+    assert index.add(_row("a", 5))
+    assert index.add(_row("b", 4))
+    assert not index.add(_row("c", 1))
+    assert index.add(_row("d", 10))
+    assert _titles(index.top("정치")) == ["d", "a"]
+
+
+def test_same_url_keeps_higher_score():
+    index = RankingIndex(3)
+    url = "https://www.youtube.com/watch?v=same"
+    index.add(_row("old", 2, url=url))
+    assert not index.add(_row("lower", 1, url=url))
+    assert index.add(_row("higher", 7, url=url))
+    assert _titles(index.top("정치")) == ["higher"]
+    assert len(index) == 1
+
+
+def test_replaced_entry_is_not_evicted_again():
+    # 교체로 삭제 표시된 항목이 힙에 남아 있어도 다른 항목을 밀어내지 않아야 함
+    index = RankingIndex(2)
+    index.add(_row("a", 1, url="u1"))
+    index.add(_row("b", 2, url="u2"))
+    index.add(_row("a2", 5, url="u1"))
+    index.add(_row("c", 3, url="u3"))
+    assert _titles(index.top("정치")) == ["a2", "c"]
+    assert len(index) == 2
+
+
+def test_repeated_replacement_keeps_heap_bounded():
+    index = RankingIndex(2)
+    for score in range(50):
+        index.add(_row(f"t{score}", score, url="same"))
+    assert _titles(index.top("정치")) == ["t49"]
+    assert all(len(heap) <= 2 * index.top_n + 1 for heap in index._heaps.values())
+
+
+def test_ties_break_by_url_then_title_regardless_of_order():
+    rows = [_row(t, 5, url=u) for t, u in [("x", "u3"), ("y", "u1"), ("z", "u2"), ("w", "u4")]]
+    expected = ["y", "z", "x"]
+    for seed in range(5):
+        random.Random(seed).shuffle(rows)
+        index = RankingIndex(3)
+        index.update(rows)
+        assert _titles(index.top("정치")) == expected
+
+
+def test_categories_are_independent():
+    index = RankingIndex(1)
+    index.add(_row("p", 1, category="정치"))
+    index.add(_row("e", 9, category="경제"))
+    index.add(_row("p2", 2, category="정치"))
+    assert index.categories() == ["경제", "정치"]
+    assert _titles(index.export_items()) == ["e", "p2"]
+    index.discard_category("정치")
+    assert index.categories() == ["경제"]
+
+
+def test_by_source_keeps_top_n_per_source():
+    index = RankingIndex(1, by_source=True)
+    index.add(_row("y1", 1, source="유튜브"))
+    index.add(_row("y2", 3, source="유튜브"))
+    index.add(_row("n1", 2, source="네이버뉴스", url="https://n.news.naver.com/article/001/0000000001"))
+    assert _titles(index.top("정치", source="유튜브")) == ["y2"]
+    assert _titles(index.top("정치")) == ["y2", "n1"]
+
+
+def test_accepts_article_objects():
+    index = RankingIndex(2)
+    index.add(Article(title="a", url="https://x/a", source="유튜브", score=1.0, category="사회"))
+    index.add(Article(title="b", url="https://x/b", source="유튜브", score=2.0, category="사회"))
+    assert [a.title for a in index.top("사회")] == ["b", "a"]
+
+
+def test_invalid_top_n():
+    with pytest.raises(ValueError):
+        RankingIndex(0)
@@ -0,0 +1,106 @@
+"""rate_limiter: 토큰 버킷 대기, 429/5xx 감속·백오프, 회복, Retry-After 해석, 환경 변수 설정."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+import rate_limiter
+from rate_limiter import TokenBucket
+
+
+class FakeClock:
+    """time.monotonic / time.sleep 대체 (sleep은 시계만 앞으로)."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(round(seconds, 6))
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(rate_limiter.time, "sleep", fake.sleep)
+    return fake
+
+
+def test_burst_then_steady_rate(clock):
+    bucket = TokenBucket(rate=2.0, burst=2)
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert clock.slept == [0.5, 0.5]
+
+
+def test_tokens_refill_up_to_burst(clock):
+    bucket = TokenBucket(rate=1.0, burst=3)
+    for _ in range(3):
+        bucket.acquire()
+    clock.now += 100
+    for _ in range(3):
+        assert bucket.acquire() == 0
+    assert bucket.acquire() == pytest.approx(1.0)
+
+
+def test_throttle_halves_rate_and_blocks(clock):
+    bucket = TokenBucket(rate=4.0, burst=4)
+    assert bucket.feedback(200) is None
+    assert bucket.feedback(429) == 1.0          # Retry-After 없음 → BACKOFF_BASE
+    assert bucket.rate == 2.0
+    assert bucket.feedback(503) == 2.0          # 연속 실패 → 지수 백오프
+    assert bucket.rate == 1.0
+    assert bucket.acquire() == pytest.approx(2.0)
+    assert bucket.snapshot()["throttled"] == 2
+
+
+def test_retry_after_is_capped_for_waiting(clock):
+    bucket = TokenBucket(rate=1.0, burst=1)
+    assert bucket.feedback(429, retry_after=3600) == 3600
+    assert bucket.acquire() == pytest.approx(rate_limiter.BACKOFF_MAX)
+
+
+def test_rate_recovers_and_has_floor(clock):
+    bucket = TokenBucket(rate=16.0, burst=1)
+    for _ in range(10):
+        bucket.feedback(500)
+    assert bucket.rate == 16.0 * rate_limiter.MIN_RATE_RATIO
+    for _ in range(20):
+        bucket.feedback(200)
+    assert bucket.rate == 16.0
+
+
+def test_invalid_bucket():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, burst=1)
+
+
+def test_parse_retry_after(monkeypatch):
+    assert rate_limiter.parse_retry_after("12") == 12.0
+    assert rate_limiter.parse_retry_after("-3") == 0.0
+    assert rate_limiter.parse_retry_after(None) is None
+    assert rate_limiter.parse_retry_after("soon") is None
+    now = datetime(2026, 2, 1, 12, 0, tzinfo=timezone.utc)
+    monkeypatch.setattr(rate_limiter.time, "time", lambda: now.timestamp())
+    later = format_datetime(now + timedelta(seconds=30), usegmt=True)
+    assert rate_limiter.parse_retry_after(later) == pytest.approx(30.0)
+
+
+def test_env_limits_and_bucket_for(monkeypatch, capsys):
+    monkeypatch.setenv("HTTP_RATE_LIMITS", "example.test=0.5/3, other.test=4, bad.test=x/1")
+    monkeypatch.setattr(rate_limiter, "_buckets", {})
+    assert rate_limiter._env_limits() == {"example.test": (0.5, 3), "other.test": (4.0, 4)}
+    assert "형식 오류" in capsys.readouterr().out
+
+    bucket = rate_limiter.bucket_for("https://example.test/a?b=1")
+    assert (bucket.max_rate, bucket.burst) == (0.5, 3)
+    assert rate_limiter.bucket_for("https://example.test/other") is bucket
+    assert "example.test" in rate_limiter.snapshot()
@@ -0,0 +1,86 @@
+"""run_report: 단계 중첩, 작업 스레드 단계의 상위 단계, 요청 합산, 키워드별 집계."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import run_report
+from article import Article
+
+
+@pytest.fixture(autouse=True)
+def fresh_report():
+    run_report.reset()
+    yield
+    run_report.reset()
+
+
+def _stages():
+    return {r["name"]: r for r in run_report.to_dict()["stages"]}
+
+
+def test_nested_stage_credits_requests_to_all_parents():
+    with run_report.stage("naver.collect"):
+        with run_report.stage("naver.api") as st:
+            run_report.record_request("https://openapi.naver.com/v1/search/news.json", 0.1, 100, 200)
+            st["items"] = 3
+    stages = _stages()
+    assert stages["naver.api"]["parent"] == "naver.collect"
+    assert stages["naver.api"]["items"] == 3
+    assert stages["naver.collect"]["requests"] == stages["naver.api"]["requests"] == 1
+    assert stages["naver.collect"]["bytes"] == 100
+    assert run_report.to_dict()["hosts"]["openapi.naver.com"]["requests"] == 1
+
+
+def _worker(sid1):
+    with run_report.stage("naver.ranking", sid1=sid1):
+        run_report.record_request("https://news.naver.com/main/ranking/popularDay.naver", 0.01, 10, 200)
+        run_report.record_cache("test", True)
+    return sid1
+
+
+def test_bound_worker_stages_nest_under_submitting_stage():
+    with run_report.stage("naver.collect"):
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(run_report.bind(_worker), sid1) for sid1 in range(6)]
+        assert [f.result() for f in futures] == list(range(6))
+
+    report = run_report.to_dict()
+    workers = [r for r in report["stages"] if r["name"] == "naver.ranking"]
+    assert len(workers) == 6
+    assert {r["parent"] for r in workers} == {"naver.collect"}
+    collect = _stages()["naver.collect"]
+    assert collect["requests"] == 6
+    assert collect["bytes"] == 60
+    assert collect["cache_hits"] == 6
+    # 요약은 최상위 단계만: 작업 스레드 단계 시간을 중복 합산하지 않음
+    assert set(run_report.summary()["stages_s"]) == {"naver.collect"}
+
+
+def test_unbound_worker_stage_is_top_level():
+    with run_report.stage("naver.collect"):
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pool.submit(_worker, 1).result()
+    assert _stages()["naver.ranking"]["parent"] == ""
+    assert _stages()["naver.collect"]["requests"] == 0
+
+
+def test_worker_finishing_after_stage_closes_is_still_credited():
+    pool = ThreadPoolExecutor(max_workers=1)
+    with run_report.stage("google.collect"):
+        future = pool.submit(run_report.bind(run_report.record_request),
+                             "https://news.google.com/rss/articles/x", 0.01, 5, 200)
+    future.result()
+    pool.shutdown()
+    assert _stages()["google.collect"]["requests"] == 1
+
+
+def test_record_queries_counts_kept_items_per_keyword():
+    items = [
+        Article(title="a", url="u1", source="유튜브", queries=("폭락",)),
+        Article(title="b", url="u2", source="유튜브", queries=("폭락", "긴급")),
+        Article(title="c", url="u3", source="유튜브"),
+    ]
+    run_report.record_queries("youtube", items)
+    run_report.record_queries("youtube", items[:1])
+    assert run_report.to_dict()["queries"] == {"youtube": {"폭락": 3, "긴급": 1}}
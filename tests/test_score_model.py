@@ -0,0 +1,86 @@
+"""score_model: 해시 특징 CSR 행렬, 릿지 학습, 점수 계산, 저장·불러오기."""
+
+import numpy as np
+import pytest
+
+import score_model
+from score_model import ScoreModel, build_matrix, fit
+
+BITS = 12
+
+
+def _row(indptr, indices, i):
+    return sorted(indices[indptr[i]:indptr[i + 1]].tolist())
+
+
+def test_matrix_rows_match_single_title_builds():
+    titles = ["충격 폭로", "오늘의  날씨", "a"]
+    keywords = [["충격"], [], []]
+    indptr, indices = build_matrix(titles, keywords, BITS)
+    assert len(indptr) == len(titles) + 1
+    for i, (title, kws) in enumerate(zip(titles, keywords)):
+        single_ptr, single_idx = build_matrix([title], [kws], BITS)
+        assert _row(indptr, indices, i) == _row(single_ptr, single_idx, 0)  # 제목 경계를 넘는 n-gram 없음
+    assert indptr[3] - indptr[2] == 0  # 1글자 제목은 n-gram 없음
+
+
+def test_matrix_is_normalized_and_deduplicated():
+    ptr_a, idx_a = build_matrix(["AB  ab"], [[]], BITS)
+    ptr_b, idx_b = build_matrix(["ab ab"], [[]], BITS)
+    assert idx_a.tolist() == idx_b.tolist()
+    assert len(set(idx_a.tolist())) == len(idx_a)
+    assert idx_a.max() < (1 << BITS)
+
+
+def test_keyword_features_added():
+    plain_ptr, _ = build_matrix(["충격 폭로"], [[]], BITS)
+    kw_ptr, _ = build_matrix(["충격 폭로"], [["충격"]], BITS)
+    assert kw_ptr[1] > plain_ptr[1]
+
+
+def test_fit_learns_view_signal_and_scores():
+    titles, views = [], []
+    for i in range(40):
+        titles.append(f"충격 단독 {i}")
+        views.append(100_000)
+        titles.append(f"평범한 안내 {i}")
+        views.append(100)
+    model = fit(titles, [[] for _ in titles], views, bits=BITS)
+
+    assert model.bias == pytest.approx(np.mean(np.log1p(views)))
+    assert model.meta["samples"] == 80
+    assert model.meta["rmse"] < 0.5
+    hot, cold = model.predict(["충격 단독 소식", "평범한 안내 사항"], [[], []])
+    assert hot > model.bias > cold
+    assert model.score(["충격 단독 소식", "평범한 안내 사항"], [[], []])[1] == 0.0
+    assert model.score(["충격 단독 소식"], [[]])[0] > 0
+    assert model.predict([], []).size == 0
+
+
+def test_save_load_round_trip(tmp_path):
+    model = fit(["가나다", "라마바"], [[], []], [10, 1000], bits=BITS)
+    path = model.save(str(tmp_path / "m" / "score_model.npz"))
+    loaded = ScoreModel.load(path)
+    assert loaded.bits == BITS
+    assert loaded.bias == pytest.approx(model.bias)
+    assert loaded.meta == model.meta
+    np.testing.assert_allclose(
+        loaded.predict(["가나다"], [[]]), model.predict(["가나다"], [[]]), rtol=1e-5,
+    )
+
+
+def test_get_model_without_file_is_none(tmp_path, monkeypatch):
+    monkeypatch.setattr(score_model, "default_model_path", lambda: str(tmp_path / "none.npz"))
+    monkeypatch.setattr(score_model, "_model", None)
+    monkeypatch.setattr(score_model, "_model_loaded", False)
+    assert score_model.get_model() is None
+
+
+def test_get_model_warns_on_broken_file(tmp_path, monkeypatch, capsys):
+    path = tmp_path / "broken.npz"
+    path.write_bytes(b"not a model")
+    monkeypatch.setattr(score_model, "default_model_path", lambda: str(path))
+    monkeypatch.setattr(score_model, "_model", None)
+    monkeypatch.setattr(score_model, "_model_loaded", False)
+    assert score_model.get_model() is None
+    assert "[경고]" in capsys.readouterr().out
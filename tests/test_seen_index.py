@@ -0,0 +1,114 @@
+"""SeenIndex: 저장·재로드, TTL 만료, 크기 제한, 손상된 파일 복구."""
+
+import os
+import time
+
+import seen_index
+from seen_index import SeenIndex
+
+A = "https://n.news.naver.com/article/001/0000000001"
+B = "https://n.news.naver.com/article/001/0000000002"
+C = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+
+def _path(tmp_path):
+    return str(tmp_path / "seen_index.bin")
+
+
+def test_round_trip(tmp_path):
+    index = SeenIndex(_path(tmp_path))
+    assert index.mark([A, C]) == 2
+    index.save()
+
+    loaded = SeenIndex(_path(tmp_path))
+    assert A in loaded and C in loaded
+    assert B not in loaded
+    assert len(loaded) == 2
+
+
+def test_lookup_uses_canonical_form(tmp_path):
+    index = SeenIndex(_path(tmp_path))
+    index.mark([A + "?ntype=RANKING"])
+    assert A in index
+    assert "https://m.news.naver.com/article/001/0000000001" in index
+    assert "https://youtu.be/dQw4w9WgXcQ" not in index
+
+
+def test_file_layout_is_sorted_fixed_records(tmp_path):
+    index = SeenIndex(_path(tmp_path))
+    index.mark([A, B, C])
+    index.save()
+    with open(_path(tmp_path), "rb") as f:
+        data = f.read()
+    assert data.startswith(seen_index._MAGIC)
+    body = data[len(seen_index._MAGIC):]
+    assert len(body) == 3 * seen_index._RECORD.size
+    hashes = [h for h, _ in seen_index._RECORD.iter_unpack(body)]
+    assert hashes == sorted(hashes)
+
+
+def test_expired_entries_are_hidden_and_dropped_on_save(tmp_path, monkeypatch):
+    index = SeenIndex(_path(tmp_path), ttl_days=1)
+    index.mark([A])
+    now = time.time()
+    monkeypatch.setattr(seen_index.time, "time", lambda: now + 2 * 86400)
+    assert A not in index
+    index.mark([B])
+    index.save()
+
+    loaded = SeenIndex(_path(tmp_path), ttl_days=1)
+    assert len(loaded) == 1
+    assert B in loaded
+
+
+def test_save_keeps_newest_max_entries(tmp_path, monkeypatch):
+    index = SeenIndex(_path(tmp_path), max_entries=2)
+    now = time.time()
+    for offset, url in enumerate([A, B, C]):
+        monkeypatch.setattr(seen_index.time, "time", lambda t=now + offset: t)
+        index.mark([url])
+    index.save()
+
+    loaded = SeenIndex(_path(tmp_path), max_entries=2)
+    assert len(loaded) == 2
+    assert A not in loaded
+    assert B in loaded and C in loaded
+
+
+def test_save_without_changes_does_not_write(tmp_path):
+    index = SeenIndex(_path(tmp_path))
+    assert A not in index
+    index.save()
+    assert not os.path.exists(_path(tmp_path))
+
+
+def test_empty_urls_are_ignored(tmp_path):
+    index = SeenIndex(_path(tmp_path))
+    assert index.mark(["", "   "]) == 0
+    assert "" not in index
+
+
+def test_corrupt_header_starts_fresh(tmp_path, capsys):
+    with open(_path(tmp_path), "wb") as f:
+        f.write(b"NOTSEEN\n" + b"\x00" * seen_index._RECORD.size)
+    index = SeenIndex(_path(tmp_path))
+    assert A not in index
+    assert "형식 오류" in capsys.readouterr().out
+
+    index.mark([A])
+    index.save()
+    assert A in SeenIndex(_path(tmp_path))
+
+
+def test_truncated_body_starts_fresh(tmp_path, capsys):
+    index = SeenIndex(_path(tmp_path))
+    index.mark([A, B])
+    index.save()
+    with open(_path(tmp_path), "rb") as f:
+        data = f.read()
+    with open(_path(tmp_path), "wb") as f:
+        f.write(data[:-3])
+
+    loaded = SeenIndex(_path(tmp_path))
+    assert len(loaded) == 0
+    assert "형식 오류" in capsys.readouterr().out
@@ -0,0 +1,74 @@
+"""rescore.TitleIndex: 키워드 → 행 번호 (행 경계, 마지막 행, 캐시) 및 사전 비교."""
+
+import pytest
+
+from rescore import TitleIndex, changed_keywords
+
+TITLES = [
+    "폭락 시작",       # 0: 키워드가 맨 앞
+    "증시 대폭락",     # 1: 키워드가 맨 끝
+    "",                # 2: 빈 제목
+    "폭락 또 폭락",    # 3: 한 행에 두 번
+    "안정세",          # 4
+    "마지막 폭락",     # 5: 마지막 행
+]
+
+
+def brute_force(titles, keyword):
+    return {i for i, t in enumerate(titles) if isinstance(t, str) and keyword in t}
+
+
+def test_rows_containing_matches_brute_force():
+    index = TitleIndex(TITLES)
+    for keyword in ["폭락", "락 시", "안정세", "마지막", "증시", "없음"]:
+        assert index.rows_containing(keyword) == brute_force(TITLES, keyword)
+
+
+def test_keyword_does_not_match_across_row_boundary():
+    # "시작" + "증시" 사이 줄바꿈을 넘어 "작증"이 매칭되면 안 됨
+    index = TitleIndex(["시작", "증시"])
+    assert index.rows_containing("작증") == set()
+    assert index.rows_containing("시") == {0, 1}
+
+
+def test_first_and_last_rows():
+    index = TitleIndex(["끝", "가운데", "끝"])
+    assert index.rows_containing("끝") == {0, 2}
+
+
+def test_single_row_and_empty_index():
+    assert TitleIndex(["유일한 제목"]).rows_containing("제목") == {0}
+    assert TitleIndex([]).rows_containing("제목") == set()
+
+
+def test_newlines_and_non_strings_in_titles():
+    titles = ["첫 줄\n둘째 줄", None, float("nan"), "셋째"]
+    index = TitleIndex(titles)
+    assert index.rows_containing("둘째") == {0}
+    assert index.rows_containing("셋째") == {3}
+    assert index.rows_containing("줄 둘") == {0}  # 제목 안의 줄바꿈은 공백으로
+
+
+def test_invalid_keywords():
+    index = TitleIndex(TITLES)
+    assert index.rows_containing("") == set()
+    assert index.rows_containing("폭락\n증시") == set()
+
+
+def test_results_are_cached_and_union():
+    index = TitleIndex(TITLES)
+    first = index.rows_containing("폭락")
+    assert index.rows_containing("폭락") is first
+    assert index.rows_affected(["증시", "안정세"]) == {1, 4}
+
+
+@pytest.mark.parametrize("old, new, expected", [
+    ({"T1": {"keywords": ["a", "b"], "weight": 3}}, {"T1": {"keywords": ["a", "b"], "weight": 3}}, []),
+    ({"T1": {"keywords": ["a"], "weight": 3}}, {"T1": {"keywords": ["a", "c"], "weight": 3}}, ["c"]),
+    ({"T1": {"keywords": ["a", "b"], "weight": 3}}, {"T1": {"keywords": ["a"], "weight": 3}}, ["b"]),
+    ({"T1": {"keywords": ["a"], "weight": 3}, "T2": {"keywords": [], "weight": 2}},
+     {"T1": {"keywords": [], "weight": 3}, "T2": {"keywords": ["a"], "weight": 2}}, ["a"]),
+    ({"T1": {"keywords": ["a", "b"], "weight": 3}}, {"T1": {"keywords": ["a", "b"], "weight": 2}}, ["a", "b"]),
+])
+def test_changed_keywords(old, new, expected):
+    assert changed_keywords(old, new) == expected
@@ -0,0 +1,84 @@
+"""url_canon: 표준 URL 규칙, 중복 판정 키, SeenSet."""
+
+import pytest
+
+from article import Article
+from url_canon import SeenSet, canonical_url, item_url, naver_article_id, url_key, youtube_video_id
+
+NAVER = "https://n.news.naver.com/article/001/0014000000"
+YOUTUBE = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+
+@pytest.mark.parametrize("url, expected", [
+    # 네이버 기사: 랭킹·모바일·구형 주소 → 언론사/기사 ID 표준 주소
+    ("https://n.news.naver.com/article/001/0014000000?ntype=RANKING", NAVER),
+    ("https://n.news.naver.com/mnews/article/001/0014000000?sid=100", NAVER),
+    ("https://m.news.naver.com/article/001/0014000000", NAVER),
+    ("https://news.naver.com/main/read.naver?mode=LSD&oid=001&aid=0014000000", NAVER),
+    ("https://news.naver.com/main/read.nhn?oid=1&aid=14000000", NAVER),
+    # 유튜브: youtu.be / shorts / embed / 모바일 / 추가 파라미터 → watch?v=ID
+    ("https://youtu.be/dQw4w9WgXcQ?si=abc", YOUTUBE),
+    ("https://www.youtube.com/shorts/dQw4w9WgXcQ", YOUTUBE),
+    ("https://www.youtube.com/embed/dQw4w9WgXcQ", YOUTUBE),
+    ("https://m.youtube.com/watch?v=dQw4w9WgXcQ&feature=share&t=30", YOUTUBE),
+    # 그 외: 추적 파라미터·fragment 제거, 나머지 파라미터 정렬, 기본 포트 제거
+    ("https://www.example.com/news/1?utm_source=x&utm_medium=y&id=7#top", "https://www.example.com/news/1?id=7"),
+    ("https://example.com/a?b=2&fbclid=z&a=1", "https://example.com/a?a=1&b=2"),
+    ("https://Example.COM:443/a?gclid=1", "https://example.com/a"),
+    ("http://example.com:8080/a", "http://example.com:8080/a"),
+    ("https://example.com", "https://example.com/"),
+    # 구글 뉴스 리다이렉트 링크는 그대로, 빈 값은 ""
+    ("https://news.google.com/rss/articles/CBMiXX?oc=5", "https://news.google.com/rss/articles/CBMiXX?oc=5"),
+    ("", ""),
+    ("   ", ""),
+])
+def test_canonical_url(url, expected):
+    assert canonical_url(url) == expected
+
+
+def test_naver_article_id_only_for_naver_hosts():
+    assert naver_article_id("https://example.com/article/001/0014000000") == ""
+    assert naver_article_id("https://n.news.naver.com/article/001/0014000000") == "001/0014000000"
+
+
+def test_youtube_video_id_rejects_malformed_ids():
+    assert youtube_video_id("https://youtu.be/short") == ""
+    assert youtube_video_id("https://www.youtube.com/channel/UC123") == ""
+    assert youtube_video_id("https://youtu.be/dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+
+
+@pytest.mark.parametrize("a, b", [
+    ("http://www.example.com/a/", "https://example.com/a"),
+    ("https://m.example.com/a?utm_source=x", "https://example.com/a"),
+    ("https://youtu.be/dQw4w9WgXcQ", YOUTUBE),
+    ("https://n.news.naver.com/article/001/0014000000?ntype=RANKING",
+     "https://news.naver.com/main/read.naver?oid=001&aid=0014000000"),
+])
+def test_url_key_ignores_scheme_host_prefix_and_tracking(a, b):
+    assert url_key(a) == url_key(b)
+
+
+def test_url_key_keeps_meaningful_query():
+    assert url_key("https://example.com/a?id=1") != url_key("https://example.com/a?id=2")
+
+
+def test_item_url_for_article_and_rows():
+    assert item_url(Article(title="t", url=YOUTUBE, source="유튜브")) == YOUTUBE
+    assert item_url({"유튜브_URL": "", "뉴스기사_URL": NAVER}) == NAVER
+    assert item_url({"url": "https://example.com/"}) == "https://example.com/"
+    assert item_url({}) == ""
+
+
+def test_seen_set_filters_duplicates_across_forms():
+    seen = SeenSet(["https://youtu.be/dQw4w9WgXcQ"])
+    items = [
+        {"유튜브_URL": YOUTUBE},
+        {"뉴스기사_URL": "https://n.news.naver.com/article/001/0014000000?ntype=RANKING"},
+        {"뉴스기사_URL": "https://m.news.naver.com/article/001/0014000000"},
+        {"제목": "URL 없음"},
+        {"제목": "URL 없음 2"},
+    ]
+    kept = seen.filter(items)
+    assert kept == [items[1], items[3], items[4]]
+    assert NAVER in seen
+    assert len(seen) == 2
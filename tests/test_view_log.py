@@ -0,0 +1,88 @@
+"""view_log: 바이너리 스냅샷 로그 추가·읽기, 시간당 조회수, 잘린 레코드 복구, 정리."""
+
+import os
+
+import pytest
+
+import view_log
+from article import Article
+
+A = "dQw4w9WgXcQ"
+B = "9bZkp7q19f0"
+HOUR = 3600
+T0 = 1_770_000_000
+
+
+def _path(tmp_path):
+    return str(tmp_path / "youtube_views.bin")
+
+
+@pytest.mark.parametrize("url, expected", [
+    (f"https://www.youtube.com/watch?v={A}", A),
+    (f"https://youtu.be/{A}?si=x", A),
+    (f"https://www.youtube.com/shorts/{A}", A),
+    ("https://n.news.naver.com/article/001/0000000001", ""),
+    ("", ""),
+])
+def test_video_id_from_url(url, expected):
+    assert view_log.video_id_from_url(url) == expected
+
+
+def test_append_and_load_fixed_records(tmp_path):
+    path = _path(tmp_path)
+    assert view_log.append_snapshots([(A, 100), (B, 5), ("short", 1), (A, "x")], ts=T0, path=path) == 2
+    assert os.path.getsize(path) == 2 * view_log.RECORD.size
+    data = view_log.load_snapshots(path)
+    assert [(r["video_id"].decode(), int(r["ts"]), int(r["views"])) for r in data] == [(A, T0, 100), (B, T0, 5)]
+
+
+def test_missing_log_is_empty(tmp_path):
+    assert view_log.load_snapshots(_path(tmp_path)).size == 0
+    assert view_log.velocities([A], path=_path(tmp_path)) == {}
+
+
+def test_velocity_uses_nearest_snapshot_at_least_min_interval_apart(tmp_path):
+    path = _path(tmp_path)
+    view_log.append_snapshots([(A, 1_000)], ts=T0, path=path)
+    view_log.append_snapshots([(A, 2_000), (B, 50)], ts=T0 + 2 * HOUR, path=path)
+    view_log.append_snapshots([(A, 4_000)], ts=T0 + 3 * HOUR + 1800, path=path)  # 최신과 1시간 미만 간격
+    view_log.append_snapshots([(A, 5_000)], ts=T0 + 4 * HOUR, path=path)
+    # 최신(5,000) ↔ 2시간 전(2,000)
+    assert view_log.velocities([A, B], path=path) == {A: 1_500.0}
+    assert view_log.history_for([B], path=path) == {B: [(T0 + 2 * HOUR, 50)]}
+
+
+def test_truncated_record_is_dropped_on_next_append(tmp_path):
+    path = _path(tmp_path)
+    view_log.append_snapshots([(A, 1)], ts=T0, path=path)
+    with open(path, "ab") as f:
+        f.write(b"\x01\x02\x03")
+    view_log.append_snapshots([(B, 2)], ts=T0 + 1, path=path)
+    assert os.path.getsize(path) == 2 * view_log.RECORD.size
+    assert [r["video_id"].decode() for r in view_log.load_snapshots(path)] == [A, B]
+
+
+def test_track_views_fills_velocity_for_youtube_only(tmp_path, monkeypatch):
+    path = _path(tmp_path)
+    view_log.append_snapshots([(A, 1_000)], ts=T0, path=path)
+    monkeypatch.setattr(view_log.time, "time", lambda: T0 + 10 * HOUR)
+    video = Article(title="v", url=f"https://www.youtube.com/watch?v={A}", source="유튜브", views=2_000)
+    fresh = Article(title="w", url=f"https://youtu.be/{B}", source="유튜브", views=10)
+    news = Article(title="n", url="https://n.news.naver.com/article/001/0000000001", source="네이버뉴스")
+
+    assert view_log.track_views([video, fresh, news], path=path) == 2
+    assert video.velocity == 100.0
+    assert fresh.velocity == ""
+
+
+def test_compact_drops_old_snapshots_but_keeps_latest_per_video(tmp_path, monkeypatch):
+    path = _path(tmp_path)
+    day = 86400
+    view_log.append_snapshots([(A, 1), (B, 1)], ts=T0, path=path)
+    view_log.append_snapshots([(A, 2)], ts=T0 + 50 * day, path=path)
+    view_log.append_snapshots([(A, 3)], ts=T0 + 100 * day, path=path)
+    monkeypatch.setattr(view_log.time, "time", lambda: T0 + 100 * day)
+
+    assert view_log.compact(max_age_days=90, path=path) == 3
+    kept = sorted((r["video_id"].decode(), int(r["views"])) for r in view_log.load_snapshots(path))
+    assert kept == sorted([(A, 2), (A, 3), (B, 1)])
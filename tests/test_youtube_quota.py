@@ -0,0 +1,128 @@
+"""youtube_quota: 태평양 시간 기준 날짜·초기화, 키 순환·소진, 사용량 저장, 환경 변수 키 목록."""
+
+import json
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+import requests
+
+import http_client
+import youtube_quota
+from circuit_breaker import FatalSourceError
+from youtube_quota import KeyPool, quota_day
+
+
+def _utc(text):
+    return datetime.fromisoformat(text).replace(tzinfo=timezone.utc)
+
+
+def test_quota_day_resets_at_pacific_midnight():
+    # 표준시(UTC−8): 08:00Z 전은 태평양 시간으로 전날
+    assert quota_day(_utc("2026-03-02T07:59:00")) == "2026-03-01"
+    assert quota_day(_utc("2026-03-02T08:00:00")) == "2026-03-02"
+
+
+@pytest.mark.skipif(not isinstance(youtube_quota.PACIFIC, ZoneInfo), reason="tzdata 없음: 서머타임 미적용")
+def test_quota_day_follows_daylight_saving():
+    # 서머타임(UTC−7): 07:00Z에 초기화
+    assert quota_day(_utc("2026-07-02T06:59:00")) == "2026-07-01"
+    assert quota_day(_utc("2026-07-02T07:00:00")) == "2026-07-02"
+
+
+@pytest.fixture
+def day(monkeypatch):
+    """quota_day를 바꿀 수 있는 값으로 고정."""
+    current = {"day": "2026-03-01"}
+    monkeypatch.setattr(youtube_quota, "quota_day", lambda now=None: current["day"])
+    return current
+
+
+def _path(tmp_path):
+    return str(tmp_path / "youtube_quota.json")
+
+
+def test_no_keys_is_fatal(tmp_path):
+    with pytest.raises(FatalSourceError):
+        KeyPool([], _path(tmp_path))
+
+
+def test_acquire_rotates_to_next_key_when_quota_runs_low(tmp_path, day):
+    pool = KeyPool(["k1", "k2"], _path(tmp_path), daily_quota=250)
+    assert [pool.acquire("search") for _ in range(2)] == ["k1", "k1"]
+    assert pool.acquire("videos") == "k1"           # 50 남음 → videos(1)은 가능
+    assert pool.acquire("search") == "k2"           # 49 남음 → search(100)은 다음 키
+    pool.mark_exhausted("k2")
+    assert pool.remaining("k2") == 0
+    with pytest.raises(FatalSourceError):
+        pool.acquire("search")
+    assert pool.summary() == {"keys": 2, "used": 201 + 100, "remaining": 49}
+
+
+def test_usage_resets_when_pacific_day_changes(tmp_path, day):
+    pool = KeyPool(["k1"], _path(tmp_path), daily_quota=100)
+    pool.acquire("search")
+    pool.mark_exhausted("k1")
+    with pytest.raises(FatalSourceError):
+        pool.acquire("videos")
+
+    day["day"] = "2026-03-02"
+    assert pool.remaining("k1") == 100
+    assert pool.acquire("search") == "k1"
+
+
+def test_save_and_load_same_day_only(tmp_path, day):
+    path = _path(tmp_path)
+    pool = KeyPool(["secret-key"], path)
+    pool.acquire("search")
+    pool.save()
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    assert data == {"day": "2026-03-01", "keys": {youtube_quota.key_id("secret-key"): {"used": 100, "exhausted": False}}}
+    assert "secret-key" not in json.dumps(data)
+
+    assert KeyPool(["secret-key"], path).summary()["used"] == 100
+    day["day"] = "2026-03-02"
+    assert KeyPool(["secret-key"], path).summary()["used"] == 0
+
+
+def test_replay_neither_loads_nor_saves(tmp_path, day):
+    path = _path(tmp_path)
+    pool = KeyPool(["k1"], path)
+    pool.acquire("search")
+    pool.save()
+    try:
+        http_client.configure_cassette("replay", str(tmp_path / "cassettes"))
+        replay_pool = KeyPool(["k1"], path)
+        assert replay_pool.summary()["used"] == 0
+        replay_pool.acquire("search")
+        replay_pool.mark_exhausted("k1")
+    finally:
+        http_client.configure_cassette(None)
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["keys"][youtube_quota.key_id("k1")] == {"used": 100, "exhausted": False}
+
+
+def test_keys_from_env_dedupes_in_order(monkeypatch):
+    monkeypatch.setenv("YOUTUBE_API_KEYS", "a, b\nc,a")
+    monkeypatch.setenv("YOUTUBE_API_KEY", "b")
+    assert youtube_quota.keys_from_env() == ["a", "b", "c"]
+
+
+def _response(status, body):
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = json.dumps(body).encode("utf-8") if body is not None else b"not json"
+    return resp
+
+
+@pytest.mark.parametrize("status, body, expected", [
+    (403, {"error": {"errors": [{"reason": "quotaExceeded"}]}}, True),
+    (403, {"error": {"errors": [{"reason": "dailyLimitExceeded"}]}}, True),
+    (403, {"error": {"errors": [{"reason": "forbidden"}]}}, False),
+    (403, None, False),
+    (400, {"error": {"errors": [{"reason": "quotaExceeded"}]}}, False),
+])
+def test_is_quota_error(status, body, expected):
+    assert youtube_quota.is_quota_error(_response(status, body)) is expected
+    assert youtube_quota.is_quota_error(None) is False